@@ -7,108 +7,435 @@ Usage:
     python create_chart.py bar --title "월별 매출" --labels "1월,2월,3월" --values "1000,1500,2000" --output chart.png
     python create_chart.py pie --title "비용 구조" --labels "인건비,재료비,임대료,기타" --values "40,30,20,10" --output costs.png
     python create_chart.py line --title "매출 추이" --labels "1월,2월,3월,4월" --values "1000,1200,1800,2500" --output trend.png
+    python create_chart.py bar --title "월별 매출" --labels "1월,2월,3월" --values "1000,1500,2000" --format svg --output chart.svg
+    python create_chart.py line --title "일별 매출" --csv daily.csv --value-column revenue --output daily.png
+    python create_chart.py batch charts.json --jobs 4
+
+--format svg draws the chart as plain SVG without matplotlib (much faster;
+text uses the viewer's fonts).
+
+--csv reads labels (first column) and values (--value-column, default the
+second column) from a CSV file instead of --labels/--values. Line charts
+longer than --max-points (default 500) are downsampled with LTTB
+(largest-triangle-three-buckets, keeping the extremes), and beyond 30
+points only the first, last, highest and lowest values are labelled.
+
+Batch spec (JSON, or YAML with PyYAML installed): a list of charts, or
+{"charts": [...]}, each with the single-chart arguments:
+    [{"type": "bar", "title": "월별 매출", "labels": ["1월", "2월"], "values": [1000, 1500],
+      "output": "output/charts/sales.png", "ylabel": "금액 (만원)", "format": "png"}]
+labels/values may also be comma-separated strings as on the command line;
+"csv", "value_column" and "max_points" match --csv, --value-column and
+--max-points.
 """
 
 import argparse
+import csv
+import json
+import os
 import sys
+import time
+from pathlib import Path
+
+# Shared chart helpers live in .agent/skills/scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "scripts"))
+import _raster
+import _svg
 
-try:
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    import matplotlib.font_manager as fm
-except ImportError:
-    print("Error: matplotlib is required. Install with: pip install matplotlib")
-    sys.exit(1)
+CHART_TYPES = ("bar", "pie", "line")
+FORMATS = ("png", "svg")
+# Line charts: points kept after downsampling, and the length beyond which
+# only key points (ends and extremes) get value labels
+MAX_LINE_POINTS = 500
+LABEL_ALL_POINTS = 30
+LINE_TICKS = 10
+DEFAULT_YLABEL = "금액 (만원)"
+
+COLORS = _svg.COLORS
+
+_font_configured = False
+# One renderer per batch process (the main process or a pool worker)
+_batch_renderer = None
 
 
-# Configure Korean font support
 def setup_korean_font():
-    """Try to set up Korean font"""
-    korean_fonts = ['AppleGothic', 'NanumGothic', 'Malgun Gothic', 'NanumBarunGothic']
-    for font_name in korean_fonts:
-        try:
-            fm.findfont(font_name, fallback_to_default=False)
-            plt.rcParams['font.family'] = font_name
-            plt.rcParams['axes.unicode_minus'] = False
-            return
-        except Exception as e:
-            import warnings
-            warnings.warn(f"Font setup failed: {e}")
-            continue
-    print("Warning: Korean font not found. Text may not display correctly.")
-
-
-def create_bar_chart(title, labels, values, output, ylabel="금액 (만원)"):
-    setup_korean_font()
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = ['#4285F4', '#EA4335', '#FBBC05', '#34A853', '#FF6D01', '#46BDC6']
-    bars = ax.bar(labels, values, color=colors[:len(labels)])
-    ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
-    ax.set_ylabel(ylabel)
-    for bar, val in zip(bars, values):
-        ax.text(bar.get_x() + bar.get_width()/2., bar.get_height(),
-                f'{val:,.0f}', ha='center', va='bottom', fontweight='bold')
-    plt.tight_layout()
-    plt.savefig(output, dpi=150, bbox_inches='tight')
-    print(f"Chart saved: {output}")
+    """Load matplotlib with the Korean font (once per process); returns the _raster namespace"""
+    global _font_configured
+    try:
+        mpl = _raster.load()
+    except ImportError:
+        raise ImportError(f"matplotlib is required for PNG charts. Install with: {_raster.INSTALL_HINT} "
+                          "(or use --format svg)")
+    if not _font_configured:
+        _font_configured = True
+        if mpl.font is None:
+            print("Warning: Korean font not found. Text may not display correctly.")
+    return mpl
+
+
+class ChartRenderer:
+    """Draws charts on one reusable matplotlib Figure, without pyplot.
+
+    The Figure is created on the first chart and cleared and resized for
+    each following one, so a renderer can draw any number of charts in one
+    process without accumulating figures or pyplot state. close() (or
+    leaving a `with` block) releases it.
+    """
+
+    def __init__(self):
+        self.figure = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.figure is not None:
+            self.figure.clear()
+            self.figure = None
+
+    def _axes(self, figsize):
+        if self.figure is None:
+            mpl = setup_korean_font()
+            self.figure = mpl.Figure(figsize=figsize)
+            mpl.FigureCanvasAgg(self.figure)
+        else:
+            self.figure.clear()
+            self.figure.set_size_inches(figsize)
+        return self.figure.add_subplot()
+
+    def _save(self, output):
+        _raster.save(self.figure, output)
+
+    def bar(self, title, labels, values, output, ylabel=DEFAULT_YLABEL):
+        ax = self._axes((10, 6))
+        bars = ax.bar(labels, values, color=COLORS[:len(labels)])
+        ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+        ax.set_ylabel(ylabel)
+        for bar, val in zip(bars, values):
+            ax.text(bar.get_x() + bar.get_width()/2., bar.get_height(),
+                    f'{val:,.0f}', ha='center', va='bottom', fontweight='bold')
+        self._save(output)
+
+    def pie(self, title, labels, values, output):
+        ax = self._axes((8, 8))
+        ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90,
+               colors=COLORS[:len(labels)], textprops={'fontsize': 12})
+        ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+        self._save(output)
+
+    def line(self, title, labels, values, output, ylabel=DEFAULT_YLABEL, positions=None, annotate=None,
+             ticks=None):
+        """Line chart; positions/annotate/ticks as returned by reduce_line for long series."""
+        ax = self._axes((10, 6))
+        if positions is None:
+            ax.plot(labels, values, 'o-', color=COLORS[0], linewidth=2, markersize=8)
+            ax.fill_between(range(len(labels)), values, alpha=0.1, color=COLORS[0])
+            positions, annotate = range(len(values)), range(len(values))
+        else:
+            ax.plot(positions, values, '-', color=COLORS[0], linewidth=2)
+            ax.plot([positions[i] for i in annotate], [values[i] for i in annotate], 'o',
+                    color=COLORS[0], markersize=8)
+            ax.fill_between(positions, values, alpha=0.1, color=COLORS[0])
+            ax.set_xticks([x for x, _ in ticks], [label for _, label in ticks])
+        ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+        ax.set_ylabel(ylabel)
+        ax.grid(True, alpha=0.3)
+        for i in annotate:
+            ax.annotate(f'{values[i]:,.0f}', (positions[i], values[i]), textcoords="offset points",
+                        xytext=(0, 10), ha='center', fontweight='bold')
+        self._save(output)
+
+
+def create_bar_chart(title, labels, values, output, ylabel=DEFAULT_YLABEL):
+    with ChartRenderer() as renderer:
+        renderer.bar(title, labels, values, output, ylabel)
 
 
 def create_pie_chart(title, labels, values, output):
-    setup_korean_font()
-    fig, ax = plt.subplots(figsize=(8, 8))
-    colors = ['#4285F4', '#EA4335', '#FBBC05', '#34A853', '#FF6D01', '#46BDC6']
-    ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90,
-           colors=colors[:len(labels)], textprops={'fontsize': 12})
-    ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
-    plt.tight_layout()
-    plt.savefig(output, dpi=150, bbox_inches='tight')
-    print(f"Chart saved: {output}")
-
-
-def create_line_chart(title, labels, values, output, ylabel="금액 (만원)"):
-    setup_korean_font()
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(labels, values, 'o-', color='#4285F4', linewidth=2, markersize=8)
-    ax.fill_between(range(len(labels)), values, alpha=0.1, color='#4285F4')
-    ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
-    ax.set_ylabel(ylabel)
-    ax.grid(True, alpha=0.3)
-    for i, val in enumerate(values):
-        ax.annotate(f'{val:,.0f}', (i, val), textcoords="offset points",
-                    xytext=(0, 10), ha='center', fontweight='bold')
-    plt.tight_layout()
-    plt.savefig(output, dpi=150, bbox_inches='tight')
-    print(f"Chart saved: {output}")
+    with ChartRenderer() as renderer:
+        renderer.pie(title, labels, values, output)
+
+
+def create_line_chart(title, labels, values, output, ylabel=DEFAULT_YLABEL):
+    with ChartRenderer() as renderer:
+        renderer.line(title, labels, values, output, ylabel)
+
+
+def lttb(values, threshold):
+    """Indexes of `threshold` points that keep a series' shape (largest-triangle-three-buckets).
+
+    The first and last points are always kept; each bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket. x is the point's index.
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = (end + next_end - 1) / 2
+        avg_y = sum(values[end:next_end]) / (next_end - end)
+        ax, ay = a, values[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+def reduce_line(labels, values, max_points=MAX_LINE_POINTS):
+    """Prepare a long series for a line chart.
+
+    Downsamples to max_points with lttb (the overall highest and lowest
+    points are always kept) and picks the points to label: highest, lowest,
+    first and last, skipping any within 2% of the series of a label
+    already placed.
+
+    Returns:
+        dict of positions (original index of each kept point), values,
+        annotate (indexes into the kept points) and ticks ((position,
+        label) pairs, at most LINE_TICKS, spread over the series)
+    """
+    n = len(values)
+    high = max(range(n), key=values.__getitem__)
+    low = min(range(n), key=values.__getitem__)
+    kept = sorted(set(lttb(values, max_points)) | {high, low})
+    index = {position: i for i, position in enumerate(kept)}
+    # Extremes first; an end point right next to an already labelled point is skipped
+    labelled = []
+    for position in (high, low, 0, n - 1):
+        if all(abs(position - other) > n / 50 for other in labelled):
+            labelled.append(position)
+    tick_count = min(LINE_TICKS, n)
+    tick_positions = sorted({round(k * (n - 1) / max(tick_count - 1, 1)) for k in range(tick_count)})
+    return {
+        "positions": kept,
+        "values": [values[i] for i in kept],
+        "annotate": sorted(index[position] for position in labelled),
+        "ticks": [(i, labels[i]) for i in tick_positions],
+    }
+
+
+def read_series_csv(path, value_column=None):
+    """Read (labels, values) from a CSV file with a header row.
+
+    Labels come from the first column and values from value_column (default:
+    the second column); rows with an empty value are skipped.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header or len(header) < 2:
+            raise ValueError(f"{path}: expected a header row with at least two columns")
+        if value_column is None:
+            column = 1
+        elif value_column in header:
+            column = header.index(value_column)
+        else:
+            raise ValueError(f"{path}: no column '{value_column}' (columns: {', '.join(header)})")
+        labels, values = [], []
+        for line, row in enumerate(reader, 2):
+            if len(row) <= column or not row[column].strip():
+                continue
+            try:
+                values.append(float(row[column].replace(",", "")))
+            except ValueError:
+                raise ValueError(f"{path}: line {line}: invalid value '{row[column]}'")
+            labels.append(row[0])
+    if not values:
+        raise ValueError(f"{path}: no values")
+    return labels, values
+
+
+def _split(value):
+    """List from a spec/CLI value: a list or a comma-separated string."""
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(",")]
+    return list(value)
+
+
+def render_chart(spec, renderer=None):
+    """Render one chart from a spec dict.
+
+    Keys: type, title, output, and labels + values or csv[, value_column];
+    optional ylabel, format, max_points (line charts).
+
+    format "svg" writes a standard-library SVG; otherwise the PNG is drawn
+    on renderer, a ChartRenderer reused across calls (a temporary one is
+    used when omitted).
+    """
+    chart_type = spec.get("type")
+    if chart_type not in CHART_TYPES:
+        raise ValueError(f"Unknown chart type '{chart_type}' (use {', '.join(CHART_TYPES)})")
+    source = ("csv",) if spec.get("csv") else ("labels", "values")
+    for key in ("title", *source, "output"):
+        if spec.get(key) in (None, ""):
+            raise ValueError(f"Missing '{key}'")
+    if spec.get("csv"):
+        labels, values = read_series_csv(spec["csv"], spec.get("value_column"))
+    else:
+        labels = [str(label) for label in _split(spec["labels"])]
+        values = [float(v) for v in _split(spec["values"])]
+    if len(labels) != len(values):
+        raise ValueError(f"{len(labels)} labels but {len(values)} values")
+    line_options = {}
+    if chart_type == "line" and len(values) > LABEL_ALL_POINTS:
+        line_options = reduce_line(labels, values, int(spec.get("max_points") or MAX_LINE_POINTS))
+        values = line_options.pop("values")
+        labels = [labels[i] for i in line_options["positions"]]
+    output = spec["output"]
+    fmt = spec.get("format", "png")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}' (use {', '.join(FORMATS)})")
+    if fmt == "svg":
+        if chart_type == "pie":
+            svg = _svg.pie_chart(spec["title"], labels, values)
+        elif chart_type == "bar":
+            svg = _svg.bar_chart(spec["title"], labels, values, spec.get("ylabel", DEFAULT_YLABEL))
+        else:
+            svg = _svg.line_chart(spec["title"], labels, values, spec.get("ylabel", DEFAULT_YLABEL), **line_options)
+        _svg.write_svg(output, svg)
+        return output
+    if renderer is None:
+        with ChartRenderer() as renderer:
+            return render_chart(spec, renderer)
+    if chart_type == "pie":
+        renderer.pie(spec["title"], labels, values, output)
+    elif chart_type == "bar":
+        renderer.bar(spec["title"], labels, values, output, spec.get("ylabel", DEFAULT_YLABEL))
+    else:
+        renderer.line(spec["title"], labels, values, output, spec.get("ylabel", DEFAULT_YLABEL), **line_options)
+    return output
+
+
+def _render_job(spec):
+    """Pool-safe render_chart on the process's shared renderer.
+
+    Returns (output, seconds, error) instead of raising.
+    """
+    global _batch_renderer
+    if _batch_renderer is None:
+        _batch_renderer = ChartRenderer()
+    start = time.perf_counter()
+    try:
+        render_chart(spec, _batch_renderer)
+        error = None
+    except Exception as e:
+        error = str(e)
+    return spec.get("output"), time.perf_counter() - start, error
+
+
+def load_specs(path):
+    """Read the chart spec list from a JSON or YAML (.yaml/.yml) file."""
+    with open(path, "r", encoding="utf-8") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("PyYAML is required for YAML specs. Install with: pip install pyyaml")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("charts")
+    if not isinstance(data, list) or not all(isinstance(spec, dict) for spec in data):
+        raise ValueError("Spec file must contain a list of chart objects (or {\"charts\": [...]})")
+    return data
+
+
+def render_batch(specs, jobs=1):
+    """Render every spec, in this process or across `jobs` worker processes.
+
+    matplotlib is imported and the Korean font configured once per process,
+    on its first PNG chart; each process draws all of its PNG charts on one
+    reused ChartRenderer figure. SVG charts never load matplotlib.
+
+    Returns:
+        list of (output, seconds, error) in spec order
+    """
+    if jobs > 1 and len(specs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(specs))) as pool:
+            return list(pool.map(_render_job, specs))
+    return [_render_job(spec) for spec in specs]
+
+
+def run_batch(path, jobs=1):
+    try:
+        specs = load_specs(path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    start = time.perf_counter()
+    results = render_batch(specs, jobs)
+    failed = 0
+    for index, (output, seconds, error) in enumerate(results, 1):
+        if error:
+            failed += 1
+            print(f"Chart {index} failed ({output or 'no output'}): {error}")
+        else:
+            print(f"Chart saved: {output} ({seconds:.3f}s)")
+    print(f"{len(results) - failed}/{len(results)} charts rendered in {time.perf_counter() - start:.2f}s")
+    if failed:
+        sys.exit(1)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Business Data Chart Generator")
     subparsers = parser.add_subparsers(dest="chart_type", help="Chart type")
 
-    for chart_type in ["bar", "pie", "line"]:
+    for chart_type in CHART_TYPES:
         sub = subparsers.add_parser(chart_type, help=f"{chart_type} chart")
         sub.add_argument("--title", required=True, help="Chart title")
-        sub.add_argument("--labels", required=True, help="Comma-separated labels")
-        sub.add_argument("--values", required=True, help="Comma-separated values")
+        sub.add_argument("--labels", help="Comma-separated labels")
+        sub.add_argument("--values", help="Comma-separated values")
+        sub.add_argument("--csv", help="CSV file with a header row (labels in the first column)")
+        sub.add_argument("--value-column", help="CSV column holding the values (default: second column)")
         sub.add_argument("--output", required=True, help="Output file path")
         if chart_type != "pie":
-            sub.add_argument("--ylabel", default="금액 (만원)", help="Y-axis label")
+            sub.add_argument("--ylabel", default=DEFAULT_YLABEL, help="Y-axis label")
+        if chart_type == "line":
+            sub.add_argument("--max-points", type=int, default=MAX_LINE_POINTS,
+                             help=f"Downsample longer series to this many points (default: {MAX_LINE_POINTS})")
+        sub.add_argument("--format", choices=FORMATS, default="png",
+                         help="png (matplotlib) or svg (no matplotlib needed)")
+
+    batch = subparsers.add_parser("batch", help="Render every chart in a JSON/YAML spec file")
+    batch.add_argument("spec", help="Spec file (.json, or .yaml/.yml with PyYAML)")
+    batch.add_argument("-j", "--jobs", type=int, default=1, help="Parallel render processes (default: 1)")
 
     args = parser.parse_args()
     if not args.chart_type:
         parser.print_help()
         sys.exit(0)
 
-    labels = [l.strip() for l in args.labels.split(",")]
-    values = [float(v.strip()) for v in args.values.split(",")]
+    if args.chart_type == "batch":
+        run_batch(args.spec, args.jobs)
+        return
 
-    if args.chart_type == "bar":
-        create_bar_chart(args.title, labels, values, args.output, getattr(args, 'ylabel', '금액 (만원)'))
-    elif args.chart_type == "pie":
-        create_pie_chart(args.title, labels, values, args.output)
-    elif args.chart_type == "line":
-        create_line_chart(args.title, labels, values, args.output, getattr(args, 'ylabel', '금액 (만원)'))
+    if not args.csv and not (args.labels and args.values):
+        parser.error("--labels and --values (or --csv) are required")
+    spec = {"type": args.chart_type, "title": args.title, "labels": args.labels,
+            "values": args.values, "csv": args.csv, "value_column": args.value_column,
+            "output": args.output, "ylabel": getattr(args, "ylabel", DEFAULT_YLABEL),
+            "max_points": getattr(args, "max_points", None), "format": args.format}
+    try:
+        render_chart(spec)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"Chart saved: {args.output}")
 
 
 if __name__ == "__main__":
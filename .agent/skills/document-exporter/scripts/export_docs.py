@@ -4,18 +4,50 @@ Business Planner Document Exporter
 Converts Markdown analysis reports into styled HTML/PDF business documents.
 Supports multiple high-quality design themes (Cosmic, Business, Modern).
 
+Fenced ```chart blocks are drawn inline (SVG by default) with the
+data-visualizer chart generator. The block holds the keys of a create_chart.py
+batch spec, as "key: value" lines or a JSON object (output is not needed):
+
+    ```chart
+    type: bar
+    title: 월별 매출
+    labels: 1월, 2월, 3월
+    values: 1000, 1500, 2000
+    ```
+
+Rendered charts are cached by spec hash in <output dir>/.chart-cache (or
+--chart-cache DIR), so unchanged charts are not redrawn on later exports.
+
 Dependencies: markdown (pip install markdown)
+Optional: weasyprint for direct PDF output (pip install weasyprint)
+Optional: matplotlib for "format: png" chart blocks (pip install matplotlib)
 No Jinja2 required - uses Python's built-in string.Template for portability.
 """
 
+import io
+import os
+import re
 import sys
+import html
+import json
+import base64
+import hashlib
+import shutil
 import argparse
+import itertools
+import tempfile
+import textwrap
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from string import Template
 
 try:
     import markdown
+    from markdown.extensions import Extension
+    from markdown.extensions.toc import nest_toc_tokens, slugify, unique
+    from markdown.preprocessors import Preprocessor
 except ImportError:
     print("❌ Error: 'markdown' package not found.")
     print("   Please run: pip install markdown")
@@ -24,25 +56,80 @@ except ImportError:
 # Configuration
 THEMES_DIR = Path(__file__).resolve().parent.parent.parent.parent.parent / "templates" / "themes"
 DEFAULT_THEME = "cosmic"
+DEFAULT_TITLE = "Business Report"
+
+# Blockquote metadata (> 작성일: ...) is only looked for near the top
+METADATA_SCAN_LINES = 20
+METADATA_KEYS = ('작성일', '작성자', '버전')
+
+MARKDOWN_EXTENSIONS = ['toc', 'tables', 'fenced_code', 'codehilite']
+
+# Streaming mode splits the document before these (top-level) headings
+SECTION_HEADINGS = ('# ', '## ')
+CONTENT_MARKER = '<!--EXPORT:CONTENT-->'
+
+# External CSS mode: the theme's <style> block becomes <theme>.<hash>.css
+STYLE_BLOCK_RE = re.compile(r'<style>(.*?)</style>', re.DOTALL)
+CSS_HASH_LENGTH = 10
+_written_stylesheets = set()
+
+# Book mode: chapter order by top-level folder (planning flow), output name
+BOOK_DIR_ORDER = ('ideas', 'research', 'financials', 'reports', 'presentations')
+BOOK_FILENAME = 'book.html'
+
+# Chart blocks: ```chart fences, drawn by data-visualizer/scripts/create_chart.py
+CHART_FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})\s*chart\s*$')
+FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+CHART_SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "data-visualizer" / "scripts"
+CHART_CACHE_DIR = '.chart-cache'
+CHART_DEFAULT_FORMAT = 'svg'
+# Part of every cache key; bump when the chart drawing changes
+CHART_CACHE_VERSION = 1
+_chart_caches = {}
+
+# PDF renderer of the current process (created on first use, then reused)
+_pdf_renderer = None
+
+
+def scan_header(lines):
+    """Scan leading Markdown lines for the H1 title and blockquote metadata.
+
+    Consumes *lines* (any iterable, e.g. an open file) lazily and stops as soon
+    as the title is known and either all METADATA_KEYS were seen or the
+    metadata window (first METADATA_SCAN_LINES lines) has passed.
+
+    Returns:
+        (title, metadata, buffer) - buffer holds the lines already read so the
+        caller can hand them to the converter without re-reading.
+    """
+    title = None
+    metadata = {}
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        stripped = line.strip()
+        if title is None and stripped.startswith('# '):
+            title = stripped[2:].strip()
+        if len(buffer) <= METADATA_SCAN_LINES and stripped.startswith('> '):
+            parts = stripped[2:].split(':', 1)
+            if len(parts) == 2:
+                metadata[parts[0].strip().lower()] = parts[1].strip()
+        if title is not None and (
+            len(buffer) >= METADATA_SCAN_LINES
+            or all(key in metadata for key in METADATA_KEYS)
+        ):
+            break
+    return title or DEFAULT_TITLE, metadata, buffer
 
 
 def extract_title(md_content):
     """Extract the first H1 heading to use as title."""
-    for line in md_content.split('\n'):
-        if line.strip().startswith('# '):
-            return line.strip()[2:].strip()
-    return "Business Report"
+    return scan_header(io.StringIO(md_content))[0]
 
 
 def extract_metadata(md_content):
     """Extract metadata from blockquote lines (> Key: Value)."""
-    metadata = {}
-    for line in md_content.split('\n')[:20]:
-        if line.strip().startswith('> '):
-            parts = line.strip()[2:].split(':', 1)
-            if len(parts) == 2:
-                metadata[parts[0].strip().lower()] = parts[1].strip()
-    return metadata
+    return scan_header(io.StringIO(md_content))[1]
 
 
 def load_theme(theme_name):
@@ -59,6 +146,254 @@ def load_theme(theme_name):
         return f.read()
 
 
+def link_theme_css(template_str, theme_name, output_dir):
+    """Replace the theme's inline <style> block with a link to a shared stylesheet.
+
+    The CSS is written once per output directory as <theme>.<hash>.css; the
+    content hash in the name makes an existing file safe to reuse and lets
+    browsers cache it across the whole report set.
+    """
+    match = STYLE_BLOCK_RE.search(template_str)
+    if not match:
+        return template_str
+
+    css = textwrap.dedent(match.group(1)).strip() + '\n'
+    digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:CSS_HASH_LENGTH]
+    css_name = f"{theme_name}.{digest}.css"
+    css_file = Path(output_dir).resolve() / css_name
+    if css_file not in _written_stylesheets:
+        if not css_file.exists():
+            css_file.write_text(css, encoding='utf-8')
+            print(f"   🎨 Stylesheet: {css_file}")
+        _written_stylesheets.add(css_file)
+
+    link = f'<link rel="stylesheet" href="{css_name}">'
+    return template_str[:match.start()] + link + template_str[match.end():]
+
+
+def parse_chart_spec(text):
+    """Parse a ```chart block body: a JSON object or "key: value" lines."""
+    text = text.strip()
+    if text.startswith('{'):
+        try:
+            spec = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"invalid JSON ({e})")
+        if not isinstance(spec, dict):
+            raise ValueError("chart JSON must be an object")
+        return spec
+    spec = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        key, sep, value = line.partition(':')
+        if not sep:
+            raise ValueError(f"expected 'key: value', got '{line}'")
+        spec[key.strip()] = value.strip()
+    return spec
+
+
+class ChartCache:
+    """Renders chart specs to embeddable HTML, cached on disk by content hash.
+
+    The cache key is the SHA-256 of the normalized spec (plus the bytes of
+    a referenced CSV file and CHART_CACHE_VERSION), so an unchanged chart is
+    read back from <digest>.svg/.png instead of being redrawn, across
+    documents and across exports. Files are written under a temporary name
+    and renamed, so book workers can share one cache directory.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.figures = {}
+        self.renderer = None
+
+    def key(self, spec, base_dir):
+        """Return (digest, spec ready for create_chart.render_chart)."""
+        spec = {k: v for k, v in spec.items() if k != 'output'}
+        spec.setdefault('format', CHART_DEFAULT_FORMAT)
+        hasher = hashlib.sha256(f"v{CHART_CACHE_VERSION}\n".encode('utf-8'))
+        if spec.get('csv'):
+            csv_file = (Path(base_dir) / spec['csv']).resolve()
+            spec['csv'] = str(csv_file)
+            hasher.update(csv_file.read_bytes())
+        hasher.update(json.dumps(spec, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        return hasher.hexdigest(), spec
+
+    def render(self, spec, base_dir):
+        """Return the <figure> HTML for a chart spec, drawing it only on a cache miss."""
+        digest, spec = self.key(spec, base_dir)
+        if digest in self.figures:
+            return self.figures[digest]
+
+        fmt = spec['format']
+        chart_file = self.directory / f"{digest}.{fmt}"
+        if not chart_file.exists():
+            create_chart = _load_chart_module()
+            if self.renderer is None:
+                self.renderer = create_chart.ChartRenderer()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.directory / f"{digest}.{os.getpid()}.tmp.{fmt}"
+            try:
+                create_chart.render_chart(dict(spec, output=str(tmp_file)), self.renderer)
+                os.replace(tmp_file, chart_file)
+            finally:
+                if tmp_file.exists():
+                    tmp_file.unlink()
+            print(f"   📊 Chart: {spec.get('title')} → {chart_file.name}")
+
+        if fmt == 'svg':
+            body = chart_file.read_text(encoding='utf-8').strip()
+        else:
+            data = base64.b64encode(chart_file.read_bytes()).decode('ascii')
+            alt = html.escape(str(spec.get('title', '')))
+            body = f'<img src="data:image/png;base64,{data}" alt="{alt}">'
+        self.figures[digest] = f'<figure class="chart">{body}</figure>'
+        return self.figures[digest]
+
+
+def get_chart_cache(directory):
+    """Return the process-wide ChartCache for a cache directory."""
+    directory = Path(directory).resolve()
+    if directory not in _chart_caches:
+        _chart_caches[directory] = ChartCache(directory)
+    return _chart_caches[directory]
+
+
+def _load_chart_module():
+    """Import create_chart from the data-visualizer skill (on the first chart only)."""
+    if str(CHART_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(CHART_SCRIPTS_DIR))
+    import create_chart
+    return create_chart
+
+
+def _closes_fence(line, fence):
+    """Whether line closes a block opened with fence (same character, at least as long)."""
+    stripped = line.strip()
+    return stripped.startswith(fence) and not stripped.strip(fence[0])
+
+
+def split_chart_blocks(lines):
+    """Yield Markdown lines, with each complete ```chart block as one list of lines.
+
+    Lines inside other fenced code blocks (e.g. a ```chart example in a
+    ````markdown or ~~~ block) are yielded as they are. An unclosed chart
+    block at the end is yielded as plain lines.
+
+    >>> list(split_chart_blocks(['````markdown', '```chart', 'type: bar', '```', '````',
+    ...                          '```chart', 'type: pie', '```']))
+    ['````markdown', '```chart', 'type: bar', '```', '````', ['```chart', 'type: pie', '```']]
+    """
+    block = None
+    code_fence = None
+    for line in lines:
+        if code_fence is not None:
+            if _closes_fence(line, code_fence):
+                code_fence = None
+            yield line
+            continue
+        if block is None:
+            match = CHART_FENCE_RE.match(line)
+            if match:
+                fence = match.group(1)
+                block = [line]
+                continue
+            match = FENCE_RE.match(line)
+            if match:
+                code_fence = match.group(1)
+            yield line
+            continue
+        block.append(line)
+        if _closes_fence(line, fence):
+            yield block
+            block = None
+    if block:
+        yield from block
+
+
+def chart_data_files(input_path):
+    """CSV files read by the ```chart blocks of a Markdown file (resolved Paths).
+
+    An export is out of date when one of them changes; blocks that do not
+    parse are skipped, as the export skips them.
+    """
+    input_file = Path(input_path)
+    with open(input_file, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    files = []
+    for item in split_chart_blocks(lines):
+        if not isinstance(item, list):
+            continue
+        try:
+            csv = parse_chart_spec('\n'.join(item[1:-1])).get('csv')
+        except ValueError:
+            continue
+        if csv:
+            files.append((input_file.parent / csv).resolve())
+    return files
+
+
+class ChartBlockPreprocessor(Preprocessor):
+    """Replaces ```chart fenced blocks with the rendered chart HTML.
+
+    Runs before fenced_code; a block that cannot be rendered is left as
+    a code block and reported.
+    """
+
+    def __init__(self, md, charts, base_dir):
+        super().__init__(md)
+        self.charts = charts
+        self.base_dir = base_dir
+
+    def run(self, lines):
+        out = []
+        for item in split_chart_blocks(lines):
+            if isinstance(item, list):
+                out.extend(self.replace(item))
+            else:
+                out.append(item)
+        return out
+
+    def replace(self, block):
+        try:
+            spec = parse_chart_spec('\n'.join(block[1:-1]))
+            chart_html = self.charts.render(spec, self.base_dir)
+        except Exception as e:
+            print(f"⚠️  Chart skipped: {e}")
+            return block
+        return ['', self.md.htmlStash.store(chart_html), '']
+
+
+class ChartExtension(Extension):
+    """Markdown extension rendering ```chart blocks through a ChartCache."""
+
+    def __init__(self, charts, base_dir):
+        super().__init__()
+        self.charts = charts
+        self.base_dir = base_dir
+
+    def extendMarkdown(self, md):
+        # fenced_code is registered at priority 25; charts must go first
+        md.preprocessors.register(ChartBlockPreprocessor(md, self.charts, self.base_dir), 'chart_block', 28)
+
+
+def create_markdown(charts, base_dir, slugify=None):
+    """Markdown converter with the export extensions and ```chart support.
+
+    Args:
+        charts: ChartCache for chart blocks
+        base_dir: directory that chart "csv" paths are relative to
+        slugify: optional TOC slugify function (see _document_slugify)
+    """
+    extension_configs = {'toc': {'slugify': slugify}} if slugify else {}
+    return markdown.Markdown(
+        extensions=[*MARKDOWN_EXTENSIONS, ChartExtension(charts, base_dir)],
+        extension_configs=extension_configs,
+    )
+
+
 def render_template(template_str, context):
     """Render a template string using simple placeholder replacement.
     
@@ -102,8 +437,39 @@ def render_template(template_str, context):
     return t.safe_substitute(context)
 
 
-def convert_markdown_to_html(input_path, output_path=None, theme_name=DEFAULT_THEME):
-    """Convert a single Markdown file to styled HTML."""
+def build_context(title, metadata, content, toc):
+    """Build the theme rendering context."""
+    return {
+        'title': title,
+        'content': content,
+        'toc': toc,
+        'date': metadata.get('작성일', datetime.now().strftime("%Y년 %m월 %d일")),
+        'author': metadata.get('작성자', ''),
+        'version': metadata.get('버전', ''),
+    }
+
+
+def resolve_output_file(input_file, output_path=None):
+    """Return the output path (default: next to the input) with its parent created."""
+    output_file = Path(output_path) if output_path else input_file.with_suffix('.html')
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    return output_file
+
+
+def resolve_chart_cache(output_file, chart_cache=None):
+    """Return the ChartCache for chart_cache (default: .chart-cache next to the output)."""
+    return get_chart_cache(chart_cache or Path(output_file).parent / CHART_CACHE_DIR)
+
+
+def convert_markdown_to_html(input_path, output_path=None, theme_name=DEFAULT_THEME,
+                             external_css=False, chart_cache=None):
+    """Convert a single Markdown file to styled HTML.
+
+    With external_css the theme CSS is linked from a shared stylesheet
+    (see link_theme_css) instead of being inlined. ```chart blocks are
+    cached in chart_cache (default: .chart-cache next to the output).
+    Returns the output Path on success, False otherwise.
+    """
     input_file = Path(input_path)
     
     if not input_file.exists():
@@ -111,16 +477,15 @@ def convert_markdown_to_html(input_path, output_path=None, theme_name=DEFAULT_TH
         return False
 
     try:
-        # Read Markdown
+        # Read Markdown: scan the header lazily, then read the rest once
         with open(input_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
+            title, metadata, head = scan_header(f)
+            md_content = ''.join(head) + f.read()
+
+        output_file = resolve_output_file(input_file, output_path)
 
-        # Extract metadata
-        title = extract_title(md_content)
-        metadata = extract_metadata(md_content)
-        
         # Convert Markdown to HTML with TOC
-        md = markdown.Markdown(extensions=['toc', 'tables', 'fenced_code', 'codehilite'])
+        md = create_markdown(resolve_chart_cache(output_file, chart_cache), input_file.parent)
         html_content = md.convert(md_content)
         toc_html = md.toc if hasattr(md, 'toc') else ''
         
@@ -130,33 +495,20 @@ def convert_markdown_to_html(input_path, output_path=None, theme_name=DEFAULT_TH
             print(f"❌ Error: No theme template available.")
             return False
         
-        # Build context
-        context = {
-            'title': title,
-            'content': html_content,
-            'toc': toc_html,
-            'date': metadata.get('작성일', datetime.now().strftime("%Y년 %m월 %d일")),
-            'author': metadata.get('작성자', ''),
-            'version': metadata.get('버전', ''),
-        }
-        
+        if external_css:
+            template_str = link_theme_css(template_str, theme_name, output_file.parent)
+
         # Render
+        context = build_context(title, metadata, html_content, toc_html)
         final_html = render_template(template_str, context)
 
         # Output
-        if output_path:
-            output_file = Path(output_path)
-        else:
-            output_file = input_file.with_suffix('.html')
-        
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(final_html)
 
         print(f"✅ Converted: {input_file.name} → {output_file.name} (Theme: {theme_name})")
         print(f"   📄 Output: {output_file.absolute()}")
-        return True
+        return output_file
 
     except UnicodeDecodeError:
         print(f"❌ Error: Encoding issue with {input_path}. Ensure UTF-8.")
@@ -168,8 +520,405 @@ def convert_markdown_to_html(input_path, output_path=None, theme_name=DEFAULT_TH
         return False
 
 
-def batch_convert(directory, theme=DEFAULT_THEME, recursive=False):
-    """Convert all Markdown files in a directory."""
+def split_sections(lines):
+    """Yield Markdown chunks split before each top-level heading.
+
+    Heading-like lines inside fenced code blocks do not start a new section;
+    a fence closes only on the same character, at least as long (as in
+    split_chart_blocks).
+
+    >>> [len(chunk.splitlines()) for chunk in split_sections([
+    ...     '# A\\n', '````markdown\\n', '```\\n', '## inside code\\n', '```\\n', '````\\n',
+    ...     '## B\\n', '~~~\\n', '## still code\\n', '```\\n', '~~~\\n'])]
+    [6, 5]
+    """
+    section = []
+    fence = None
+    for line in lines:
+        if fence:
+            if _closes_fence(line, fence):
+                fence = None
+        else:
+            match = FENCE_RE.match(line)
+            if match:
+                fence = match.group(1)
+            elif line.startswith(SECTION_HEADINGS) and section:
+                yield ''.join(section)
+                section = []
+        section.append(line)
+    if section:
+        yield ''.join(section)
+
+
+def _document_slugify(prefix=None):
+    """Return a TOC slugify function that keeps heading ids unique across sections.
+
+    With a prefix (book chapter anchor) every id becomes "<prefix>-<slug>";
+    headings without an ASCII slug become "<prefix>_N".
+    """
+    used_ids = {prefix} if prefix else set()
+
+    def document_slugify(value, separator):
+        slug = slugify(value, separator)
+        if prefix:
+            slug = f"{prefix}{separator}{slug}" if slug else prefix
+        return unique(slug, used_ids)
+
+    return document_slugify
+
+
+def _flatten_toc(tokens):
+    """Flatten nested markdown TOC tokens into (level, id, name) dicts."""
+    for token in tokens:
+        yield {'level': token['level'], 'id': token['id'], 'name': token['name']}
+        yield from _flatten_toc(token['children'])
+
+
+def render_toc(tokens):
+    """Render flat TOC tokens as the same nested list markup the toc extension emits."""
+    if not tokens:
+        return ''
+
+    def render_list(items):
+        parts = ['<ul>\n']
+        for item in items:
+            name = html.escape(html.unescape(item['name']), quote=False)
+            parts.append(f'<li><a href="#{item["id"]}">{name}</a>')
+            if item['children']:
+                parts.append(render_list(item['children']))
+            parts.append('</li>\n')
+        parts.append('</ul>\n')
+        return ''.join(parts)
+
+    return f'<div class="toc">\n{render_list(nest_toc_tokens(tokens))}</div>\n'
+
+
+def convert_sections(lines, md):
+    """Convert Markdown lines section by section with a reusable Markdown instance.
+
+    Yields:
+        (section HTML, flat TOC tokens of that section)
+    """
+    for section in split_sections(lines):
+        section_html = md.reset().convert(section)
+        yield section_html, list(_flatten_toc(md.toc_tokens))
+
+
+def write_spooled_document(output_file, template_str, context, spool):
+    """Write the rendered theme head, the spooled body HTML and the theme tail."""
+    context = dict(context, content=CONTENT_MARKER)
+    head_html, tail_html = render_template(template_str, context).split(CONTENT_MARKER, 1)
+    with open(output_file, 'w', encoding='utf-8') as out:
+        out.write(head_html)
+        spool.seek(0)
+        shutil.copyfileobj(spool, out)
+        out.write(tail_html)
+
+
+def stream_markdown_to_html(input_path, output_path=None, theme_name=DEFAULT_THEME,
+                            external_css=False, chart_cache=None):
+    """Convert a large Markdown file to styled HTML section by section.
+
+    The document is split at top-level headings and each section is converted
+    on its own, so memory is bounded by the largest section instead of the
+    whole report. Converted sections are spooled to a temporary file until
+    the TOC is complete, then the theme head, sections and tail are written
+    straight to the output file. Reference-style links must be defined in the
+    section that uses them. Returns the output Path on success, False otherwise.
+    """
+    input_file = Path(input_path)
+
+    if not input_file.exists():
+        print(f"❌ Error: File not found: {input_path}")
+        return False
+
+    try:
+        template_str = load_theme(theme_name)
+        if template_str is None:
+            print(f"❌ Error: No theme template available.")
+            return False
+
+        output_file = resolve_output_file(input_file, output_path)
+        md = create_markdown(resolve_chart_cache(output_file, chart_cache), input_file.parent,
+                             _document_slugify())
+        toc_tokens = []
+
+        with open(input_file, 'r', encoding='utf-8') as f, \
+                tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+            title, metadata, head = scan_header(f)
+            for section_html, section_toc in convert_sections(itertools.chain(head, f), md):
+                spool.write(section_html)
+                spool.write('\n')
+                toc_tokens.extend(section_toc)
+
+            if external_css:
+                template_str = link_theme_css(template_str, theme_name, output_file.parent)
+
+            context = build_context(title, metadata, None, render_toc(toc_tokens))
+            write_spooled_document(output_file, template_str, context, spool)
+
+        print(f"✅ Converted: {input_file.name} → {output_file.name} (Theme: {theme_name}, streamed)")
+        print(f"   📄 Output: {output_file.absolute()}")
+        return output_file
+
+    except UnicodeDecodeError:
+        print(f"❌ Error: Encoding issue with {input_path}. Ensure UTF-8.")
+        return False
+    except Exception as e:
+        print(f"❌ Error converting {input_path}: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def _book_sort_key(md_file, dir_path):
+    """Order chapters by planning flow (BOOK_DIR_ORDER), then by path."""
+    relative = md_file.relative_to(dir_path)
+    top = relative.parts[0] if len(relative.parts) > 1 else ''
+    rank = BOOK_DIR_ORDER.index(top) if top in BOOK_DIR_ORDER else len(BOOK_DIR_ORDER)
+    return rank, str(relative)
+
+
+def convert_chapter(job):
+    """Convert one book chapter; heading ids are prefixed with the chapter anchor.
+
+    Args:
+        job: (Markdown file path, chapter anchor, chart cache directory) -
+            a tuple so it can be sent to pool workers.
+
+    Returns:
+        (title, metadata, chapter HTML, flat TOC tokens)
+    """
+    md_file, anchor, chart_cache = job
+    md = create_markdown(get_chart_cache(chart_cache), Path(md_file).parent, _document_slugify(anchor))
+    parts = []
+    toc_tokens = []
+    with open(md_file, 'r', encoding='utf-8') as f:
+        title, metadata, head = scan_header(f)
+        for section_html, section_toc in convert_sections(itertools.chain(head, f), md):
+            parts.append(section_html)
+            toc_tokens.extend(section_toc)
+    return title, metadata, '\n'.join(parts), toc_tokens
+
+
+def _windowed_map(pool, fn, items, window):
+    """Like pool.map(fn, items), in order, with at most `window` calls in flight."""
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def book_convert(directory, output_path=None, theme=DEFAULT_THEME, recursive=False,
+                 external_css=False, jobs=1, title=None, chart_cache=None):
+    """Combine all Markdown files in a directory into one book-style HTML document.
+
+    Chapters follow the planning flow (research → financials → reports, then
+    anything else) and are converted in parallel with `jobs` workers. Results
+    are consumed in chapter order and spooled to disk as they arrive; at most
+    2×jobs chapters are submitted ahead of the one being written, so only
+    that many are held in memory. The book has one global TOC (one entry
+    per chapter with its headings nested below), a #chapter-N anchor per
+    chapter and a single theme wrap.
+    Returns the output Path on success, False otherwise.
+    """
+    dir_path = Path(directory)
+
+    if not dir_path.exists():
+        print(f"❌ Error: Directory not found: {directory}")
+        return False
+
+    pattern = '**/*.md' if recursive else '*.md'
+    md_files = sorted(dir_path.glob(pattern), key=lambda f: _book_sort_key(f, dir_path))
+
+    if not md_files:
+        print(f"⚠️  No Markdown files found in: {directory}")
+        return False
+
+    print(f"📚 Book: {len(md_files)} chapter(s)")
+    print(f"🎨 Theme: {theme}\n")
+
+    try:
+        template_str = load_theme(theme)
+        if template_str is None:
+            print(f"❌ Error: No theme template available.")
+            return False
+
+        output_file = Path(output_path) if output_path else dir_path / BOOK_FILENAME
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        chart_dir = str(resolve_chart_cache(output_file, chart_cache).directory)
+        jobs_list = [(str(md_file), f"chapter-{idx}", chart_dir) for idx, md_file in enumerate(md_files, 1)]
+        toc_tokens = []
+        book_metadata = {}
+
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as spool:
+            pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and len(md_files) > 1 else None
+            try:
+                results = _windowed_map(pool, convert_chapter, jobs_list, 2 * jobs) if pool \
+                    else map(convert_chapter, jobs_list)
+                for (md_file, anchor, _), chapter in zip(jobs_list, results):
+                    chapter_title, metadata, chapter_html, chapter_toc = chapter
+                    book_metadata = book_metadata or metadata
+                    toc_tokens.append({'level': 1, 'id': anchor, 'name': html.escape(chapter_title)})
+                    toc_tokens.extend(t for t in chapter_toc if t['level'] > 1)
+                    spool.write(f'<section class="chapter" id="{anchor}">\n{chapter_html}\n</section>\n')
+                    print(f"   📖 {anchor}: {Path(md_file).name} ({chapter_title})")
+            finally:
+                if pool:
+                    pool.shutdown()
+
+            if external_css:
+                template_str = link_theme_css(template_str, theme, output_file.parent)
+
+            book_title = title or dir_path.resolve().name
+            context = build_context(book_title, book_metadata, None, render_toc(toc_tokens))
+            write_spooled_document(output_file, template_str, context, spool)
+
+        print(f"\n✅ Book: {len(md_files)} chapters → {output_file.name} (Theme: {theme})")
+        print(f"   📄 Output: {output_file.absolute()}")
+        return output_file
+
+    except UnicodeDecodeError:
+        print(f"❌ Error: Encoding issue in {directory}. Ensure UTF-8.")
+        return False
+    except Exception as e:
+        print(f"❌ Error building book from {directory}: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def _caching_url_fetcher():
+    """A WeasyPrint url_fetcher that keeps stylesheet, font and image bodies in memory by URL.
+
+    Recent WeasyPrint releases take a URLFetcher instance returning
+    URLFetcherResponse objects; older ones take a function returning a dict
+    (wrapping weasyprint.default_url_fetcher). Whichever API the installed
+    version has is used.
+    """
+    try:
+        from weasyprint.urls import URLFetcher, URLFetcherResponse
+    except ImportError:
+        from weasyprint import default_url_fetcher
+        cache = {}
+
+        def fetch(url, *args, **kwargs):
+            if url not in cache:
+                result = default_url_fetcher(url, *args, **kwargs)
+                file_obj = result.pop('file_obj', None)
+                if file_obj is not None:
+                    try:
+                        result['string'] = file_obj.read()
+                    finally:
+                        file_obj.close()
+                cache[url] = result
+            return dict(cache[url])
+
+        return fetch
+
+    class CachingURLFetcher(URLFetcher):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.cache = {}
+
+        def fetch(self, url, headers=None):
+            if url not in self.cache:
+                response = super().fetch(url, headers)
+                try:
+                    self.cache[url] = (response.url, response.read(), response.headers, response.status)
+                finally:
+                    response.close()
+            resolved_url, body, response_headers, status = self.cache[url]
+            return URLFetcherResponse(resolved_url, body, response_headers, status)
+
+    return CachingURLFetcher()
+
+
+def _create_pdf_renderer():
+    """Build a WeasyPrint renderer that keeps fonts and fetched resources between documents.
+
+    Raises:
+        ImportError, OSError: WeasyPrint or its system libraries (Pango) are missing
+    """
+    from weasyprint import HTML
+    try:
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:  # WeasyPrint < 53
+        from weasyprint.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    url_fetcher = _caching_url_fetcher()
+
+    def render(html_file, pdf_file):
+        document = HTML(filename=str(html_file), url_fetcher=url_fetcher)
+        document.write_pdf(str(pdf_file), font_config=font_config)
+
+    return render
+
+
+def _render_pdf_job(html_file):
+    """Render one exported HTML file to PDF with this process's renderer.
+
+    Returns:
+        (pdf_path, error message or None)
+    """
+    global _pdf_renderer
+    pdf_file = Path(html_file).with_suffix('.pdf')
+    try:
+        if _pdf_renderer is None:
+            _pdf_renderer = _create_pdf_renderer()
+        _pdf_renderer(html_file, pdf_file)
+        return str(pdf_file), None
+    except Exception as e:
+        return str(pdf_file), str(e)
+
+
+def export_pdfs(html_files, jobs=1):
+    """Render exported HTML files to PDF next to them with WeasyPrint.
+
+    With jobs > 1 the documents are spread over a pool of worker processes.
+    Each renderer process (the current one or a pool worker) is reused for
+    many documents and keeps its font configuration and fetched
+    stylesheets/fonts, so a full report set pays those costs once per process.
+    Returns the number of PDFs written.
+    """
+    global _pdf_renderer
+    # Build this process's renderer up front, so an unusable WeasyPrint is
+    # reported once instead of as a failure for every document
+    try:
+        if _pdf_renderer is None:
+            _pdf_renderer = _create_pdf_renderer()
+    except (ImportError, OSError) as e:
+        print(f"❌ Error: WeasyPrint is not usable for PDF export: {e}")
+        print("   Please run: pip install weasyprint (see its docs for the Pango system libraries)")
+        return 0
+
+    html_files = [str(f) for f in html_files]
+    success_count = 0
+
+    def report(html_file, pdf_file, error):
+        if error:
+            print(f"❌ Error rendering PDF for {html_file}: {error}")
+            return 0
+        print(f"✅ PDF: {Path(html_file).name} → {Path(pdf_file).name}")
+        return 1
+
+    if jobs > 1 and len(html_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(html_files))) as pool:
+            for html_file, (pdf_file, error) in zip(html_files, pool.map(_render_pdf_job, html_files)):
+                success_count += report(html_file, pdf_file, error)
+    else:
+        for html_file in html_files:
+            success_count += report(html_file, *_render_pdf_job(html_file))
+    return success_count
+
+
+def batch_convert(directory, theme=DEFAULT_THEME, recursive=False, stream=False,
+                  external_css=False, pdf=False, jobs=1, chart_cache=None):
+    """Convert all Markdown files in a directory (optionally also to PDF)."""
     dir_path = Path(directory)
 
     if not dir_path.exists():
@@ -186,14 +935,22 @@ def batch_convert(directory, theme=DEFAULT_THEME, recursive=False):
     print(f"📁 Found {len(md_files)} Markdown file(s)")
     print(f"🎨 Theme: {theme}\n")
 
-    success_count = 0
+    convert = stream_markdown_to_html if stream else convert_markdown_to_html
+    html_files = []
     for md_file in md_files:
-        if convert_markdown_to_html(md_file, theme_name=theme):
-            success_count += 1
+        output_file = convert(md_file, theme_name=theme, external_css=external_css,
+                              chart_cache=chart_cache)
+        if output_file:
+            html_files.append(output_file)
 
     print(f"\n{'='*60}")
-    print(f"✨ Completed: {success_count}/{len(md_files)} files converted")
-    return success_count > 0
+    print(f"✨ Completed: {len(html_files)}/{len(md_files)} files converted")
+
+    if pdf and html_files:
+        print(f"\n📑 Rendering PDF (jobs: {jobs})\n")
+        pdf_count = export_pdfs(html_files, jobs=jobs)
+        print(f"\n✨ PDF: {pdf_count}/{len(html_files)} files rendered")
+    return len(html_files) > 0
 
 
 def main():
@@ -210,26 +967,58 @@ Examples:
   %(prog)s report.md                         # Default (cosmic)
   %(prog)s report.md --theme business        # Business theme  
   %(prog)s --batch ./output --theme modern   # Batch convert
+  %(prog)s big-report.md --stream            # Section-by-section (large files)
+  %(prog)s --batch ./output --external-css   # Share one cached stylesheet
+  %(prog)s --batch ./output --pdf --jobs 4   # HTML + PDF with 4 renderers
+  %(prog)s --book ./output -r --jobs 4       # One combined document (book.html)
+  %(prog)s --batch ./output -r --chart-cache ./output/.chart-cache
+                                             # One chart cache for the report set
         """
     )
 
     parser.add_argument('input', nargs='?', help='Input Markdown file')
     parser.add_argument('-o', '--output', help='Output HTML file path')
     parser.add_argument('-b', '--batch', metavar='DIR', help='Batch convert directory')
-    parser.add_argument('-r', '--recursive', action='store_true', help='Recursive batch')
+    parser.add_argument('--book', metavar='DIR',
+                        help='Combine a directory into one document with a global TOC')
+    parser.add_argument('--title', help='Book title (default: directory name)')
+    parser.add_argument('-r', '--recursive', action='store_true', help='Recursive batch/book')
     parser.add_argument('-t', '--theme', default=DEFAULT_THEME,
                         help=f'Design theme (default: {DEFAULT_THEME})')
+    parser.add_argument('-s', '--stream', action='store_true',
+                        help='Convert section by section to keep memory low on large reports')
+    parser.add_argument('--external-css', action='store_true',
+                        help='Write the theme CSS once as a hashed stylesheet and link it')
+    parser.add_argument('--pdf', action='store_true',
+                        help='Also render a PDF next to each HTML (requires weasyprint)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Parallel workers for PDF rendering and book chapters (default: 1)')
+    parser.add_argument('--chart-cache', metavar='DIR',
+                        help=f'Cache directory for rendered ```chart blocks '
+                             f'(default: {CHART_CACHE_DIR} next to each output)')
 
     args = parser.parse_args()
 
-    if not args.input and not args.batch:
+    if not args.input and not args.batch and not args.book:
         parser.print_help()
         sys.exit(1)
 
     if args.input:
-        convert_markdown_to_html(args.input, args.output, theme_name=args.theme)
+        convert = stream_markdown_to_html if args.stream else convert_markdown_to_html
+        output_file = convert(args.input, args.output, theme_name=args.theme,
+                              external_css=args.external_css, chart_cache=args.chart_cache)
+        if output_file and args.pdf:
+            export_pdfs([output_file])
+    elif args.book:
+        output_file = book_convert(args.book, args.output, theme=args.theme,
+                                   recursive=args.recursive, external_css=args.external_css,
+                                   jobs=args.jobs, title=args.title, chart_cache=args.chart_cache)
+        if output_file and args.pdf:
+            export_pdfs([output_file])
     elif args.batch:
-        batch_convert(args.batch, theme=args.theme, recursive=args.recursive)
+        batch_convert(args.batch, theme=args.theme, recursive=args.recursive,
+                      stream=args.stream, external_css=args.external_css,
+                      pdf=args.pdf, jobs=args.jobs, chart_cache=args.chart_cache)
 
 
 if __name__ == '__main__':
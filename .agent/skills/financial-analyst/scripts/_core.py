@@ -0,0 +1,119 @@
+"""Core calculators shared by calculate_costs.py and the engine modules.
+
+calculate_bep, calculate_margin and calculate_monthly_pl evaluate one set of
+inputs; the *_vector variants evaluate NumPy arrays (used by the grid, batch
+and engine paths) and return the same fields plus an invalid-row mask.
+"""
+
+from _vector import numpy
+
+
+def calculate_bep(fixed_costs: float, price: float, variable_cost: float) -> dict:
+    """Calculate Break-Even Point"""
+    contribution_margin = price - variable_cost
+    if contribution_margin <= 0 or price == 0:
+        return {"error": "Variable cost exceeds or equals price"}
+    bep_units = fixed_costs / contribution_margin
+    bep_revenue = bep_units * price
+    return {
+        "fixed_costs": fixed_costs,
+        "price_per_unit": price,
+        "variable_cost_per_unit": variable_cost,
+        "contribution_margin": contribution_margin,
+        "bep_units": round(bep_units, 1),
+        "bep_revenue": round(bep_revenue, 0),
+        "margin_ratio": round(contribution_margin / price * 100, 1),
+    }
+
+
+def calculate_margin(cost: float, price: float) -> dict:
+    """Calculate profit margins"""
+    if price == 0 or cost == 0:
+        return {"error": "Price and cost must be non-zero"}
+    gross_profit = price - cost
+    margin_pct = (gross_profit / price) * 100
+    markup_pct = (gross_profit / cost) * 100
+    return {
+        "cost": cost,
+        "price": price,
+        "gross_profit": gross_profit,
+        "margin_percent": round(margin_pct, 1),
+        "markup_percent": round(markup_pct, 1),
+        "cost_ratio": round((cost / price) * 100, 1),
+    }
+
+
+def calculate_monthly_pl(revenue: float, fixed: float, variable_rate: float) -> dict:
+    """Calculate monthly P&L"""
+    variable = revenue * variable_rate
+    gross_profit = revenue - variable
+    operating_profit = gross_profit - fixed
+    return {
+        "revenue": revenue,
+        "variable_costs": round(variable, 0),
+        "gross_profit": round(gross_profit, 0),
+        "gross_margin": round((gross_profit / revenue) * 100, 1) if revenue > 0 else 0,
+        "fixed_costs": fixed,
+        "operating_profit": round(operating_profit, 0),
+        "operating_margin": round((operating_profit / revenue) * 100, 1) if revenue > 0 else 0,
+        "status": "profit" if operating_profit > 0 else "loss",
+    }
+
+
+def bep_vector(fixed, price, variable):
+    """calculate_bep over NumPy arrays; returns (columns, invalid mask)."""
+    np = numpy()
+    contribution_margin = price - variable
+    invalid = (contribution_margin <= 0) | (price == 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bep_units = fixed / contribution_margin
+        margin_ratio = contribution_margin / price * 100
+    return {
+        "fixed_costs": fixed,
+        "price_per_unit": price,
+        "variable_cost_per_unit": variable,
+        "contribution_margin": contribution_margin,
+        "bep_units": np.round(bep_units, 1),
+        "bep_revenue": np.round(bep_units * price, 0),
+        "margin_ratio": np.round(margin_ratio, 1),
+    }, invalid
+
+
+def margin_vector(cost, price):
+    """calculate_margin over NumPy arrays; returns (columns, invalid mask)."""
+    np = numpy()
+    gross_profit = price - cost
+    invalid = (price == 0) | (cost == 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin_pct = gross_profit / price * 100
+        markup_pct = gross_profit / cost * 100
+        cost_ratio = cost / price * 100
+    return {
+        "cost": cost,
+        "price": price,
+        "gross_profit": gross_profit,
+        "margin_percent": np.round(margin_pct, 1),
+        "markup_percent": np.round(markup_pct, 1),
+        "cost_ratio": np.round(cost_ratio, 1),
+    }, invalid
+
+
+def monthly_vector(revenue, fixed, variable_rate):
+    """calculate_monthly_pl over NumPy arrays; returns (columns, invalid mask)."""
+    np = numpy()
+    variable = revenue * variable_rate
+    gross_profit = revenue - variable
+    operating_profit = gross_profit - fixed
+    has_revenue = revenue > 0
+    safe_revenue = np.where(has_revenue, revenue, 1)
+    return {
+        "variable_rate": variable_rate,
+        "revenue": revenue,
+        "variable_costs": np.round(variable, 0),
+        "gross_profit": np.round(gross_profit, 0),
+        "gross_margin": np.where(has_revenue, np.round(gross_profit / safe_revenue * 100, 1), 0),
+        "fixed_costs": fixed,
+        "operating_profit": np.round(operating_profit, 0),
+        "operating_margin": np.where(has_revenue, np.round(operating_profit / safe_revenue * 100, 1), 0),
+        "status": np.where(operating_profit > 0, "profit", "loss"),
+    }, np.zeros(revenue.shape, dtype=bool)
@@ -0,0 +1,52 @@
+"""Engine defaults and reference tables shown by calculate_costs.py --help.
+
+The engine modules re-export these under their own names (e.g.
+monte_carlo.DEFAULT_TRIALS); they live here so that building the
+command-line parser imports no engine. calculate_costs.py imports each
+engine in the handler of the command that uses it.
+"""
+
+# monte_carlo
+DEFAULT_TRIALS = 100_000
+DEFAULT_SEED = 42
+
+# projection
+PROJECTION_MONTHS = 12
+
+# cohort_model
+COHORT_MONTHS = 12
+COHORT_CHECKPOINTS = (3, 6, 12)
+
+# price_optimizer
+DEFAULT_STEPS = 201
+# bootstrap-calculator sensitivity range: current price +-30%
+PRICE_RANGE = 0.3
+
+# tax_engine
+# 본인 기본공제
+BASIC_DEDUCTION = 1_500_000
+# 간이과세 업종별 부가가치율 (x 10% = 1.5~4% of sales)
+SIMPLIFIED_VALUE_ADDED_RATES = {
+    "소매": 0.15,
+    "음식점": 0.15,
+    "제조": 0.20,
+    "숙박": 0.25,
+    "건설": 0.30,
+    "운수": 0.30,
+    "정보통신": 0.30,
+    "기타서비스": 0.30,
+    "전문서비스": 0.40,
+    "부동산임대": 0.40,
+}
+DEFAULT_INDUSTRY = "기타서비스"
+
+# ai_costs
+# USD per 1M tokens (input, output), 2025 reference prices from the skill
+MODEL_PRICES = {
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "claude-sonnet": (3.0, 15.0),
+    "claude-haiku": (0.25, 1.25),
+    "gemini-flash": (0.075, 0.3),
+}
+USD_KRW = 1300
@@ -0,0 +1,183 @@
+"""Shared array helpers for the financial calculators.
+
+NumPy is used when it is installed; every helper has a pure-Python fallback
+so the calculators keep working with the standard library only. NumPy is
+imported on first use (numpy()), so --help, argument errors and the scalar
+calculators never pay for it.
+"""
+
+import csv
+import functools
+import itertools
+import json
+import os
+
+# Rows evaluated per vectorized chunk (bounds memory for very large grids)
+CHUNK_ROWS = 65536
+
+
+@functools.lru_cache(maxsize=None)
+def numpy():
+    """Import NumPy once per process; returns the module, or None when it is not installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def parse_values(spec):
+    """Parse a value list "1,2,3" or an inclusive range "start:stop:step".
+
+    Returns:
+        list of floats
+
+    Raises:
+        ValueError: a value is not a number or the range is malformed
+    """
+    spec = str(spec).strip()
+
+    def number(text):
+        try:
+            return float(text)
+        except ValueError:
+            raise ValueError(f"Invalid number '{text.strip()}' in '{spec}'")
+
+    if ":" in spec:
+        parts = [number(p) for p in spec.split(":")]
+        if len(parts) != 3:
+            raise ValueError(f"Range must be start:stop:step (got '{spec}')")
+        start, stop, step = parts
+        if step <= 0:
+            raise ValueError(f"Range step must be positive (got '{spec}')")
+        count = int(round((stop - start) / step)) + 1
+        return [start + i * step for i in range(max(count, 0))]
+    return [number(v) for v in spec.split(",") if v.strip()]
+
+
+def grid_size(axes):
+    """Number of points in the Cartesian product of the axis value lists."""
+    size = 1
+    for values in axes.values():
+        size *= len(values)
+    return size
+
+
+def iter_grid_chunks(axes, chunk_rows=CHUNK_ROWS):
+    """Yield the Cartesian product of *axes* as column chunks.
+
+    Args:
+        axes: ordered dict of name -> list of values (last axis varies fastest)
+
+    Yields:
+        dict of name -> NumPy array (or list without NumPy) of at most
+        chunk_rows elements each
+    """
+    names = list(axes)
+    np = numpy()
+    if np is not None:
+        arrays = [np.asarray(axes[name], dtype=float) for name in names]
+        shape = tuple(len(a) for a in arrays)
+        total = grid_size(axes)
+        for start in range(0, total, chunk_rows):
+            flat = np.arange(start, min(start + chunk_rows, total))
+            index = np.unravel_index(flat, shape)
+            yield {name: arr[idx] for name, arr, idx in zip(names, arrays, index)}
+        return
+
+    product = itertools.product(*(axes[name] for name in names))
+    while True:
+        chunk = list(itertools.islice(product, chunk_rows))
+        if not chunk:
+            return
+        yield {name: list(col) for name, col in zip(names, zip(*chunk))}
+
+
+def rows_from_columns(columns, invalid=None, error=None, input_fields=()):
+    """Turn column arrays into row dicts.
+
+    Rows flagged in *invalid* keep only their input fields plus an "error"
+    message, matching how the scalar calculators report invalid input.
+    """
+    names = list(columns)
+    lists = [columns[name].tolist() if hasattr(columns[name], "tolist") else list(columns[name])
+             for name in names]
+    bad = invalid.tolist() if hasattr(invalid, "tolist") else invalid
+    for i, values in enumerate(zip(*lists)):
+        if bad is not None and bad[i]:
+            row = {n: v for n, v in zip(names, values) if n in input_fields}
+            row["error"] = error
+        else:
+            row = dict(zip(names, values))
+        yield row
+
+
+INPUT_FORMATS = ("jsonl", "csv")
+
+
+def input_format(path, default="jsonl"):
+    """Guess the record format from a file extension (.csv -> csv, else jsonl)."""
+    if path and path != "-" and os.path.splitext(path)[1].lower() == ".csv":
+        return "csv"
+    return default
+
+
+def iter_records(stream, fmt="jsonl"):
+    """Read records one line at a time from JSON Lines or CSV.
+
+    Yields:
+        (line number, record dict or None, error message or None); blank
+        JSON lines are skipped and malformed ones yield an error instead
+        of aborting the stream.
+    """
+    if fmt not in INPUT_FORMATS:
+        raise ValueError(f"Unknown input format: {fmt}")
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record, None
+        return
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "Record must be a JSON object"
+            continue
+        yield line_no, record, None
+
+
+class RowWriter:
+    """Incrementally write row dicts as JSON Lines or CSV."""
+
+    FORMATS = ("jsonl", "csv")
+
+    def __init__(self, stream, fmt="jsonl", fields=None):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown output format: {fmt}")
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = list(fields) if fields else None
+        self._csv = None
+        self.count = 0
+
+    def write(self, row):
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(row, ensure_ascii=False))
+            self.stream.write("\n")
+        else:
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.stream, fieldnames=self.fields or list(row),
+                                           extrasaction="ignore")
+                self._csv.writeheader()
+            self._csv.writerow(row)
+        self.count += 1
+
+    def write_all(self, rows):
+        for row in rows:
+            self.write(row)
+        return self.count
@@ -0,0 +1,186 @@
+"""Token-cost unit economics for AI business ideas.
+
+Follows the ai-pricing-calculator skill:
+
+    cost per request = (input tokens x input price + output tokens x output price)
+                       x chain count                  (prices are USD per 1M tokens)
+    unit cost        = (monthly requests x cost per request + infra) / monthly requests
+
+Every model x input tokens x output tokens x chains x monthly requests
+combination is evaluated in vectorized chunks (NumPy), point by point
+without it. Pricing tiers ("name:monthly price:included requests") add the
+per-request margin (calculate_margin on the unit cost) and the BEP user
+count (calculate_bep with a user paying the tier price as the unit).
+Cost fields are rounded with Python's round on both paths; tier margins
+come from the shared margin/BEP kernels, so as with `grid` an exact .x5
+half point may round one digit apart between NumPy and the fallback.
+"""
+
+import json
+
+from _defaults import MODEL_PRICES, USD_KRW
+from _vector import numpy, iter_grid_chunks
+from _core import bep_vector, calculate_bep, calculate_margin, margin_vector
+
+TOKENS_PER_PRICE_UNIT = 1_000_000
+AXES = ("model", "input_tokens", "output_tokens", "chains", "monthly_requests")
+# Output cost fields and their rounding (per-request KRW to 3 decimals per the skill)
+COST_DIGITS = {
+    "cost_per_request_usd": 6,
+    "cost_per_request_krw": 3,
+    "monthly_ai_cost_usd": 2,
+    "monthly_ai_cost_krw": 0,
+    "monthly_total_cost_krw": 0,
+    "unit_cost_krw": 3,
+}
+
+
+def load_price_table(path):
+    """Read a JSON price table {"model": [input USD/1M, output USD/1M], ...}."""
+    with open(path, encoding="utf-8") as f:
+        table = json.load(f)
+    try:
+        return {name: (float(prices[0]), float(prices[1])) for name, prices in table.items()}
+    except (TypeError, ValueError, IndexError, KeyError):
+        raise ValueError(f"Price table entries must be [input, output] prices: {path}")
+
+
+def parse_tiers(spec):
+    """Parse "basic:9900:100,pro:29000:500" into (name, monthly price, requests) tuples."""
+    tiers = []
+    for item in str(spec).split(","):
+        if not item.strip():
+            continue
+        parts = item.strip().split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Tier must be name:price:requests (got '{item}')")
+        name, price, requests = parts[0], float(parts[1]), float(parts[2])
+        if requests <= 0:
+            raise ValueError(f"Tier requests must be positive (got '{item}')")
+        tiers.append((name, price, requests))
+    return tiers
+
+
+def output_fields(tiers=()):
+    """Field order of the evaluate_ai_costs rows."""
+    fields = list(AXES) + list(COST_DIGITS)
+    for name, _, _ in tiers:
+        fields += [f"{name}_price_per_request", f"{name}_margin_percent", f"{name}_bep_users"]
+    return fields
+
+
+def _round_costs(row):
+    """Round the cost fields with Python's round so both engines agree exactly."""
+    for field, digits in COST_DIGITS.items():
+        row[field] = round(row[field], digits)
+    return row
+
+
+def _chunk_numpy(chunk, models, prices, tiers, fixed, usd_krw):
+    np = numpy()
+    index = chunk["model"].astype(int)
+    input_price = np.array([prices[m][0] for m in models])[index]
+    output_price = np.array([prices[m][1] for m in models])[index]
+    per_request = ((chunk["input_tokens"] * input_price + chunk["output_tokens"] * output_price)
+                   * chunk["chains"] / TOKENS_PER_PRICE_UNIT)
+    per_request_krw = per_request * usd_krw
+    monthly_krw = per_request_krw * chunk["monthly_requests"]
+    total = monthly_krw + fixed
+    unit_cost = total / chunk["monthly_requests"]
+    columns = {
+        "model": [models[i] for i in index.tolist()],
+        "input_tokens": chunk["input_tokens"],
+        "output_tokens": chunk["output_tokens"],
+        "chains": chunk["chains"],
+        "monthly_requests": chunk["monthly_requests"],
+        "cost_per_request_usd": per_request,
+        "cost_per_request_krw": per_request_krw,
+        "monthly_ai_cost_usd": per_request * chunk["monthly_requests"],
+        "monthly_ai_cost_krw": monthly_krw,
+        "monthly_total_cost_krw": total,
+        "unit_cost_krw": unit_cost,
+    }
+    for name, price, requests in tiers:
+        price_per_request = round(price / requests, 1)
+        margin, margin_invalid = margin_vector(unit_cost, np.full(unit_cost.shape, price_per_request))
+        bep, bep_invalid = bep_vector(fixed, price, per_request_krw * requests)
+        columns[f"{name}_price_per_request"] = np.full(unit_cost.shape, price_per_request)
+        columns[f"{name}_margin_percent"] = np.where(margin_invalid, np.nan, margin["margin_percent"])
+        columns[f"{name}_bep_users"] = np.where(bep_invalid, np.nan, bep["bep_units"])
+
+    lists = [col.tolist() if hasattr(col, "tolist") else col for col in columns.values()]
+    for values in zip(*lists):
+        # NaN marks points where the scalar calculators report an error
+        yield _round_costs({field: None if value != value else value for field, value in zip(columns, values)})
+
+
+def _row_python(model, input_tokens, output_tokens, chains, requests, prices, tiers, fixed, usd_krw):
+    input_price, output_price = prices[model]
+    per_request = (input_tokens * input_price + output_tokens * output_price) * chains / TOKENS_PER_PRICE_UNIT
+    per_request_krw = per_request * usd_krw
+    monthly_krw = per_request_krw * requests
+    total = monthly_krw + fixed
+    unit_cost = total / requests
+    row = {
+        "model": model,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "chains": chains,
+        "monthly_requests": requests,
+        "cost_per_request_usd": per_request,
+        "cost_per_request_krw": per_request_krw,
+        "monthly_ai_cost_usd": per_request * requests,
+        "monthly_ai_cost_krw": monthly_krw,
+        "monthly_total_cost_krw": total,
+        "unit_cost_krw": unit_cost,
+    }
+    for name, price, included in tiers:
+        price_per_request = round(price / included, 1)
+        row[f"{name}_price_per_request"] = price_per_request
+        row[f"{name}_margin_percent"] = calculate_margin(unit_cost, price_per_request).get("margin_percent")
+        row[f"{name}_bep_users"] = calculate_bep(fixed, price, per_request_krw * included).get("bep_units")
+    return _round_costs(row)
+
+
+def evaluate_ai_costs(models, input_tokens, output_tokens, chains, monthly_requests,
+                      tiers=(), fixed=0.0, usd_krw=USD_KRW, prices=None):
+    """Evaluate AI token costs over every input combination.
+
+    Args:
+        models: model names from the price table
+        input_tokens, output_tokens: tokens per AI call
+        chains: AI calls per request
+        monthly_requests: total requests per month (MAU x uses)
+        tiers: (name, monthly price KRW, included requests) tuples
+        fixed: monthly infrastructure/fixed costs (KRW)
+        usd_krw: exchange rate
+        prices: {model: (input, output)} USD per 1M tokens (default MODEL_PRICES)
+
+    Yields:
+        one row per combination (last axis varies fastest) with USD/KRW
+        costs and, per tier, price per request, margin percent on the unit
+        cost and BEP users. Margin/BEP are None where calculate_margin or
+        calculate_bep report an error (e.g. AI cost per user >= tier price).
+    """
+    np = numpy()
+    prices = prices or MODEL_PRICES
+    unknown = [m for m in models if m not in prices]
+    if unknown:
+        raise ValueError(f"Unknown model(s): {', '.join(unknown)} (use {', '.join(prices)})")
+    if any(r <= 0 for r in monthly_requests):
+        raise ValueError("monthly requests must be positive")
+    models = list(models)
+
+    if np is None:
+        axes = {"model": models, "input_tokens": list(input_tokens), "output_tokens": list(output_tokens),
+                "chains": list(chains), "monthly_requests": list(monthly_requests)}
+        for chunk in iter_grid_chunks(axes):
+            for values in zip(*(chunk[name] for name in AXES)):
+                yield _row_python(*values, prices, tiers, fixed, usd_krw)
+        return
+
+    axes = {"model": list(range(len(models))), "input_tokens": list(input_tokens),
+            "output_tokens": list(output_tokens), "chains": list(chains),
+            "monthly_requests": list(monthly_requests)}
+    for chunk in iter_grid_chunks(axes):
+        yield from _chunk_numpy(chunk, models, prices, tiers, fixed, usd_krw)
@@ -7,95 +7,666 @@ Usage:
     python calculate_costs.py bep --fixed 5000000 --price 15000 --variable 8000
     python calculate_costs.py margin --cost 8000 --price 15000
     python calculate_costs.py monthly --revenue 30000000 --fixed 15000000 --variable-rate 0.45
+    python calculate_costs.py grid bep --fixed 3000000:6000000:500000 --price 12000,15000 --variable 5000:9000:1000
+    python calculate_costs.py grid monthly --revenue 10000000:50000000:5000000 --fixed 15000000 --variable-rate 0.3,0.45 --format csv
+    python calculate_costs.py monthly --revenue 30000000 --fixed 15000000 --variable-rate 0.45 --exact
+    python calculate_costs.py simulate --revenue normal:30000000,6000000 --fixed 15000000 --variable-rate triangular:0.35,0.45,0.6
+    python calculate_costs.py project --revenue 10000000 --growth 0.05,0.1,0.2 --churn 0.08,0.05,0.03 --fixed 15000000 --variable-rate 0.4 --cash 50000000 --months 24 --names 비관,기본,낙관
+    python calculate_costs.py cohort --initial 30 --arpu 19000 --fixed 1500000 --months 12
+    python calculate_costs.py cohort --initial 30 --arpu 19000 --fixed 1500000 --growth 0.02:0.3:0.02 --churn 0.01:0.1:0.01 --grid --format csv
+    python calculate_costs.py batch bep --input menu.csv --format csv --output menu-bep.csv
+    cat ideas.jsonl | python calculate_costs.py batch margin
+    python calculate_costs.py optimize-price --demand elasticity:400,15000,1.8 --price 15000 --variable 6000 --fixed 2000000
+    python calculate_costs.py optimize-price --demand points:9900=520,12900=430,15900=300,19900=180 --min-price 9900 --max-price 19900 --table
+    python calculate_costs.py menu --ingredients ingredients.csv --recipes recipes.csv --format csv
+    python calculate_costs.py menu --ingredients ingredients.csv --recipes recipes.csv --reprice 우유=3.2,원두=28
+    python calculate_costs.py tax --revenue 5000000 --fixed 1500000 --variable-rate 0.35 --industry 음식점
+    python calculate_costs.py tax --revenue 2000000:9000000:500000 --fixed 1500000 --variable-rate 0.3 --purchases 500000:3000000:250000 --format csv
+    python calculate_costs.py ai-cost --models gpt-4o-mini,claude-haiku --input-tokens 1500,3000 --output-tokens 500 --chains 1,3 --requests 20000,100000 --tiers 베이직:9900:100,프로:29000:500 --fixed 130000
+
+Value lists are comma-separated ("1,2,3"); ranges are inclusive "start:stop:step".
+--exact (bep/margin/monthly, grid, batch) computes in integer won and basis points.
+Batch records name their inputs like the grid axes (fixed/price/variable,
+cost/price, revenue/fixed/variable_rate); other columns are passed through.
+Distributions: constant, normal:MEAN,SD, triangular:LOW,MODE,HIGH, lognormal:MEAN,SD.
+Demand curves: linear:INTERCEPT,SLOPE, elasticity:Q0,P0,E, points:P1=Q1,P2=Q2,...
 """
 
 import argparse
+import contextlib
+import itertools
 import json
 import sys
 
+from _core import (bep_vector, calculate_bep, calculate_margin, calculate_monthly_pl, margin_vector,
+                   monthly_vector)
+from _vector import (numpy, INPUT_FORMATS, input_format, iter_grid_chunks, iter_records, parse_values,
+                     rows_from_columns, RowWriter)
+import _defaults
 
-def calculate_bep(fixed_costs: float, price: float, variable_cost: float) -> dict:
-    """Calculate Break-Even Point"""
-    contribution_margin = price - variable_cost
-    if contribution_margin <= 0:
-        return {"error": "Variable cost exceeds or equals price"}
-    bep_units = fixed_costs / contribution_margin
-    bep_revenue = bep_units * price
-    return {
-        "fixed_costs": fixed_costs,
-        "price_per_unit": price,
-        "variable_cost_per_unit": variable_cost,
-        "contribution_margin": contribution_margin,
-        "bep_units": round(bep_units, 1),
-        "bep_revenue": round(bep_revenue, 0),
-        "margin_ratio": round(contribution_margin / price * 100, 1),
-    }
+# Records evaluated per vectorized chunk in batch mode
+BATCH_CHUNK_ROWS = 4096
 
 
-def calculate_margin(cost: float, price: float) -> dict:
-    """Calculate profit margins"""
-    gross_profit = price - cost
-    margin_pct = (gross_profit / price) * 100
-    markup_pct = (gross_profit / cost) * 100
-    return {
-        "cost": cost,
-        "price": price,
-        "gross_profit": gross_profit,
-        "margin_percent": round(margin_pct, 1),
-        "markup_percent": round(markup_pct, 1),
-        "cost_ratio": round((cost / price) * 100, 1),
-    }
+# Grid definitions: CLI axes (in calculator argument order), the output
+# fields echoing those inputs, scalar and vectorized implementations (float,
+# and fixed-point as names in fixed_point, which is imported on first use),
+# axes that are ratios (basis points in fixed-point mode), the scalar error
+# message for invalid points and the output field order.
+GRID_SPECS = {
+    "bep": {
+        "axes": ("fixed", "price", "variable"),
+        "inputs": ("fixed_costs", "price_per_unit", "variable_cost_per_unit"),
+        "scalar": calculate_bep,
+        "vector": bep_vector,
+        "exact_scalar": "calculate_bep_exact",
+        "exact_vector": "bep_exact_vector",
+        "rates": (),
+        "error": "Variable cost exceeds or equals price",
+        "fields": ("fixed_costs", "price_per_unit", "variable_cost_per_unit", "contribution_margin",
+                   "bep_units", "bep_revenue", "margin_ratio", "error"),
+    },
+    "margin": {
+        "axes": ("cost", "price"),
+        "inputs": ("cost", "price"),
+        "scalar": calculate_margin,
+        "vector": margin_vector,
+        "exact_scalar": "calculate_margin_exact",
+        "exact_vector": "margin_exact_vector",
+        "rates": (),
+        "error": "Price and cost must be non-zero",
+        "fields": ("cost", "price", "gross_profit", "margin_percent", "markup_percent",
+                   "cost_ratio", "error"),
+    },
+    "monthly": {
+        "axes": ("revenue", "fixed", "variable_rate"),
+        "inputs": ("revenue", "fixed_costs", "variable_rate"),
+        "scalar": calculate_monthly_pl,
+        "vector": monthly_vector,
+        "exact_scalar": "calculate_monthly_pl_exact",
+        "exact_vector": "monthly_exact_vector",
+        "rates": ("variable_rate",),
+        "error": None,
+        "fields": ("variable_rate", "revenue", "variable_costs", "gross_profit", "gross_margin",
+                   "fixed_costs", "operating_profit", "operating_margin", "status", "error"),
+    },
+}
 
 
-def calculate_monthly_pl(revenue: float, fixed: float, variable_rate: float) -> dict:
-    """Calculate monthly P&L"""
-    variable = revenue * variable_rate
-    gross_profit = revenue - variable
-    operating_profit = gross_profit - fixed
-    return {
-        "revenue": revenue,
-        "variable_costs": round(variable, 0),
-        "gross_profit": round(gross_profit, 0),
-        "gross_margin": round((gross_profit / revenue) * 100, 1) if revenue > 0 else 0,
-        "fixed_costs": fixed,
-        "operating_profit": round(operating_profit, 0),
-        "operating_margin": round((operating_profit / revenue) * 100, 1) if revenue > 0 else 0,
-        "status": "profit" if operating_profit > 0 else "loss",
-    }
+def _implementation(calc: str, kind: str, exact: bool = False):
+    """GRID_SPECS[calc]'s "scalar" or "vector" calculator, fixed-point when exact."""
+    spec = GRID_SPECS[calc]
+    if not exact:
+        return spec[kind]
+    import fixed_point
+    return getattr(fixed_point, spec[f"exact_{kind}"])
 
 
-def main():
+def to_fixed(calc: str, name: str, value) -> int:
+    """A calculator input as integer won (or basis points for ratio axes)."""
+    import fixed_point
+    if name in GRID_SPECS[calc]["rates"]:
+        return fixed_point.to_bp(value)
+    return fixed_point.to_won(value)
+
+
+def _scalar_grid_row(calc: str, values: tuple, exact: bool = False) -> dict:
+    """Evaluate one grid point with the scalar calculator (no-NumPy fallback)."""
+    spec = GRID_SPECS[calc]
+    inputs = dict(zip(spec["inputs"], values))
+    if exact:
+        # Echo ratios as ratios, not basis points
+        from fixed_point import BP
+        inputs.update({field: inputs[field] / BP for field in spec["rates"] if field in inputs})
+    result = _implementation(calc, "scalar", exact)(*values)
+    if "error" in result:
+        return {**inputs, "error": result["error"]}
+    row = {**inputs, **result}
+    return {field: row[field] for field in spec["fields"] if field in row}
+
+
+def _vector_rows(calc: str, args, exact: bool = False):
+    """Evaluate one chunk of argument columns with the vectorized calculator."""
+    spec = GRID_SPECS[calc]
+    if not exact:
+        columns, invalid = spec["vector"](*args)
+        return rows_from_columns(columns, invalid, spec["error"], spec["inputs"])
+    from fixed_point import as_int_array
+    try:
+        columns, invalid = _implementation(calc, "vector", exact=True)(*(as_int_array(a) for a in args))
+    except OverflowError:
+        # Amounts beyond the int64 range: exact Python integers instead
+        return (_scalar_grid_row(calc, tuple(int(v) for v in values), exact=True) for values in zip(*args))
+    return rows_from_columns(columns, invalid, spec["error"], spec["inputs"])
+
+
+def evaluate_grid(calc: str, exact: bool = False, **axes):
+    """Evaluate a calculator over the Cartesian product of its inputs.
+
+    Args:
+        calc: "bep", "margin" or "monthly"
+        exact: fixed-point mode (integer won / basis points, see fixed_point)
+        **axes: value list per input, named as in GRID_SPECS[calc]["axes"]
+            (e.g. fixed=[...], price=[...], variable=[...])
+
+    Yields:
+        one result dict per grid point (last axis varies fastest). Invalid
+        points (contribution margin <= 0, zero price/cost) carry their
+        inputs and an "error" message instead of aborting the grid.
+        Evaluated in vectorized chunks with NumPy, point by point without it.
+    """
+    np = numpy()
+    spec = GRID_SPECS[calc]
+    missing = [name for name in spec["axes"] if name not in axes]
+    if missing:
+        raise ValueError(f"Missing grid axes for {calc}: {', '.join(missing)}")
+    ordered = {name: list(axes[name]) for name in spec["axes"]}
+    if exact:
+        ordered = {name: [to_fixed(calc, name, v) for v in values] for name, values in ordered.items()}
+
+    for chunk in iter_grid_chunks(ordered):
+        args = [chunk[name] for name in spec["axes"]]
+        if np is None:
+            for values in zip(*args):
+                yield _scalar_grid_row(calc, values, exact)
+            continue
+        yield from _vector_rows(calc, args, exact)
+
+
+def _record_values(spec, record):
+    """Numeric calculator arguments of a batch record (ValueError if unusable)."""
+    values = []
+    for name in spec["axes"]:
+        raw = record.get(name)
+        if raw is None or raw == "":
+            raise ValueError(f"Missing field: {name}")
+        try:
+            values.append(float(raw))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid number for {name}: {raw!r}")
+    return values
+
+
+def evaluate_records(calc: str, records, chunk_rows: int = BATCH_CHUNK_ROWS, exact: bool = False):
+    """Evaluate a calculator for every record of a stream.
+
+    Args:
+        calc: "bep", "margin" or "monthly"
+        records: iterable of (line, record, error) as yielded by iter_records
+        exact: fixed-point mode (integer won / basis points, see fixed_point)
+
+    Yields:
+        one row per record, in input order: the line number, the record's
+        non-input fields (passed through) and the calculator result. Records
+        with missing/invalid numbers or calculator errors carry an "error"
+        message instead; they never abort the stream. Records are evaluated
+        in chunks (vectorized with NumPy), so memory stays constant.
+    """
+    np = numpy()
+    spec = GRID_SPECS[calc]
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, chunk_rows))
+        if not chunk:
+            return
+        results = [None] * len(chunk)
+        valid, values = [], []
+        for i, (line, record, error) in enumerate(chunk):
+            if error is None:
+                try:
+                    record_values = _record_values(spec, record)
+                    if exact:
+                        record_values = [to_fixed(calc, n, v) for n, v in zip(spec["axes"], record_values)]
+                    values.append(record_values)
+                    valid.append(i)
+                    continue
+                except ValueError as e:
+                    error = str(e)
+            extra = {k: v for k, v in (record or {}).items() if k not in spec["axes"]}
+            results[i] = {"line": line, **extra, "error": error}
+
+        if np is not None and values:
+            computed = _vector_rows(calc, [np.array(col, dtype=float) for col in zip(*values)], exact)
+        else:
+            computed = (_scalar_grid_row(calc, tuple(v), exact) for v in values)
+        for i, row in zip(valid, computed):
+            line, record, _ = chunk[i]
+            extra = {k: v for k, v in record.items() if k not in spec["axes"]}
+            results[i] = {"line": line, **extra, **row}
+        yield from results
+
+
+def open_input(path):
+    """Open a batch input file, or wrap stdin for "-"."""
+    if path and path != "-":
+        return open(path, encoding="utf-8-sig", newline="")
+    return contextlib.nullcontext(sys.stdin)
+
+
+def add_exact_argument(sub):
+    """Add the --exact option of the calculators that support fixed-point mode."""
+    sub.add_argument("--exact", action="store_true",
+                     help="Fixed-point money mode: integer won and basis points, exact totals")
+
+
+def add_output_arguments(sub):
+    """Add the --format/--output options shared by streaming subcommands."""
+    sub.add_argument("--format", choices=RowWriter.FORMATS, default="jsonl",
+                     help="Output format (default: jsonl)")
+    sub.add_argument("--output", help="Output file (default: stdout)")
+
+
+def open_output(path):
+    """Open the output file for streaming rows, or wrap stdout."""
+    if path:
+        return open(path, "w", encoding="utf-8", newline="")
+    return contextlib.nullcontext(sys.stdout)
+
+
+def fail(message):
+    """Print a JSON error and exit with status 1."""
+    print(json.dumps({"error": message}, indent=2, ensure_ascii=False))
+    sys.exit(1)
+
+
+def value_list(spec):
+    """argparse type for list/range options: parse_values with a usage error on bad input."""
+    try:
+        return parse_values(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def month_list(spec):
+    """argparse type for comma-separated month numbers ("3,6,12")."""
+    try:
+        return [int(m) for m in spec.split(",") if m.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Months must be whole numbers (got '{spec}')")
+
+
+def build_parser():
+    """The argument parser and its subcommand parsers by command name."""
     parser = argparse.ArgumentParser(description="Business Financial Calculator")
     subparsers = parser.add_subparsers(dest="command", help="Available calculations")
+    commands = {}
 
-    bep_parser = subparsers.add_parser("bep", help="Break-Even Point calculation")
+    bep_parser = commands["bep"] = subparsers.add_parser("bep", help="Break-Even Point calculation")
     bep_parser.add_argument("--fixed", type=float, required=True, help="Monthly fixed costs (KRW)")
     bep_parser.add_argument("--price", type=float, required=True, help="Price per unit (KRW)")
     bep_parser.add_argument("--variable", type=float, required=True, help="Variable cost per unit (KRW)")
 
-    margin_parser = subparsers.add_parser("margin", help="Profit margin calculation")
+    margin_parser = commands["margin"] = subparsers.add_parser("margin", help="Profit margin calculation")
     margin_parser.add_argument("--cost", type=float, required=True, help="Cost per unit (KRW)")
     margin_parser.add_argument("--price", type=float, required=True, help="Selling price (KRW)")
 
-    monthly_parser = subparsers.add_parser("monthly", help="Monthly P&L calculation")
+    monthly_parser = commands["monthly"] = subparsers.add_parser("monthly", help="Monthly P&L calculation")
     monthly_parser.add_argument("--revenue", type=float, required=True, help="Monthly revenue (KRW)")
     monthly_parser.add_argument("--fixed", type=float, required=True, help="Monthly fixed costs (KRW)")
     monthly_parser.add_argument("--variable-rate", type=float, required=True, help="Variable cost ratio (0-1)")
+    for sub in (bep_parser, margin_parser, monthly_parser):
+        add_exact_argument(sub)
 
-    args = parser.parse_args()
+    grid_parser = commands["grid"] = subparsers.add_parser(
+        "grid", help="Evaluate bep/margin/monthly over a grid of inputs")
+    grid_sub = grid_parser.add_subparsers(dest="grid_calc", help="Calculation to evaluate")
+    grid_args = {
+        "bep": [("--fixed", "Monthly fixed costs (KRW)"), ("--price", "Price per unit (KRW)"),
+                ("--variable", "Variable cost per unit (KRW)")],
+        "margin": [("--cost", "Cost per unit (KRW)"), ("--price", "Selling price (KRW)")],
+        "monthly": [("--revenue", "Monthly revenue (KRW)"), ("--fixed", "Monthly fixed costs (KRW)"),
+                    ("--variable-rate", "Variable cost ratio (0-1)")],
+    }
+    for calc, options in grid_args.items():
+        sub = grid_sub.add_parser(calc, help=f"{calc} grid")
+        for flag, help_text in options:
+            sub.add_argument(flag, type=value_list, required=True,
+                             help=f"{help_text}: list a,b,c or range start:stop:step")
+        add_exact_argument(sub)
+        add_output_arguments(sub)
+
+    sim_parser = commands["simulate"] = subparsers.add_parser(
+        "simulate", help="Monte Carlo simulation of the monthly P&L")
+    sim_parser.add_argument("--revenue", required=True, help="Monthly revenue distribution (KRW)")
+    sim_parser.add_argument("--fixed", required=True, help="Monthly fixed costs distribution (KRW)")
+    sim_parser.add_argument("--variable-rate", required=True, help="Variable cost ratio distribution (0-1)")
+    sim_parser.add_argument("--trials", type=int, default=_defaults.DEFAULT_TRIALS,
+                            help=f"Number of trials (default: {_defaults.DEFAULT_TRIALS})")
+    sim_parser.add_argument("--seed", type=int, default=_defaults.DEFAULT_SEED,
+                            help=f"RNG seed (default: {_defaults.DEFAULT_SEED})")
+
+    proj_parser = commands["project"] = subparsers.add_parser(
+        "project", help="Multi-month cash-flow projection (scenarios x months)")
+    proj_parser.add_argument("--revenue", type=value_list, required=True, help="Month-1 revenue (KRW), comma-separated per scenario")
+    proj_parser.add_argument("--growth", type=value_list, default="0", help="Monthly growth rate(s) (0-1)")
+    proj_parser.add_argument("--churn", type=value_list, default="0", help="Monthly churn rate(s) (0-1)")
+    proj_parser.add_argument("--fixed", type=value_list, required=True, help="Monthly fixed costs (KRW)")
+    proj_parser.add_argument("--variable-rate", type=value_list, required=True, help="Variable cost ratio(s) (0-1)")
+    proj_parser.add_argument("--cash", type=value_list, default="0", help="Initial cash (KRW)")
+    proj_parser.add_argument("--months", type=int, default=_defaults.PROJECTION_MONTHS,
+                             help=f"Projection horizon (default: {_defaults.PROJECTION_MONTHS})")
+    proj_parser.add_argument("--names", help="Comma-separated scenario names")
+    proj_parser.add_argument("--chart-metric", default="cash",
+                             choices=("cash", "revenue", "operating_profit"),
+                             help="Series exported for create_chart.py line (default: cash)")
+    proj_parser.add_argument("--table", action="store_true",
+                             help="Stream the monthly table (scenario x month rows) instead of the summary")
+    add_output_arguments(proj_parser)
+
+    cohort_parser = commands["cohort"] = subparsers.add_parser(
+        "cohort", help="Subscriber growth/churn cohort simulation (SaaS)")
+    cohort_parser.add_argument("--initial", type=float, required=True, help="Subscribers at month 0")
+    cohort_parser.add_argument("--arpu", type=float, required=True, help="Monthly revenue per subscriber (KRW)")
+    cohort_parser.add_argument("--fixed", type=float, required=True, help="Monthly fixed costs (KRW)")
+    cohort_parser.add_argument("--variable", type=float, default=0.0,
+                               help="Monthly variable cost per subscriber (KRW)")
+    cohort_parser.add_argument("--growth", type=value_list, help="Monthly growth rate(s) (default: 비관적/기본/낙관적 presets)")
+    cohort_parser.add_argument("--churn", type=value_list, help="Monthly churn rate(s), paired with --growth")
+    cohort_parser.add_argument("--grid", action="store_true",
+                               help="Evaluate every growth x churn combination and stream a sensitivity table")
+    cohort_parser.add_argument("--months", type=int, default=_defaults.COHORT_MONTHS,
+                               help=f"Horizon in months (default: {_defaults.COHORT_MONTHS})")
+    cohort_parser.add_argument("--checkpoints", type=month_list,
+                               default=",".join(map(str, _defaults.COHORT_CHECKPOINTS)),
+                               help="Months to report (default: 3,6,12)")
+    cohort_parser.add_argument("--matrix", action="store_true",
+                               help="Include the cohort x month matrix of each scenario")
+    add_output_arguments(cohort_parser)
+
+    batch_parser = commands["batch"] = subparsers.add_parser(
+        "batch", help="Evaluate bep/margin/monthly for every record of a CSV/JSONL file")
+    batch_sub = batch_parser.add_subparsers(dest="batch_calc", help="Calculation to evaluate")
+    for calc, spec in GRID_SPECS.items():
+        sub = batch_sub.add_parser(calc, help=f"{calc} per record (fields: {', '.join(spec['axes'])})")
+        sub.add_argument("--input", default="-", help="CSV or JSON Lines file (default: stdin)")
+        sub.add_argument("--input-format", choices=INPUT_FORMATS,
+                         help="Input format (default: from the file extension, jsonl for stdin)")
+        add_exact_argument(sub)
+        add_output_arguments(sub)
 
-    if args.command == "bep":
-        result = calculate_bep(args.fixed, args.price, args.variable)
-    elif args.command == "margin":
-        result = calculate_margin(args.cost, args.price)
-    elif args.command == "monthly":
-        result = calculate_monthly_pl(args.revenue, args.fixed, args.variable_rate)
+    opt_parser = commands["optimize-price"] = subparsers.add_parser(
+        "optimize-price", help="Revenue-max and profit-max price on a demand curve")
+    opt_parser.add_argument("--demand", required=True, help="Demand curve spec (units per month)")
+    opt_parser.add_argument("--price", type=float,
+                            help=f"Current price; searches +-{_defaults.PRICE_RANGE:.0%} around it")
+    opt_parser.add_argument("--min-price", type=float, help="Lowest price to search (KRW)")
+    opt_parser.add_argument("--max-price", type=float, help="Highest price to search (KRW)")
+    opt_parser.add_argument("--variable", type=float, default=0.0, help="Variable cost per unit (KRW)")
+    opt_parser.add_argument("--fixed", type=float, default=0.0, help="Monthly fixed costs (KRW)")
+    opt_parser.add_argument("--steps", type=int, default=_defaults.DEFAULT_STEPS,
+                            help=f"Grid points before refinement (default: {_defaults.DEFAULT_STEPS})")
+    opt_parser.add_argument("--table", action="store_true",
+                            help="Stream the full price curve instead of the summary")
+    add_output_arguments(opt_parser)
+
+    menu_parser = commands["menu"] = subparsers.add_parser(
+        "menu", help="Recipe cost rollup with margin per menu item")
+    menu_parser.add_argument("--ingredients", required=True, help="Ingredients table (ingredient, unit_price)")
+    menu_parser.add_argument("--recipes", required=True,
+                             help="Recipes table (item, ingredient, quantity[, price])")
+    menu_parser.add_argument("--input-format", choices=INPUT_FORMATS,
+                             help="Table format (default: from the file extensions)")
+    menu_parser.add_argument("--reprice",
+                             help="Ingredient price changes name=unit_price,...; outputs only affected items")
+    add_output_arguments(menu_parser)
+
+    tax_parser = commands["tax"] = subparsers.add_parser(
+        "tax", help="VAT (간이/일반), income and local tax from the monthly P&L")
+    tax_parser.add_argument("--revenue", type=value_list, required=True, help="Monthly revenue incl. VAT (KRW): list or range")
+    tax_parser.add_argument("--fixed", type=value_list, required=True, help="Monthly fixed costs (KRW): list or range")
+    tax_parser.add_argument("--variable-rate", type=value_list, required=True, help="Variable cost ratio (0-1): list or range")
+    tax_parser.add_argument("--purchases", type=value_list,
+                            help="Monthly purchases with tax invoices incl. VAT (default: variable costs)")
+    tax_parser.add_argument("--industry", default=_defaults.DEFAULT_INDUSTRY,
+                            choices=list(_defaults.SIMPLIFIED_VALUE_ADDED_RATES),
+                            help=f"Industry for simplified VAT (default: {_defaults.DEFAULT_INDUSTRY})")
+    tax_parser.add_argument("--deductions", type=float, default=_defaults.BASIC_DEDUCTION,
+                            help=f"Income deductions (default: {_defaults.BASIC_DEDUCTION})")
+    tax_parser.add_argument("--months", type=int, default=12, help="Months to annualize (default: 12)")
+    add_output_arguments(tax_parser)
+
+    ai_parser = commands["ai-cost"] = subparsers.add_parser(
+        "ai-cost", help="AI token cost, margin and BEP per pricing tier")
+    ai_parser.add_argument("--models", default=",".join(_defaults.MODEL_PRICES),
+                           help=f"Comma-separated models (default: all of {', '.join(_defaults.MODEL_PRICES)})")
+    ai_parser.add_argument("--price-table", help="JSON file {model: [input, output]} in USD per 1M tokens")
+    ai_parser.add_argument("--input-tokens", type=value_list, required=True, help="Input tokens per AI call: list or range")
+    ai_parser.add_argument("--output-tokens", type=value_list, required=True, help="Output tokens per AI call: list or range")
+    ai_parser.add_argument("--chains", type=value_list, default="1", help="AI calls per request: list or range (default: 1)")
+    ai_parser.add_argument("--requests", type=value_list, required=True, help="Monthly requests (MAU x uses): list or range")
+    ai_parser.add_argument("--tiers", default="", help="Pricing tiers name:monthly price:included requests,...")
+    ai_parser.add_argument("--fixed", type=float, default=0.0, help="Monthly infrastructure/fixed costs (KRW)")
+    ai_parser.add_argument("--usd-krw", type=float, default=_defaults.USD_KRW,
+                           help=f"Exchange rate (default: {_defaults.USD_KRW})")
+    add_output_arguments(ai_parser)
+
+    return parser, commands
+
+
+def run_calculator(args, parser):
+    """bep / margin / monthly: one result as JSON."""
+    spec = GRID_SPECS[args.command]
+    values = [getattr(args, name) for name in spec["axes"]]
+    if args.exact:
+        values = [to_fixed(args.command, name, v) for name, v in zip(spec["axes"], values)]
+    result = _implementation(args.command, "scalar", args.exact)(*values)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+def run_grid(args, parser):
+    if not args.grid_calc:
+        parser.print_help()
+        sys.exit(0)
+    spec = GRID_SPECS[args.grid_calc]
+    axes = {name: getattr(args, name) for name in spec["axes"]}
+    with open_output(args.output) as stream:
+        count = RowWriter(stream, args.format, spec["fields"]).write_all(
+            evaluate_grid(args.grid_calc, exact=args.exact, **axes))
+    print(f"{count} rows", file=sys.stderr)
+
+
+def run_simulate(args, parser):
+    import monte_carlo
+
+    try:
+        result = monte_carlo.simulate_monthly_pl(args.revenue, args.fixed, args.variable_rate,
+                                                 trials=args.trials, seed=args.seed)
+    except ValueError as e:
+        result = {"error": str(e)}
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+def run_project(args, parser):
+    import projection
+
+    try:
+        scenarios = projection.build_scenarios(
+            names=args.names.split(",") if args.names else None,
+            revenue=args.revenue, growth=args.growth, churn=args.churn, fixed=args.fixed,
+            variable_rate=args.variable_rate, initial_cash=args.cash,
+        )
+        result = projection.project_cashflow(scenarios, months=args.months)
+    except ValueError as e:
+        fail(str(e))
+    if args.table:
+        with open_output(args.output) as stream:
+            RowWriter(stream, args.format, projection.TABLE_FIELDS).write_all(projection.iter_table_rows(result))
+        return
+    chart = projection.chart_series(result, args.chart_metric)
+    for scenario in result["scenarios"]:
+        del scenario["series"]
+    print(json.dumps({**result, "chart": chart}, indent=2, ensure_ascii=False))
+
+
+def run_cohort(args, parser):
+    import cohort_model
+
+    if args.growth and args.churn:
+        names = None
+        growth, churn = args.growth, args.churn
+        if args.grid:
+            growth, churn = [g for g in growth for _ in churn], churn * len(growth)
+        elif len(growth) != len(churn):
+            fail("--growth and --churn need the same number of values")
+    elif args.growth or args.churn:
+        fail("--growth and --churn must be given together")
     else:
+        names = list(cohort_model.SCENARIO_PRESETS)
+        growth, churn = (list(v) for v in zip(*cohort_model.SCENARIO_PRESETS.values()))
+    result = cohort_model.simulate_cohorts(growth, churn, args.initial, args.arpu, args.fixed,
+                                           args.variable, months=args.months, checkpoints=args.checkpoints)
+    if args.grid:
+        with open_output(args.output) as stream:
+            count = RowWriter(stream, args.format).write_all(cohort_model.sensitivity_rows(result))
+        print(f"{count} rows", file=sys.stderr)
+        return
+    if names:
+        result["scenarios"] = [{"name": name, **scenario}
+                               for name, scenario in zip(names, result["scenarios"])]
+    for scenario in result["scenarios"]:
+        if args.matrix:
+            scenario["cohorts"] = cohort_model.cohort_matrix(args.initial, scenario["growth"],
+                                                             scenario["churn"], args.months)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+def run_batch(args, parser):
+    if not args.batch_calc:
         parser.print_help()
         sys.exit(0)
+    spec = GRID_SPECS[args.batch_calc]
+    try:
+        source = open_input(args.input)
+    except OSError as e:
+        fail(str(e))
+    with source as stream, open_output(args.output) as out:
+        records = iter_records(stream, args.input_format or input_format(args.input))
+        first = next(records, None)
+        # CSV columns: line, passed-through record fields, calculator fields
+        extra = [k for k in ((first[1] or {}) if first else {}) if k not in spec["axes"]]
+        writer = RowWriter(out, args.format, ["line", *extra, *spec["fields"]])
+        rows = evaluate_records(args.batch_calc, itertools.chain([first] if first else [], records),
+                                exact=args.exact)
+        errors = 0
+        for row in rows:
+            errors += "error" in row
+            writer.write(row)
+    print(f"{writer.count} rows, {errors} errors", file=sys.stderr)
+
 
+def run_optimize_price(args, parser):
+    import price_optimizer
+
+    low, high = args.min_price, args.max_price
+    if args.price is not None:
+        low = low if low is not None else args.price * (1 - price_optimizer.PRICE_RANGE)
+        high = high if high is not None else args.price * (1 + price_optimizer.PRICE_RANGE)
+    try:
+        if low is None or high is None:
+            raise ValueError("Give --price or both --min-price and --max-price")
+        result = price_optimizer.optimize_price(args.demand, low, high, variable=args.variable,
+                                                fixed=args.fixed, steps=args.steps)
+    except ValueError as e:
+        fail(str(e))
+    if args.table:
+        with open_output(args.output) as stream:
+            RowWriter(stream, args.format, price_optimizer.CURVE_FIELDS).write_all(result["curve"])
+        return
+    result["chart"] = price_optimizer.chart_series(result)
+    del result["curve"]
     print(json.dumps(result, indent=2, ensure_ascii=False))
 
 
+def run_menu(args, parser):
+    import menu_costing
+
+    try:
+        with open_input(args.ingredients) as stream:
+            ingredients = menu_costing.read_ingredients(
+                stream, args.input_format or input_format(args.ingredients))
+        with open_input(args.recipes) as stream:
+            lines, prices = menu_costing.read_recipes(stream, args.input_format or input_format(args.recipes))
+        menu = menu_costing.MenuCosting(ingredients, lines, prices)
+        changes = {}
+        for item in (args.reprice or "").split(","):
+            if item.strip():
+                name, _, value = item.partition("=")
+                changes[name.strip()] = float(value)
+        affected = menu.set_prices(changes) if args.reprice else None
+    except (OSError, ValueError) as e:
+        fail(str(e))
+    with open_output(args.output) as stream:
+        count = RowWriter(stream, args.format, menu_costing.ROW_FIELDS).write_all(menu.rows(affected))
+    summary = menu.summary()
+    print(f"{count} of {summary['items']} items, average cost ratio {summary['average_cost_ratio']}%",
+          file=sys.stderr)
+
+
+def run_tax(args, parser):
+    import tax_engine
+
+    try:
+        rows = tax_engine.estimate_taxes(
+            args.revenue, args.fixed, args.variable_rate, purchases=args.purchases,
+            industry=args.industry, deductions=args.deductions, months=args.months)
+        first, second = next(rows, None), next(rows, None)
+    except ValueError as e:
+        fail(str(e))
+    if second is None:
+        print(json.dumps(first, indent=2, ensure_ascii=False))
+        return
+    with open_output(args.output) as stream:
+        count = RowWriter(stream, args.format, tax_engine.FIELDS).write_all(
+            itertools.chain([first, second], rows))
+    print(f"{count} rows", file=sys.stderr)
+
+
+def run_ai_cost(args, parser):
+    import ai_costs
+
+    try:
+        prices = ai_costs.load_price_table(args.price_table) if args.price_table else None
+        tiers = ai_costs.parse_tiers(args.tiers)
+        rows = ai_costs.evaluate_ai_costs(
+            [m.strip() for m in args.models.split(",") if m.strip()],
+            args.input_tokens, args.output_tokens, args.chains, args.requests,
+            tiers=tiers, fixed=args.fixed, usd_krw=args.usd_krw, prices=prices)
+        first = next(rows, None)
+    except (OSError, ValueError) as e:
+        fail(str(e))
+    with open_output(args.output) as stream:
+        writer = RowWriter(stream, args.format, ai_costs.output_fields(tiers))
+        if first is not None:
+            writer.write(first)
+        count = writer.write_all(rows)
+    print(f"{count} rows", file=sys.stderr)
+
+
+# Subcommand: handler(args, subcommand parser)
+COMMANDS = {
+    "bep": run_calculator,
+    "margin": run_calculator,
+    "monthly": run_calculator,
+    "grid": run_grid,
+    "simulate": run_simulate,
+    "project": run_project,
+    "cohort": run_cohort,
+    "batch": run_batch,
+    "optimize-price": run_optimize_price,
+    "menu": run_menu,
+    "tax": run_tax,
+    "ai-cost": run_ai_cost,
+}
+
+
+def main():
+    parser, commands = build_parser()
+    args = parser.parse_args()
+    if args.command not in COMMANDS:
+        parser.print_help()
+        sys.exit(0)
+    COMMANDS[args.command](args, commands[args.command])
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,130 @@
+"""Subscriber cohort simulator for SaaS growth/churn scenarios.
+
+Month 0 starts with the initial subscribers (cohort 0). Every following
+month a new cohort of growth x (previous month's active subscribers) joins,
+and every cohort loses `churn` of its members per month after joining:
+
+    cohort[c][m] = new[c] * (1 - churn) ** (m - c)      for m >= c
+    active[m]    = sum of cohort[c][m] over c
+
+Many growth/churn pairs are evaluated together as a
+scenarios x cohorts x months array (NumPy), with a pure-Python fallback.
+"""
+
+from _defaults import COHORT_CHECKPOINTS as DEFAULT_CHECKPOINTS, COHORT_MONTHS as DEFAULT_MONTHS
+from _vector import numpy
+from _core import calculate_bep
+
+# bootstrap-calculator scenarios: (monthly growth, monthly churn)
+SCENARIO_PRESETS = {
+    "비관적": (0.05, 0.08),
+    "기본": (0.10, 0.05),
+    "낙관적": (0.20, 0.03),
+}
+# Scenarios per vectorized chunk (cohort arrays are scenarios x (M+1)^2)
+CHUNK_SCENARIOS = 2048
+
+
+def _cohorts_numpy(initial, growth, churn, months):
+    """Cohort matrices of shape (scenarios, cohorts, months), both 0..months."""
+    np = numpy()
+    growth = np.asarray(growth, dtype=float)[:, None]
+    retention = 1 - np.asarray(churn, dtype=float)[:, None]
+    net = growth + retention
+    cohort_index = np.arange(months + 1)[None, :]
+    new = np.where(cohort_index == 0, initial,
+                   growth * initial * net ** np.clip(cohort_index - 1, 0, None))
+    age = np.arange(months + 1)[None, :] - np.arange(months + 1)[:, None]
+    survival = np.where(age >= 0, retention[:, :, None] ** np.clip(age, 0, None), 0.0)
+    return new[:, :, None] * survival
+
+
+def _cohorts_python(initial, growth, churn, months):
+    matrices = []
+    for g, c in zip(growth, churn):
+        active_prev = initial
+        matrix = []
+        for cohort in range(months + 1):
+            size = initial if cohort == 0 else g * active_prev
+            row = [0.0] * cohort + [size * (1 - c) ** age for age in range(months + 1 - cohort)]
+            matrix.append(row)
+            active_prev = sum(r[cohort] for r in matrix)
+        matrices.append(matrix)
+    return matrices
+
+
+def cohort_matrix(initial, growth, churn, months=DEFAULT_MONTHS):
+    """Cohort x month subscriber matrix for a single scenario (rounded to 0.1)."""
+    np = numpy()
+    if np is not None:
+        matrix = _cohorts_numpy(initial, [growth], [churn], months)[0].tolist()
+    else:
+        matrix = _cohorts_python(initial, [growth], [churn], months)[0]
+    return [[round(v, 1) for v in row] for row in matrix]
+
+
+def _active_series(initial, growth, churn, months):
+    """Active subscribers per month (scenarios x months+1), evaluated in chunks."""
+    np = numpy()
+    if np is None:
+        return [[sum(col) for col in zip(*matrix)]
+                for matrix in _cohorts_python(initial, growth, churn, months)]
+    parts = []
+    for start in range(0, len(growth), CHUNK_SCENARIOS):
+        end = start + CHUNK_SCENARIOS
+        parts.append(_cohorts_numpy(initial, growth[start:end], churn[start:end], months).sum(axis=1))
+    return np.concatenate(parts).tolist()
+
+
+def simulate_cohorts(growth, churn, initial, arpu, fixed, variable=0.0,
+                     months=DEFAULT_MONTHS, checkpoints=DEFAULT_CHECKPOINTS):
+    """Simulate active subscribers, MRR, LTV and BEP timing per scenario.
+
+    Args:
+        growth, churn: equal-length sequences of monthly rates (one pair per
+            scenario)
+        initial: subscribers at month 0
+        arpu: monthly revenue per subscriber (KRW)
+        fixed: monthly fixed costs (KRW)
+        variable: monthly variable cost per subscriber (KRW)
+        months: horizon; checkpoints beyond it are ignored
+
+    Returns:
+        dict with the BEP customer count (calculate_bep with the subscriber
+        as the unit) and, per scenario, active subscribers/MRR at each
+        checkpoint, LTV ((arpu - variable) / churn; None when churn is 0)
+        and bep_month (first month with active >= BEP customers).
+    """
+    if len(growth) != len(churn):
+        raise ValueError("growth and churn need the same number of values")
+    bep = calculate_bep(fixed, arpu, variable)
+    bep_customers = bep.get("bep_units")
+    checkpoints = [m for m in checkpoints if 0 < m <= months]
+
+    scenarios = []
+    for g, c, active in zip(growth, churn, _active_series(initial, list(growth), list(churn), months)):
+        bep_month = None
+        if bep_customers is not None:
+            bep_month = next((m for m, n in enumerate(active) if n >= bep_customers), None)
+        scenarios.append({
+            "growth": g,
+            "churn": c,
+            "active": {m: round(active[m], 1) for m in checkpoints},
+            "mrr": {m: round(active[m] * arpu, 0) for m in checkpoints},
+            "ltv": round((arpu - variable) / c, 0) if c > 0 else None,
+            "bep_month": bep_month,
+        })
+    return {"months": months, "initial": initial, "arpu": arpu, "bep": bep, "scenarios": scenarios}
+
+
+def sensitivity_rows(result):
+    """Flatten simulate_cohorts output into one row per growth/churn pair."""
+    for scenario in result["scenarios"]:
+        row = {"growth": scenario["growth"], "churn": scenario["churn"]}
+        for m, n in scenario["active"].items():
+            row[f"active_m{m}"] = n
+        for m, mrr in scenario["mrr"].items():
+            row[f"mrr_m{m}"] = mrr
+        row["ltv"] = scenario["ltv"]
+        row["bep_month"] = scenario["bep_month"]
+        yield row
@@ -0,0 +1,186 @@
+"""Fixed-point money arithmetic for the calculators (--exact).
+
+Amounts are integer won and ratios integer basis points (1/10000), so row
+values and any totals summed from them are exact. Every division rounds
+half to even, the rule round() applies in the float calculators, and
+percentages are computed in tenths of a percent. Inputs are rounded to
+whole won / basis points first.
+
+The *_exact functions mirror calculate_bep/calculate_margin/
+calculate_monthly_pl on Python integers; the *_exact_vector variants run
+on NumPy int64 arrays and raise OverflowError when a chunk's intermediate
+products could exceed int64, so callers fall back to Python integers.
+"""
+
+from _vector import numpy
+
+BP = 10_000
+# ratio -> tenths of a percent (one decimal, as in the float calculators)
+TENTHS = 1000
+INT64_LIMIT = 2 ** 62
+# Below this magnitude float64 division is exact enough to round integer
+# quotients: a non-tie quotient lies at least 1/(2d) from k + 0.5, more
+# than float64's rounding error, and exact ties are representable.
+FLOAT_EXACT_LIMIT = 2 ** 52
+
+
+def to_won(value):
+    """Round an amount to integer won."""
+    return int(round(float(value)))
+
+
+def to_bp(rate):
+    """Convert a ratio (0.45) to integer basis points (4500)."""
+    return int(round(float(rate) * BP))
+
+
+def div_round(n, d):
+    """n / d rounded half to even, on integers."""
+    if d < 0:
+        n, d = -n, -d
+    q, r = divmod(n, d)
+    if 2 * r > d or (2 * r == d and q % 2):
+        q += 1
+    return q
+
+
+def div_round_array(n, d, small=False):
+    """Element-wise div_round on int64 arrays (d must be non-zero).
+
+    small: caller guarantees |n| and |d| < FLOAT_EXACT_LIMIT, so the quotient
+    is rounded in float64 (rint rounds half to even) instead of divmod.
+    """
+    np = numpy()
+    if small:
+        return np.rint(n / d).astype(np.int64)
+    negative = d < 0
+    n, d = np.where(negative, -n, n), np.where(negative, -d, d)
+    q, r = np.divmod(n, d)
+    return q + ((2 * r > d) | ((2 * r == d) & (q % 2 == 1)))
+
+
+def as_int_array(values):
+    """Integer-valued column (float or int) as an int64 array."""
+    np = numpy()
+    return np.rint(np.asarray(values, dtype=float)).astype(np.int64)
+
+
+def _check_range(*factors):
+    """Bound intermediate products by the product of the largest magnitudes.
+
+    Raises OverflowError if they may exceed int64; returns True when they
+    are small enough for div_round_array's float64 path.
+    """
+    np = numpy()
+    bound = 1.0
+    for factor in factors:
+        bound *= float(np.abs(factor).max()) if hasattr(factor, "shape") and factor.size else abs(float(factor or 0))
+    if bound >= INT64_LIMIT:
+        raise OverflowError("Values too large for int64 fixed-point arithmetic")
+    return bound < FLOAT_EXACT_LIMIT
+
+
+def calculate_bep_exact(fixed_costs: int, price: int, variable_cost: int) -> dict:
+    """calculate_bep on integer won."""
+    contribution_margin = price - variable_cost
+    if contribution_margin <= 0 or price == 0:
+        return {"error": "Variable cost exceeds or equals price"}
+    return {
+        "fixed_costs": fixed_costs,
+        "price_per_unit": price,
+        "variable_cost_per_unit": variable_cost,
+        "contribution_margin": contribution_margin,
+        "bep_units": div_round(fixed_costs * 10, contribution_margin) / 10,
+        "bep_revenue": div_round(fixed_costs * price, contribution_margin),
+        "margin_ratio": div_round(contribution_margin * TENTHS, price) / 10,
+    }
+
+
+def calculate_margin_exact(cost: int, price: int) -> dict:
+    """calculate_margin on integer won."""
+    if price == 0 or cost == 0:
+        return {"error": "Price and cost must be non-zero"}
+    gross_profit = price - cost
+    return {
+        "cost": cost,
+        "price": price,
+        "gross_profit": gross_profit,
+        "margin_percent": div_round(gross_profit * TENTHS, price) / 10,
+        "markup_percent": div_round(gross_profit * TENTHS, cost) / 10,
+        "cost_ratio": div_round(cost * TENTHS, price) / 10,
+    }
+
+
+def calculate_monthly_pl_exact(revenue: int, fixed: int, variable_bp: int) -> dict:
+    """calculate_monthly_pl on integer won and a variable rate in basis points."""
+    variable = revenue * variable_bp
+    gross_profit = revenue * BP - variable
+    operating_profit = gross_profit - fixed * BP
+    return {
+        "revenue": revenue,
+        "variable_costs": div_round(variable, BP),
+        "gross_profit": div_round(gross_profit, BP),
+        "gross_margin": div_round(gross_profit * TENTHS, revenue * BP) / 10 if revenue > 0 else 0,
+        "fixed_costs": fixed,
+        "operating_profit": div_round(operating_profit, BP),
+        "operating_margin": div_round(operating_profit * TENTHS, revenue * BP) / 10 if revenue > 0 else 0,
+        "status": "profit" if operating_profit > 0 else "loss",
+    }
+
+
+def bep_exact_vector(fixed, price, variable):
+    """calculate_bep_exact over int64 arrays; returns (columns, invalid mask)."""
+    np = numpy()
+    small = _check_range(np.abs(fixed) + TENTHS, np.abs(price) + np.abs(variable) + 10)
+    contribution_margin = price - variable
+    invalid = (contribution_margin <= 0) | (price == 0)
+    safe_margin = np.where(invalid, 1, contribution_margin)
+    return {
+        "fixed_costs": fixed,
+        "price_per_unit": price,
+        "variable_cost_per_unit": variable,
+        "contribution_margin": contribution_margin,
+        "bep_units": div_round_array(fixed * 10, safe_margin, small) / 10,
+        "bep_revenue": div_round_array(fixed * price, safe_margin, small),
+        "margin_ratio": div_round_array(contribution_margin * TENTHS, np.where(invalid, 1, price), small) / 10,
+    }, invalid
+
+
+def margin_exact_vector(cost, price):
+    """calculate_margin_exact over int64 arrays; returns (columns, invalid mask)."""
+    np = numpy()
+    small = _check_range(np.abs(price) + np.abs(cost), TENTHS)
+    gross_profit = price - cost
+    invalid = (price == 0) | (cost == 0)
+    safe_price, safe_cost = np.where(invalid, 1, price), np.where(invalid, 1, cost)
+    return {
+        "cost": cost,
+        "price": price,
+        "gross_profit": gross_profit,
+        "margin_percent": div_round_array(gross_profit * TENTHS, safe_price, small) / 10,
+        "markup_percent": div_round_array(gross_profit * TENTHS, safe_cost, small) / 10,
+        "cost_ratio": div_round_array(cost * TENTHS, safe_price, small) / 10,
+    }, invalid
+
+
+def monthly_exact_vector(revenue, fixed, variable_bp):
+    """calculate_monthly_pl_exact over int64 arrays; returns (columns, invalid mask)."""
+    np = numpy()
+    small = _check_range(np.abs(revenue) + np.abs(fixed), np.abs(variable_bp) + BP, TENTHS)
+    variable = revenue * variable_bp
+    gross_profit = revenue * BP - variable
+    operating_profit = gross_profit - fixed * BP
+    has_revenue = revenue > 0
+    safe_revenue = np.where(has_revenue, revenue, 1) * BP
+    return {
+        "variable_rate": variable_bp / BP,
+        "revenue": revenue,
+        "variable_costs": div_round_array(variable, BP, small),
+        "gross_profit": div_round_array(gross_profit, BP, small),
+        "gross_margin": np.where(has_revenue, div_round_array(gross_profit * TENTHS, safe_revenue, small) / 10, 0),
+        "fixed_costs": fixed,
+        "operating_profit": div_round_array(operating_profit, BP, small),
+        "operating_margin": np.where(has_revenue, div_round_array(operating_profit * TENTHS, safe_revenue, small) / 10,
+                                     0),
+        "status": np.where(operating_profit > 0, "profit", "loss"),
+    }, np.zeros(revenue.shape, dtype=bool)
@@ -0,0 +1,170 @@
+"""Menu costing: recipe cost rollups for many items at once.
+
+Recipes are kept as a sparse item x ingredient quantity list (one entry
+per recipe line). The full rollup is a single weighted bincount over those
+entries (NumPy; plain sums without it), and an ingredient -> items index
+lets a price change recompute only the items that use the ingredient.
+
+Input tables (CSV or JSON Lines):
+    ingredients: ingredient, unit_price       (KRW per recipe unit)
+    recipes:     item, ingredient, quantity[, price]
+                 (price is the item's selling price; the first non-empty
+                 value per item is used)
+"""
+
+from _vector import numpy, iter_records
+from _core import calculate_margin, margin_vector
+
+ROW_FIELDS = ("item", "cost", "price", "gross_profit", "margin_percent", "markup_percent",
+              "cost_ratio", "error")
+
+
+def _number(record, field, line):
+    try:
+        return float(record[field])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Line {line}: invalid or missing {field}")
+
+
+def read_ingredients(stream, fmt="jsonl"):
+    """Read {ingredient: unit price} from an ingredients table."""
+    prices = {}
+    for line, record, error in iter_records(stream, fmt):
+        if error:
+            raise ValueError(f"Line {line}: {error}")
+        name = str(record.get("ingredient") or "").strip()
+        if not name:
+            raise ValueError(f"Line {line}: missing ingredient")
+        prices[name] = _number(record, "unit_price", line)
+    return prices
+
+
+def read_recipes(stream, fmt="jsonl"):
+    """Read recipe lines and item selling prices from a recipes table.
+
+    Returns:
+        (list of (item, ingredient, quantity), {item: price})
+    """
+    lines, prices = [], {}
+    for line, record, error in iter_records(stream, fmt):
+        if error:
+            raise ValueError(f"Line {line}: {error}")
+        item = str(record.get("item") or "").strip()
+        ingredient = str(record.get("ingredient") or "").strip()
+        if not item or not ingredient:
+            raise ValueError(f"Line {line}: item and ingredient are required")
+        lines.append((item, ingredient, _number(record, "quantity", line)))
+        if item not in prices and record.get("price") not in (None, ""):
+            prices[item] = _number(record, "price", line)
+    return lines, prices
+
+
+class MenuCosting:
+    """Per-item recipe cost, margin, markup and cost ratio with incremental repricing."""
+
+    def __init__(self, ingredient_prices, recipe_lines, item_prices=None):
+        self.ingredients = list(ingredient_prices)
+        self._ingredient_index = {name: i for i, name in enumerate(self.ingredients)}
+        self.unit_prices = [float(ingredient_prices[name]) for name in self.ingredients]
+        self.item_prices = dict(item_prices or {})
+
+        self.items = []
+        item_index = {}
+        self._recipes = []          # per item: [(ingredient index, quantity)]
+        self._unknown = []          # per item: ingredient names missing from the table
+        self._used_by = {}          # ingredient index -> set of item indexes
+        for item, ingredient, quantity in recipe_lines:
+            if item not in item_index:
+                item_index[item] = len(self.items)
+                self.items.append(item)
+                self._recipes.append([])
+                self._unknown.append([])
+            i = item_index[item]
+            j = self._ingredient_index.get(ingredient)
+            if j is None:
+                self._unknown[i].append(ingredient)
+                continue
+            self._recipes[i].append((j, quantity))
+            self._used_by.setdefault(j, set()).add(i)
+        self._item_index = item_index
+        self.costs = self._rollup()
+
+    def _rollup(self):
+        """Cost of every item from the sparse recipe entries."""
+        np = numpy()
+        if np is None:
+            return [sum(self.unit_prices[j] * q for j, q in recipe) for recipe in self._recipes]
+        rows = [i for i, recipe in enumerate(self._recipes) for _ in recipe]
+        cols = [j for recipe in self._recipes for j, _ in recipe]
+        quantities = [q for recipe in self._recipes for _, q in recipe]
+        if not rows:
+            return [0.0] * len(self.items)
+        weights = np.asarray(quantities) * np.asarray(self.unit_prices)[np.asarray(cols, dtype=int)]
+        return np.bincount(np.asarray(rows), weights=weights, minlength=len(self.items)).tolist()
+
+    def set_prices(self, changes):
+        """Update ingredient unit prices and recompute only the affected items.
+
+        Args:
+            changes: {ingredient: new unit price}
+
+        Returns:
+            sorted list of affected item indexes
+        """
+        unknown = [name for name in changes if name not in self._ingredient_index]
+        if unknown:
+            raise ValueError(f"Unknown ingredient(s): {', '.join(unknown)}")
+        affected = set()
+        for name, price in changes.items():
+            j = self._ingredient_index[name]
+            self.unit_prices[j] = float(price)
+            affected |= self._used_by.get(j, set())
+        for i in affected:
+            self.costs[i] = sum(self.unit_prices[j] * q for j, q in self._recipes[i])
+        return sorted(affected)
+
+    def _error(self, i):
+        if self._unknown[i]:
+            return f"Unknown ingredient(s): {', '.join(self._unknown[i])}"
+        if self.items[i] not in self.item_prices:
+            return "Missing price"
+        return None
+
+    def rows(self, indexes=None):
+        """Yield cost/margin rows (calculate_margin fields) for items, in menu order.
+
+        Items with unknown ingredients or no selling price carry an "error"
+        instead of margin figures; so do zero costs or prices, as in
+        calculate_margin.
+        """
+        indexes = range(len(self.items)) if indexes is None else indexes
+        for i in indexes:
+            item = self.items[i]
+            error = self._error(i)
+            cost = round(self.costs[i], 1)
+            if error:
+                yield {"item": item, "cost": None if self._unknown[i] else cost, "error": error}
+                continue
+            result = calculate_margin(cost, self.item_prices[item])
+            if "error" in result:
+                yield {"item": item, "cost": cost, "price": self.item_prices[item], "error": result["error"]}
+                continue
+            yield {"item": item, **result}
+
+    def summary(self):
+        """Menu-wide totals: item count, priced items and average cost ratio."""
+        np = numpy()
+        priced = [i for i in range(len(self.items)) if self._error(i) is None]
+        if np is not None and priced:
+            cost = np.round(np.asarray([self.costs[i] for i in priced]), 1)
+            price = np.asarray([self.item_prices[self.items[i]] for i in priced])
+            columns, invalid = margin_vector(cost, price)
+            ratios = columns["cost_ratio"][~invalid].tolist()
+        else:
+            ratios = [row["cost_ratio"] for row in self.rows(priced) if "error" not in row]
+        return {
+            "items": len(self.items),
+            "ingredients": len(self.ingredients),
+            "priced_items": len(ratios),
+            "average_cost_ratio": round(sum(ratios) / len(ratios), 1) if ratios else None,
+        }
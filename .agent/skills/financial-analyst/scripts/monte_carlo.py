@@ -0,0 +1,184 @@
+"""Monte Carlo simulation of the monthly P&L.
+
+Samples revenue, fixed costs and the variable cost ratio from simple
+distributions and evaluates the calculate_monthly_pl formulas for every
+trial in vectorized batches (NumPy), with a seeded pure-Python fallback.
+
+Distribution specs:
+    15000000                      constant
+    normal:MEAN,SD
+    triangular:LOW,MODE,HIGH
+    lognormal:MEAN,SD             mean/sd of the value itself (not of log)
+"""
+
+import math
+import random
+
+from _defaults import DEFAULT_SEED, DEFAULT_TRIALS
+from _vector import numpy
+
+DISTRIBUTIONS = ("normal", "triangular", "lognormal")
+PERCENTILES = (5, 25, 50, 75, 95)
+BATCH_TRIALS = 250_000
+
+
+def parse_distribution(spec):
+    """Parse a distribution spec into (kind, params).
+
+    Returns:
+        ("constant", (value,)) or (kind, tuple of floats)
+    """
+    spec = str(spec).strip()
+    if ":" not in spec:
+        return "constant", (float(spec),)
+    kind, _, raw = spec.partition(":")
+    kind = kind.strip().lower()
+    params = tuple(float(p) for p in raw.split(","))
+    expected = {"normal": 2, "triangular": 3, "lognormal": 2}
+    if kind not in expected:
+        raise ValueError(f"Unknown distribution '{kind}' (use {', '.join(DISTRIBUTIONS)})")
+    if len(params) != expected[kind]:
+        raise ValueError(f"{kind} needs {expected[kind]} parameters (got '{spec}')")
+    if kind == "triangular" and not params[0] <= params[1] <= params[2]:
+        raise ValueError(f"triangular needs LOW <= MODE <= HIGH (got '{spec}')")
+    if kind == "lognormal" and params[0] <= 0:
+        raise ValueError(f"lognormal mean must be positive (got '{spec}')")
+    return kind, params
+
+
+def _lognormal_params(mean, sd):
+    """Convert the mean/sd of a lognormal value into mu/sigma of its log."""
+    sigma2 = math.log(1 + (sd / mean) ** 2)
+    return math.log(mean) - sigma2 / 2, math.sqrt(sigma2)
+
+
+def _sample_numpy(rng, dist, size):
+    np = numpy()
+    kind, params = dist
+    if kind == "constant":
+        return np.full(size, params[0])
+    if kind == "normal":
+        return rng.normal(params[0], params[1], size)
+    if kind == "triangular":
+        low, mode, high = params
+        if low == high:
+            return np.full(size, low)
+        return rng.triangular(low, mode, high, size)
+    mu, sigma = _lognormal_params(*params)
+    return rng.lognormal(mu, sigma, size)
+
+
+def _sample_python(rng, dist, size):
+    kind, params = dist
+    if kind == "constant":
+        return [params[0]] * size
+    if kind == "normal":
+        return [rng.gauss(params[0], params[1]) for _ in range(size)]
+    if kind == "triangular":
+        low, mode, high = params
+        return [rng.triangular(low, high, mode) for _ in range(size)]
+    mu, sigma = _lognormal_params(*params)
+    return [rng.lognormvariate(mu, sigma) for _ in range(size)]
+
+
+def _percentile(sorted_values, pct):
+    """Linear-interpolated percentile of a sorted list (NumPy's default method)."""
+    if not sorted_values:
+        return None
+    pos = (len(sorted_values) - 1) * pct / 100
+    low = int(math.floor(pos))
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+def _summary(values, digits):
+    """Mean and percentiles of a sample, rounded like the scalar calculators."""
+    np = numpy()
+    if np is not None:
+        if len(values) == 0:
+            return None
+        stats = {"mean": float(values.mean())}
+        stats.update({f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))})
+    else:
+        if not values:
+            return None
+        ordered = sorted(values)
+        stats = {"mean": sum(ordered) / len(ordered)}
+        stats.update({f"p{p}": _percentile(ordered, p) for p in PERCENTILES})
+    return {key: round(value, digits) for key, value in stats.items()}
+
+
+def _simulate_batch_numpy(rng, revenue, fixed, variable_rate, size):
+    np = numpy()
+    rev = np.clip(_sample_numpy(rng, revenue, size), 0, None)
+    fix = np.clip(_sample_numpy(rng, fixed, size), 0, None)
+    rate = np.clip(_sample_numpy(rng, variable_rate, size), 0, 1)
+    operating_profit = rev * (1 - rate) - fix
+    has_revenue = rev > 0
+    margin = np.where(has_revenue, operating_profit / np.where(has_revenue, rev, 1) * 100, 0)
+    has_bep = rate < 1
+    bep = fix[has_bep] / (1 - rate[has_bep])
+    return operating_profit, margin, bep
+
+
+def _simulate_batch_python(rng, revenue, fixed, variable_rate, size):
+    revs = _sample_python(rng, revenue, size)
+    fixes = _sample_python(rng, fixed, size)
+    rates = _sample_python(rng, variable_rate, size)
+    profits, margins, beps = [], [], []
+    for rev, fix, rate in zip(revs, fixes, rates):
+        rev, fix, rate = max(rev, 0.0), max(fix, 0.0), min(max(rate, 0.0), 1.0)
+        operating_profit = rev * (1 - rate) - fix
+        profits.append(operating_profit)
+        margins.append(operating_profit / rev * 100 if rev > 0 else 0)
+        if rate < 1:
+            beps.append(fix / (1 - rate))
+    return profits, margins, beps
+
+
+def simulate_monthly_pl(revenue, fixed, variable_rate, trials=DEFAULT_TRIALS, seed=DEFAULT_SEED):
+    """Run a Monte Carlo simulation of the monthly P&L.
+
+    Args:
+        revenue, fixed, variable_rate: distribution specs (see module doc) or
+            already parsed (kind, params) tuples. Sampled revenue and fixed
+            costs are clipped at 0 and the variable rate to [0, 1].
+        trials: number of trials, evaluated in batches of BATCH_TRIALS
+        seed: RNG seed; the same seed reproduces the same result
+
+    Returns:
+        dict with the probability of loss and mean/percentiles of operating
+        profit, operating margin and BEP revenue (fixed / (1 - variable rate))
+    """
+    np = numpy()
+    dists = [d if isinstance(d, tuple) else parse_distribution(d) for d in (revenue, fixed, variable_rate)]
+    if trials <= 0:
+        raise ValueError("trials must be positive")
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        simulate_batch, concat = _simulate_batch_numpy, np.concatenate
+    else:
+        rng = random.Random(seed)
+        simulate_batch = _simulate_batch_python
+        concat = lambda parts: [v for part in parts for v in part]  # noqa: E731
+
+    profits, margins, beps = [], [], []
+    for start in range(0, trials, BATCH_TRIALS):
+        batch = simulate_batch(rng, *dists, min(BATCH_TRIALS, trials - start))
+        profits.append(batch[0])
+        margins.append(batch[1])
+        beps.append(batch[2])
+    profits, margins, beps = concat(profits), concat(margins), concat(beps)
+
+    losses = int((profits <= 0).sum()) if np is not None else sum(1 for p in profits if p <= 0)
+    return {
+        "trials": trials,
+        "seed": seed,
+        "engine": "numpy" if np is not None else "python",
+        "loss_probability": round(losses / trials, 4),
+        "operating_profit": _summary(profits, 0),
+        "operating_margin": _summary(margins, 1),
+        "bep_revenue": _summary(beps, 0),
+        "bep_undefined_trials": trials - len(beps),
+    }
@@ -0,0 +1,194 @@
+"""Price optimization over a demand curve.
+
+Evaluates monthly demand, revenue and operating profit over a price range
+in one vectorized pass (NumPy; pure Python without it), then refines the
+best grid points with a golden-section search for the revenue-max
+(growth) and profit-max prices.
+
+Demand specs (units or customers per month at a given price):
+    linear:INTERCEPT,SLOPE        q = max(INTERCEPT - SLOPE x price, 0)
+    elasticity:Q0,P0,E            q = Q0 x (price / P0) ** -E  (constant elasticity)
+    points:P1=Q1,P2=Q2,...        linear interpolation between measured points
+                                  (flat beyond the first/last point)
+"""
+
+import bisect
+import math
+
+from _defaults import DEFAULT_STEPS, PRICE_RANGE
+from _vector import numpy
+from _core import calculate_bep, calculate_margin
+
+DEMAND_CURVES = ("linear", "elasticity", "points")
+# Golden-section search stops once the bracket is narrower than this (KRW)
+PRICE_TOLERANCE = 1.0
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+CHART_POINTS = 13
+# create_chart.py plots amounts in 만원
+CHART_UNIT = 10_000
+CURVE_FIELDS = ("price", "quantity", "revenue", "operating_profit")
+
+
+def parse_demand(spec):
+    """Parse a demand spec into (kind, params).
+
+    Returns:
+        ("linear", (intercept, slope)), ("elasticity", (q0, p0, e)) or
+        ("points", (prices, quantities)) with prices ascending
+    """
+    spec = str(spec).strip()
+    kind, _, raw = spec.partition(":")
+    kind = kind.strip().lower()
+    if kind not in DEMAND_CURVES:
+        raise ValueError(f"Unknown demand curve '{kind}' (use {', '.join(DEMAND_CURVES)})")
+    if kind == "points":
+        try:
+            pairs = sorted((float(p), float(q)) for p, q in (item.split("=") for item in raw.split(",")))
+        except ValueError:
+            raise ValueError(f"points needs PRICE=QUANTITY pairs (got '{spec}')")
+        if len(pairs) < 2:
+            raise ValueError(f"points needs at least two PRICE=QUANTITY pairs (got '{spec}')")
+        return kind, tuple(zip(*pairs))
+    params = tuple(float(p) for p in raw.split(","))
+    expected = {"linear": 2, "elasticity": 3}
+    if len(params) != expected[kind]:
+        raise ValueError(f"{kind} needs {expected[kind]} parameters (got '{spec}')")
+    if kind == "elasticity" and params[1] <= 0:
+        raise ValueError(f"elasticity reference price must be positive (got '{spec}')")
+    return kind, params
+
+
+def _demand_numpy(curve, prices):
+    np = numpy()
+    kind, params = curve
+    if kind == "linear":
+        return np.clip(params[0] - params[1] * prices, 0, None)
+    if kind == "elasticity":
+        return params[0] * (prices / params[1]) ** -params[2]
+    return np.interp(prices, params[0], params[1])
+
+
+def _demand_scalar(curve, price):
+    kind, params = curve
+    if kind == "linear":
+        return max(params[0] - params[1] * price, 0.0)
+    if kind == "elasticity":
+        return params[0] * (price / params[1]) ** -params[2]
+    xs, ys = params
+    if price <= xs[0]:
+        return ys[0]
+    if price >= xs[-1]:
+        return ys[-1]
+    i = bisect.bisect_right(xs, price)
+    return ys[i - 1] + (ys[i] - ys[i - 1]) * (price - xs[i - 1]) / (xs[i] - xs[i - 1])
+
+
+def _golden_max(f, lo, hi, tol=PRICE_TOLERANCE):
+    """Maximize a unimodal function on [lo, hi] by golden-section search."""
+    c, d = hi - GOLDEN_RATIO * (hi - lo), lo + GOLDEN_RATIO * (hi - lo)
+    fc, fd = f(c), f(d)
+    while hi - lo > tol:
+        if fc >= fd:
+            hi, d, fd = d, c, fc
+            c = hi - GOLDEN_RATIO * (hi - lo)
+            fc = f(c)
+        else:
+            lo, c, fc = c, d, fd
+            d = lo + GOLDEN_RATIO * (hi - lo)
+            fd = f(d)
+    return (lo + hi) / 2
+
+
+def _evaluate(curve, prices, variable, fixed):
+    """Quantity, revenue and operating profit columns for a price grid."""
+    np = numpy()
+    if np is not None:
+        prices = np.asarray(prices, dtype=float)
+        quantity = _demand_numpy(curve, prices)
+        revenue = prices * quantity
+        profit = quantity * (prices - variable) - fixed
+        return {"price": prices.tolist(), "quantity": quantity.tolist(),
+                "revenue": revenue.tolist(), "operating_profit": profit.tolist()}
+    quantity = [_demand_scalar(curve, p) for p in prices]
+    return {
+        "price": list(prices),
+        "quantity": quantity,
+        "revenue": [p * q for p, q in zip(prices, quantity)],
+        "operating_profit": [q * (p - variable) - fixed for p, q in zip(prices, quantity)],
+    }
+
+
+def _price_point(curve, price, variable, fixed):
+    """Rounded result at one price, with calculate_margin/calculate_bep figures."""
+    price = round(price, 0)
+    quantity = _demand_scalar(curve, price)
+    point = {
+        "price": price,
+        "quantity": round(quantity, 1),
+        "revenue": round(price * quantity, 0),
+        "operating_profit": round(quantity * (price - variable) - fixed, 0),
+    }
+    point["margin_percent"] = calculate_margin(variable, price).get("margin_percent") if variable else 100.0
+    point["bep_units"] = calculate_bep(fixed, price, variable).get("bep_units")
+    return point
+
+
+def optimize_price(demand, min_price, max_price, variable=0.0, fixed=0.0, steps=DEFAULT_STEPS):
+    """Find the revenue-max and profit-max prices on a demand curve.
+
+    Args:
+        demand: demand spec (see module doc) or a parsed (kind, params) tuple
+        min_price, max_price: search range (KRW)
+        variable: variable cost per unit (KRW)
+        fixed: monthly fixed costs (KRW)
+        steps: grid points evaluated before golden-section refinement
+
+    Returns:
+        dict with revenue_max and profit_max points (price, quantity,
+        revenue, operating profit, margin percent, BEP units) and the
+        rounded curve rows for charting.
+    """
+    curve = demand if isinstance(demand, tuple) else parse_demand(demand)
+    if not 0 <= min_price < max_price:
+        raise ValueError("Price range needs 0 <= min price < max price")
+    if curve[0] == "elasticity" and min_price <= 0:
+        raise ValueError("elasticity demand needs a positive min price")
+    if steps < 3:
+        raise ValueError("steps must be at least 3")
+
+    step = (max_price - min_price) / (steps - 1)
+    prices = [min_price + i * step for i in range(steps)]
+    columns = _evaluate(curve, prices, variable, fixed)
+
+    optima = {}
+    for key, metric in (("revenue_max", "revenue"), ("profit_max", "operating_profit")):
+        values = columns[metric]
+        best = max(range(steps), key=values.__getitem__)
+        # The optimum lies between the best grid point's neighbours
+        lo, hi = prices[max(best - 1, 0)], prices[min(best + 1, steps - 1)]
+        objective = (lambda p: p * _demand_scalar(curve, p)) if metric == "revenue" else \
+            (lambda p: _demand_scalar(curve, p) * (p - variable))
+        optima[key] = _price_point(curve, _golden_max(objective, lo, hi), variable, fixed)
+
+    curve_rows = [
+        {"price": round(p, 0), "quantity": round(q, 1), "revenue": round(r, 0), "operating_profit": round(o, 0)}
+        for p, q, r, o in zip(*(columns[field] for field in CURVE_FIELDS))
+    ]
+    return {"price_range": [min_price, max_price], "variable": variable, "fixed": fixed,
+            **optima, "curve": curve_rows}
+
+
+def chart_series(result, points=CHART_POINTS):
+    """Labels/values strings for `create_chart.py line` (만원), evenly sampled."""
+    rows = result["curve"]
+    stride = max(1, math.ceil((len(rows) - 1) / (points - 1)))
+    sampled = rows[::stride]
+    if sampled[-1] is not rows[-1]:
+        sampled.append(rows[-1])
+    return {
+        "labels": ",".join(f"{r['price']:.0f}원" for r in sampled),
+        "values": {
+            "매출": ",".join(f"{r['revenue'] / CHART_UNIT:.0f}" for r in sampled),
+            "영업이익": ",".join(f"{r['operating_profit'] / CHART_UNIT:.0f}" for r in sampled),
+        },
+    }
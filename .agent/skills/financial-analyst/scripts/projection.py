@@ -0,0 +1,167 @@
+"""Multi-month cash-flow projection built on calculate_monthly_pl.
+
+Every scenario starts from a month-1 revenue that grows by (growth - churn)
+per month (rounded to whole won), pays a variable cost ratio and fixed costs
+each month exactly as calculate_monthly_pl does, and carries a cash balance.
+All scenarios are evaluated together as scenarios x months arrays through
+monthly_vector (NumPy), or month by month through calculate_monthly_pl
+without NumPy.
+"""
+
+from _defaults import PROJECTION_MONTHS as DEFAULT_MONTHS
+from _vector import numpy
+from _core import calculate_monthly_pl, monthly_vector
+
+SCENARIO_FIELDS = ("revenue", "growth", "churn", "fixed", "variable_rate", "initial_cash")
+TABLE_FIELDS = ("scenario", "month", "revenue", "variable_costs", "fixed_costs",
+                "operating_profit", "cash")
+# create_chart.py plots amounts in 만원
+CHART_UNIT = 10_000
+
+
+def build_scenarios(names=None, **params):
+    """Zip per-field value lists into scenario dicts (length-1 lists broadcast).
+
+    Example:
+        build_scenarios(revenue=[1e7], growth=[0.05, 0.1], churn=[0.08, 0.05],
+                        fixed=[1.5e7], variable_rate=[0.4], initial_cash=[5e7])
+    """
+    lengths = {len(v) for v in params.values() if len(v) != 1}
+    if len(lengths) > 1:
+        raise ValueError("Scenario value lists must have the same length (or length 1)")
+    count = lengths.pop() if lengths else 1
+    names = list(names) if names else [f"S{i}" for i in range(1, count + 1)]
+    if len(names) != count:
+        raise ValueError(f"Expected {count} scenario names (got {len(names)})")
+
+    scenarios = []
+    for i, name in enumerate(names):
+        scenario = {"name": name}
+        for field in SCENARIO_FIELDS:
+            values = params.get(field, [0.0])
+            scenario[field] = values[0] if len(values) == 1 else values[i]
+        scenarios.append(scenario)
+    return scenarios
+
+
+def _series_numpy(scenarios, months):
+    """Monthly revenue/cost/profit/cash arrays of shape (scenarios, months)."""
+    np = numpy()
+    col = lambda field: np.array([float(s.get(field, 0.0)) for s in scenarios])[:, None]  # noqa: E731
+    month_index = np.arange(months)[None, :]
+    revenue = np.round(col("revenue") * (1 + col("growth") - col("churn")) ** month_index, 0)
+    revenue = np.clip(revenue, 0, None)
+    pl, _ = monthly_vector(revenue, col("fixed"), col("variable_rate"))
+    return {
+        "revenue": revenue,
+        "variable_costs": pl["variable_costs"],
+        "fixed_costs": np.broadcast_to(pl["fixed_costs"], revenue.shape),
+        "operating_profit": pl["operating_profit"],
+        "cash": col("initial_cash") + np.cumsum(pl["operating_profit"], axis=1),
+    }
+
+
+def _series_python(scenarios, months):
+    """Same as _series_numpy with one calculate_monthly_pl call per scenario-month."""
+    series = {key: [] for key in ("revenue", "variable_costs", "fixed_costs", "operating_profit", "cash")}
+    for s in scenarios:
+        rows = {key: [] for key in series}
+        cash = s.get("initial_cash", 0.0)
+        net_growth = 1 + s.get("growth", 0.0) - s.get("churn", 0.0)
+        for m in range(months):
+            revenue = max(round(s["revenue"] * net_growth ** m, 0), 0.0)
+            pl = calculate_monthly_pl(revenue, s["fixed"], s["variable_rate"])
+            cash += pl["operating_profit"]
+            rows["revenue"].append(revenue)
+            rows["variable_costs"].append(pl["variable_costs"])
+            rows["fixed_costs"].append(pl["fixed_costs"])
+            rows["operating_profit"].append(pl["operating_profit"])
+            rows["cash"].append(cash)
+        for key in series:
+            series[key].append(rows[key])
+    return series
+
+
+def _first_month(flags):
+    """1-based index of the first True in each row, or None."""
+    np = numpy()
+    if np is not None:
+        hit = flags.any(axis=1)
+        first = flags.argmax(axis=1) + 1
+        return [int(f) if h else None for f, h in zip(first.tolist(), hit.tolist())]
+    return [next((i + 1 for i, flag in enumerate(row) if flag), None) for row in flags]
+
+
+def project_cashflow(scenarios, months=DEFAULT_MONTHS):
+    """Project monthly revenue, costs and cash for many scenarios at once.
+
+    Args:
+        scenarios: list of dicts with name, revenue (month 1), growth, churn
+            (monthly rates), fixed (monthly KRW), variable_rate (0-1) and
+            initial_cash (KRW)
+        months: projection horizon
+
+    Returns:
+        dict with "months" and per-scenario results: monthly series (rounded
+        KRW), bep_month (first month with operating profit > 0, as in
+        calculate_monthly_pl's "profit" status), runway_months (months of
+        cash before the balance turns negative; None when it never does
+        within the horizon) and summary totals.
+    """
+    np = numpy()
+    if months <= 0:
+        raise ValueError("months must be positive")
+    series = (_series_numpy if np is not None else _series_python)(scenarios, months)
+
+    if np is not None:
+        profitable = series["operating_profit"] > 0
+        negative_cash = series["cash"] < 0
+        as_lists = {key: np.round(arr, 0).tolist() for key, arr in series.items()}
+    else:
+        profitable = [[p > 0 for p in row] for row in series["operating_profit"]]
+        negative_cash = [[c < 0 for c in row] for row in series["cash"]]
+        as_lists = {key: [[round(v, 0) for v in row] for row in rows] for key, rows in series.items()}
+
+    bep_months = _first_month(profitable)
+    cash_out_months = _first_month(negative_cash)
+
+    results = []
+    for i, scenario in enumerate(scenarios):
+        scenario_series = {key: rows[i] for key, rows in as_lists.items()}
+        cash_out = cash_out_months[i]
+        results.append({
+            **scenario,
+            "bep_month": bep_months[i],
+            "runway_months": cash_out - 1 if cash_out is not None else None,
+            "ending_cash": scenario_series["cash"][-1],
+            "min_cash": min(scenario_series["cash"]),
+            "total_revenue": round(sum(scenario_series["revenue"]), 0),
+            "total_operating_profit": round(sum(scenario_series["operating_profit"]), 0),
+            "series": scenario_series,
+        })
+    return {"months": list(range(1, months + 1)), "scenarios": results}
+
+
+def iter_table_rows(projection):
+    """Yield one row per scenario-month (long format, TABLE_FIELDS)."""
+    for scenario in projection["scenarios"]:
+        series = scenario["series"]
+        for i, month in enumerate(projection["months"]):
+            yield {
+                "scenario": scenario["name"],
+                "month": month,
+                **{key: series[key][i] for key in TABLE_FIELDS[2:]},
+            }
+
+
+def chart_series(projection, metric="cash"):
+    """Labels/values strings per scenario for `create_chart.py line` (만원)."""
+    labels = ",".join(f"{m}개월" for m in projection["months"])
+    return {
+        "metric": metric,
+        "labels": labels,
+        "values": {
+            s["name"]: ",".join(f"{v / CHART_UNIT:.0f}" for v in s["series"][metric])
+            for s in projection["scenarios"]
+        },
+    }
@@ -0,0 +1,185 @@
+"""Korean tax estimate for a sole proprietor, built on the monthly P&L.
+
+Annualizes calculate_monthly_pl and estimates, per scenario:
+    부가가치세  일반과세: (매출 - 매입) x 10/110
+                간이과세: 매출 x 업종별 부가가치율 x 10% - 매입 x 0.5%
+                (연 매출 4,800만원 미만 납부면제, 8,000만원 미만만 선택 가능)
+    종합소득세  (사업소득 - 소득공제) on the progressive brackets below
+    지방소득세  종합소득세의 10%
+
+Revenue and purchases are VAT-inclusive amounts (what customers pay /
+what suppliers charge); the VAT of the cheaper eligible type is a cost
+before income tax. Many revenue/cost/purchase combinations are evaluated
+at once (NumPy searchsorted over the brackets; bisect without NumPy).
+Figures are estimates per the tax-guide skill (2025 기준), not tax advice.
+"""
+
+import bisect
+import math
+
+from _defaults import BASIC_DEDUCTION, DEFAULT_INDUSTRY, SIMPLIFIED_VALUE_ADDED_RATES
+from _vector import numpy, iter_grid_chunks
+from _core import calculate_monthly_pl, monthly_vector
+
+# 종합소득세 과세표준 upper limit, rate, 누진공제 (2024년 귀속~)
+INCOME_TAX_BRACKETS = (
+    (14_000_000, 0.06, 0),
+    (50_000_000, 0.15, 1_260_000),
+    (88_000_000, 0.24, 5_760_000),
+    (150_000_000, 0.35, 15_440_000),
+    (300_000_000, 0.38, 19_940_000),
+    (500_000_000, 0.40, 25_940_000),
+    (1_000_000_000, 0.42, 35_940_000),
+    (math.inf, 0.45, 65_940_000),
+)
+BRACKET_LIMITS = [limit for limit, _, _ in INCOME_TAX_BRACKETS]
+LOCAL_INCOME_TAX_RATE = 0.10
+
+VAT_RATE = 0.10
+SIMPLIFIED_PURCHASE_CREDIT = 0.005
+SIMPLIFIED_THRESHOLD = 80_000_000
+SIMPLIFIED_EXEMPT_THRESHOLD = 48_000_000
+
+FIELDS = ("monthly_revenue", "fixed_costs", "variable_rate", "monthly_purchases", "annual_revenue",
+          "annual_operating_profit", "vat_general", "vat_simplified", "vat_type", "vat_payable",
+          "taxable_income", "income_tax", "local_income_tax", "total_tax", "after_tax_profit")
+
+
+def _floor(value):
+    return float(math.floor(value))
+
+
+def income_tax(base):
+    """종합소득세 on a 과세표준 (whole won, truncated)."""
+    if base <= 0:
+        return 0.0
+    _, rate, deduction = INCOME_TAX_BRACKETS[bisect.bisect_left(BRACKET_LIMITS, base)]
+    return _floor(base * rate - deduction)
+
+
+def income_tax_vector(base):
+    """income_tax over a NumPy array of 과세표준."""
+    np = numpy()
+    index = np.searchsorted(np.asarray(BRACKET_LIMITS), base, side="left")
+    rates = np.asarray([rate for _, rate, _ in INCOME_TAX_BRACKETS])[index]
+    deductions = np.asarray([d for _, _, d in INCOME_TAX_BRACKETS], dtype=float)[index]
+    return np.where(base > 0, np.floor(base * rates - deductions), 0)
+
+
+def _vat(annual_revenue, annual_purchases, value_added_rate, floor, where):
+    """General and simplified VAT for annual VAT-inclusive sales/purchases."""
+    general = floor((annual_revenue - annual_purchases) * VAT_RATE / (1 + VAT_RATE))
+    simplified = annual_revenue * value_added_rate * VAT_RATE - annual_purchases * SIMPLIFIED_PURCHASE_CREDIT
+    simplified = where(annual_revenue < SIMPLIFIED_EXEMPT_THRESHOLD, 0, floor(simplified))
+    simplified = where(simplified > 0, simplified, 0)
+    return general, simplified
+
+
+def _scalar_row(revenue, fixed, variable_rate, purchases, value_added_rate, deductions, months):
+    pl = calculate_monthly_pl(revenue, fixed, variable_rate)
+    purchases = pl["variable_costs"] if purchases is None else purchases
+    annual_revenue = revenue * months
+    general, simplified = _vat(annual_revenue, purchases * months, value_added_rate,
+                               _floor, lambda cond, a, b: a if cond else b)
+    eligible = annual_revenue < SIMPLIFIED_THRESHOLD
+    use_simplified = eligible and simplified < general
+    vat = simplified if use_simplified else general
+    operating = pl["operating_profit"] * months
+    taxable = max(operating - vat - deductions, 0.0)
+    tax = income_tax(taxable)
+    local = _floor(tax * LOCAL_INCOME_TAX_RATE)
+    return {
+        "monthly_revenue": revenue,
+        "fixed_costs": fixed,
+        "variable_rate": variable_rate,
+        "monthly_purchases": purchases,
+        "annual_revenue": annual_revenue,
+        "annual_operating_profit": operating,
+        "vat_general": general,
+        "vat_simplified": simplified if eligible else None,
+        "vat_type": "간이" if use_simplified else "일반",
+        "vat_payable": vat,
+        "taxable_income": taxable,
+        "income_tax": tax,
+        "local_income_tax": local,
+        "total_tax": vat + tax + local,
+        "after_tax_profit": operating - vat - tax - local,
+    }
+
+
+def _vector_rows(chunk, value_added_rate, deductions, months):
+    np = numpy()
+    revenue, fixed, variable_rate = chunk["revenue"], chunk["fixed"], chunk["variable_rate"]
+    pl, _ = monthly_vector(revenue, fixed, variable_rate)
+    purchases = chunk["purchases"] if "purchases" in chunk else pl["variable_costs"]
+    annual_revenue = revenue * months
+    general, simplified = _vat(annual_revenue, purchases * months, value_added_rate, np.floor, np.where)
+    eligible = annual_revenue < SIMPLIFIED_THRESHOLD
+    use_simplified = eligible & (simplified < general)
+    vat = np.where(use_simplified, simplified, general)
+    operating = pl["operating_profit"] * months
+    taxable = np.maximum(operating - vat - deductions, 0)
+    tax = income_tax_vector(taxable)
+    local = np.floor(tax * LOCAL_INCOME_TAX_RATE)
+    columns = {
+        "monthly_revenue": revenue,
+        "fixed_costs": fixed,
+        "variable_rate": variable_rate,
+        "monthly_purchases": purchases,
+        "annual_revenue": annual_revenue,
+        "annual_operating_profit": operating,
+        "vat_general": general,
+        "vat_simplified": simplified,
+        "vat_type": np.where(use_simplified, "간이", "일반"),
+        "vat_payable": vat,
+        "taxable_income": taxable,
+        "income_tax": tax,
+        "local_income_tax": local,
+        "total_tax": vat + tax + local,
+        "after_tax_profit": operating - vat - tax - local,
+    }
+    lists = {name: col.tolist() for name, col in columns.items()}
+    for i, is_eligible in enumerate(eligible.tolist()):
+        row = {name: values[i] for name, values in lists.items()}
+        if not is_eligible:
+            row["vat_simplified"] = None
+        yield row
+
+
+def estimate_taxes(revenue, fixed, variable_rate, purchases=None, industry=DEFAULT_INDUSTRY,
+                   deductions=BASIC_DEDUCTION, months=12):
+    """Estimate VAT, income tax and take-home profit over every input combination.
+
+    Args:
+        revenue, fixed, variable_rate: value lists for calculate_monthly_pl
+            (monthly KRW, VAT-inclusive revenue)
+        purchases: monthly VAT-inclusive purchases with tax invoices (value
+            list); defaults to each scenario's variable costs
+        industry: key of SIMPLIFIED_VALUE_ADDED_RATES for 간이과세
+        deductions: 소득공제 subtracted from business income
+        months: months annualized (12 = a full year)
+
+    Yields:
+        one row per combination (last axis varies fastest; FIELDS order).
+        vat_simplified is None where 간이과세 is not available (annual
+        revenue >= SIMPLIFIED_THRESHOLD); vat_type is the cheaper eligible
+        type, whose VAT is deducted before income tax.
+    """
+    np = numpy()
+    if industry not in SIMPLIFIED_VALUE_ADDED_RATES:
+        raise ValueError(f"Unknown industry '{industry}' (use {', '.join(SIMPLIFIED_VALUE_ADDED_RATES)})")
+    if months <= 0:
+        raise ValueError("months must be positive")
+    value_added_rate = SIMPLIFIED_VALUE_ADDED_RATES[industry]
+    axes = {"revenue": list(revenue), "fixed": list(fixed), "variable_rate": list(variable_rate)}
+    if purchases is not None:
+        axes["purchases"] = list(purchases)
+
+    for chunk in iter_grid_chunks(axes):
+        if np is not None:
+            yield from _vector_rows(chunk, value_added_rate, deductions, months)
+            continue
+        columns = [chunk[name] for name in axes]
+        for values in zip(*columns):
+            args = values if purchases is not None else (*values, None)
+            yield _scalar_row(*args, value_added_rate, deductions, months)
@@ -15,129 +15,64 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# 공통 스캔 엔진은 .agent/skills/scripts/_portfolio.py (대시보드 스크립트와 공유)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "scripts"))
+import _portfolio
+
 
 class ProgressTracker:
     """사업 기획 진행률 추적기"""
 
     # Stage 0 (조건부) + 8단계 기획 프로세스 정의
+    # (단계 판정 키워드는 _portfolio.STAGE_RULES)
     STAGE_0 = {
         "id": 0,
-        "name": "아이디어 발굴",
+        "name": _portfolio.STAGE_NAMES[0],
         "directory": "output/ideas",
-        "keywords": ["idea", "아이디어", "selected"],
     }
 
     STAGES = [
         {
-            "id": 1,
-            "name": "시장 조사",
-            "directory": "output/research",
-            "keywords": ["시장", "market"],
-        },
-        {
-            "id": 2,
-            "name": "경쟁 분석",
-            "directory": "output/research",
-            "keywords": ["경쟁", "competitor"],
-        },
-        {
-            "id": 3,
-            "name": "제품/원가",
-            "directory": "output/financials",
-            "keywords": ["원가", "menu", "costing"],
-        },
-        {
-            "id": 4,
-            "name": "재무 모델",
-            "directory": "output/financials",
-            "keywords": ["재무", "financial", "손익"],
-        },
-        {
-            "id": 5,
-            "name": "운영 계획",
-            "directory": "output/reports",
-            "keywords": ["운영", "operation"],
-        },
-        {
-            "id": 6,
-            "name": "브랜딩",
-            "directory": "output/reports",
-            "keywords": ["브랜딩", "brand", "마케팅"],
-        },
-        {
-            "id": 7,
-            "name": "법률/인허가",
-            "directory": "output/reports",
-            "keywords": ["법률", "legal", "인허가"],
-        },
-        {
-            "id": 8,
-            "name": "사업계획서",
-            "directory": "output/reports",
-            "keywords": ["사업계획", "business-plan"],
-        },
+            "id": stage_id,
+            "name": _portfolio.STAGE_NAMES[stage_id],
+            "directory": f"output/{folder}",
+        }
+        for stage_id, folder, _ in _portfolio.STAGE_RULES
     ]
 
     # Idea-local stage definitions (directory relative to idea folder)
-    IDEA_STAGE_0_FILES = ["hypothesis.md", "evaluation.md", "existing-alternatives.md"]
+    IDEA_STAGE_0_FILES = list(_portfolio.IDEA_STAGE_0_FILES)
 
     IDEA_STAGES = [
         {
-            "id": 1,
-            "name": "시장 조사",
-            "directory": "research",
-            "keywords": ["시장", "market"],
-        },
-        {
-            "id": 2,
-            "name": "경쟁 분석",
-            "directory": "research",
-            "keywords": ["경쟁", "competitor"],
-        },
-        {
-            "id": 3,
-            "name": "제품/원가",
-            "directory": "financials",
-            "keywords": ["원가", "menu", "costing"],
-        },
-        {
-            "id": 4,
-            "name": "재무 모델",
-            "directory": "financials",
-            "keywords": ["재무", "financial", "손익"],
-        },
-        {
-            "id": 5,
-            "name": "운영 계획",
-            "directory": "reports",
-            "keywords": ["운영", "operation"],
-        },
-        {
-            "id": 6,
-            "name": "브랜딩",
-            "directory": "reports",
-            "keywords": ["브랜딩", "brand", "마케팅"],
-        },
-        {
-            "id": 7,
-            "name": "법률/인허가",
-            "directory": "reports",
-            "keywords": ["법률", "legal", "인허가"],
-        },
-        {
-            "id": 8,
-            "name": "사업계획서",
-            "directory": "reports",
-            "keywords": ["사업계획", "business-plan"],
-        },
+            "id": stage_id,
+            "name": _portfolio.STAGE_NAMES[stage_id],
+            "directory": folder,
+        }
+        for stage_id, folder, _ in _portfolio.STAGE_RULES
     ]
 
-    def __init__(self, project_dir: str):
+    def __init__(self, project_dir: str, snapshot=None):
         """
         Args:
             project_dir: 프로젝트 루트 디렉토리 경로
+            snapshot: 이미 스캔한 output/ (_portfolio.scan_outputs 결과).
+                생략하면 처음 필요할 때 한 번 스캔합니다.
         """
         self.project_dir = Path(project_dir).resolve()
+        self._snapshot = snapshot
+
+    @property
+    def snapshot(self):
+        """output/ 디렉토리 스캔 결과 (프로세스당 한 번만 스캔)"""
+        if self._snapshot is None:
+            self._snapshot = _portfolio.scan_outputs(self.project_dir / "output")
+        return self._snapshot
+
+    def _project_paths(self, entries, root) -> List[str]:
+        """스캔 결과의 파일 경로(root 기준)를 프로젝트 기준 경로로 바꿉니다."""
+        prefix = os.path.relpath(root, self.project_dir)
+        return [os.path.join(prefix, entry.path) for entry in entries]
 
     def check_stage(self, stage: Dict) -> Tuple[bool, List[str]]:
         """
@@ -149,22 +84,8 @@ class ProgressTracker:
         Returns:
             (완료 여부, 발견된 파일 리스트)
         """
-        directory = self.project_dir / stage["directory"]
-
-        if not directory.exists():
-            return False, []
-
-        found_files = []
-        keywords = stage["keywords"]
-
-        # 디렉토리 내 모든 파일 검색
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                filename_lower = file_path.name.lower()
-                # 키워드 매칭
-                if any(keyword.lower() in filename_lower for keyword in keywords):
-                    found_files.append(str(file_path.relative_to(self.project_dir)))
-
+        snapshot = self.snapshot
+        found_files = self._project_paths(snapshot.stage_files[stage["id"]], snapshot.root)
         return len(found_files) > 0, found_files
 
     def has_ideas(self) -> bool:
@@ -174,13 +95,7 @@ class ProgressTracker:
         Returns:
             아이디어 파일 존재 여부
         """
-        ideas_dir = self.project_dir / "output" / "ideas"
-        if not ideas_dir.exists():
-            return False
-        for file_path in ideas_dir.rglob("*"):
-            if file_path.is_file() and file_path.name != ".gitkeep":
-                return True
-        return False
+        return len(self.snapshot.category(_portfolio.IDEAS_DIR)) > 0
 
     def check_all_stages(self) -> Dict:
         """
@@ -332,15 +247,7 @@ class ProgressTracker:
         Returns:
             idea.json이 존재하는 디렉토리 Path 리스트 (이름순 정렬)
         """
-        ideas_root = self.project_dir / "output" / "ideas"
-        if not ideas_root.exists():
-            return []
-
-        idea_dirs = []
-        for child in sorted(ideas_root.iterdir()):
-            if child.is_dir() and (child / "idea.json").exists():
-                idea_dirs.append(child)
-        return idea_dirs
+        return [idea.path for idea in self.snapshot.ideas]
 
     # v2.0 judgment badge mapping
     JUDGMENT_BADGES = {
@@ -352,56 +259,44 @@ class ProgressTracker:
         "pivot": "🔄 Pivot",
     }
 
-    def _load_idea_meta(self, idea_dir: Path) -> Dict:
+    def _load_idea_meta(self, idea) -> Dict:
         """
-        idea.json을 읽어 메타 정보를 반환합니다.
+        스캔된 아이디어의 idea.json 메타 정보를 반환합니다.
         파싱 실패 시 기본값을 반환합니다.
         v2.0 필드가 있으면 검증하고 없는 필드는 경고만 출력합니다.
         """
-        meta_path = idea_dir / "idea.json"
         defaults = {
-            "id": idea_dir.name,
-            "name": idea_dir.name,
+            "id": idea.name,
+            "name": idea.name,
             "created": "",
             "status": "",
             "score": None,
         }
-        try:
-            with open(meta_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for key in defaults:
-                if key not in data:
-                    data[key] = defaults[key]
-            # v2.0 field validation
-            if data.get("workflow_version") == "2.0":
-                v2_fields = ["kill_switch", "psst_mapping", "founder_fit_reason", "current_alternatives"]
-                for field in v2_fields:
-                    if field not in data:
-                        print(f"⚠️  v2.0 필드 누락 ({idea_dir.name}): {field}", file=sys.stderr)
-            return data
-        except (json.JSONDecodeError, OSError):
+        if idea.data is None:
             return defaults
-
-    def _check_idea_stage_local(
-        self, idea_dir: Path, stage: Dict
-    ) -> Tuple[bool, List[str]]:
-        """
-        아이디어 폴더 내부에서 특정 단계의 완료 여부를 확인합니다.
-        """
-        directory = idea_dir / stage["directory"]
-        if not directory.exists():
-            return False, []
-
-        found_files = []
-        keywords = stage["keywords"]
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                filename_lower = file_path.name.lower()
-                if any(kw.lower() in filename_lower for kw in keywords):
-                    found_files.append(
-                        str(file_path.relative_to(self.project_dir))
-                    )
-        return len(found_files) > 0, found_files
+        data = dict(idea.data)
+        for key in defaults:
+            if key not in data:
+                data[key] = defaults[key]
+        # v2.0 field validation
+        if data.get("workflow_version") == "2.0":
+            v2_fields = ["kill_switch", "psst_mapping", "founder_fit_reason", "current_alternatives"]
+            for field in v2_fields:
+                if field not in data:
+                    print(f"⚠️  v2.0 필드 누락 ({idea.name}): {field}", file=sys.stderr)
+        return data
+
+    def _scan_idea(self, idea_dir: Path):
+        """
+        아이디어 폴더의 스캔 결과를 반환합니다.
+        output/ 스캔 결과가 있으면 재사용하고, 없으면 해당 폴더만 스캔합니다.
+        """
+        idea_dir = Path(idea_dir).resolve()
+        if self._snapshot is not None:
+            for idea in self._snapshot.ideas:
+                if idea.path == idea_dir:
+                    return idea
+        return _portfolio.scan_idea(idea_dir)
 
     def check_idea_stages(self, idea_dir: Path) -> Dict:
         """
@@ -413,44 +308,27 @@ class ProgressTracker:
         Returns:
             아이디어 진행률 딕셔너리
         """
-        meta = self._load_idea_meta(idea_dir)
-        stages: List[Dict] = []
-        completed_count = 0
+        return self._idea_progress(self._scan_idea(idea_dir))
 
-        # Stage 0: hypothesis.md or evaluation.md
-        stage0_files = []
-        for fname in self.IDEA_STAGE_0_FILES:
-            fpath = idea_dir / fname
-            if fpath.exists():
-                stage0_files.append(str(fpath.relative_to(self.project_dir)))
-        stage0_done = len(stage0_files) > 0
-        if stage0_done:
-            completed_count += 1
-        stages.append({
-            "id": 0,
-            "name": "아이디어 발굴",
-            "completed": stage0_done,
-            "files": stage0_files,
-        })
-
-        # Stages 1-8
-        for stage_def in self.IDEA_STAGES:
-            is_done, files = self._check_idea_stage_local(idea_dir, stage_def)
-            if is_done:
-                completed_count += 1
+    def _idea_progress(self, idea) -> Dict:
+        """스캔된 아이디어(_portfolio.Idea)의 진행률 딕셔너리를 만듭니다."""
+        root = idea.path.parent.parent
+        stages: List[Dict] = []
+        for stage_id, name in enumerate(_portfolio.STAGE_NAMES):
             stages.append({
-                "id": stage_def["id"],
-                "name": stage_def["name"],
-                "completed": is_done,
-                "files": files,
+                "id": stage_id,
+                "name": name,
+                "completed": idea.stages[stage_id],
+                "files": self._project_paths(idea.stage_files[stage_id], root),
             })
 
-        total = 9  # Stage 0 + 8 stages
+        completed_count = sum(idea.stages)
+        total = _portfolio.TOTAL_STAGES  # Stage 0 + 8 stages
         percentage = (completed_count / total * 100) if total > 0 else 0
 
         return {
-            "idea_dir": str(idea_dir.relative_to(self.project_dir)),
-            "meta": meta,
+            "idea_dir": str(idea.path.relative_to(self.project_dir)),
+            "meta": self._load_idea_meta(idea),
             "total_stages": total,
             "completed_stages": completed_count,
             "percentage": round(percentage, 1),
@@ -464,12 +342,11 @@ class ProgressTracker:
         Returns:
             포트폴리오 딕셔너리
         """
-        idea_dirs = self.discover_ideas()
         ideas = []
         status_counts: Dict[str, int] = {}
 
-        for idea_dir in idea_dirs:
-            idea_progress = self.check_idea_stages(idea_dir)
+        for idea in self.snapshot.ideas:
+            idea_progress = self._idea_progress(idea)
             ideas.append(idea_progress)
             # v2.0: prefer judgment field; fall back to status for v1.0 compat
             judgment = idea_progress["meta"].get("judgment") or idea_progress["meta"].get("status") or ""
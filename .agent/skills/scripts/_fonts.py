@@ -0,0 +1,130 @@
+"""Korean font resolution for the matplotlib chart scripts.
+
+The first chart on a machine looks the candidate fonts up in matplotlib's
+font list (then in the system font files, for fonts installed after that
+list was built) and stores the chosen font file and the matplotlib
+version in korean-font.json in matplotlib's cache directory. Later runs
+register that file directly with font_manager.addfont, without probing
+or warnings. A missing font file or a different matplotlib version
+triggers a fresh lookup. Only a found font is stored, so without one every
+run looks again and picks up a font as soon as it is installed; delete the
+cache file to switch to a newly installed font listed earlier in
+KOREAN_FONTS.
+
+matplotlib is imported only when a font is actually set up.
+"""
+
+import json
+import os
+
+KOREAN_FONTS = ("AppleGothic", "NanumGothic", "Malgun Gothic", "NanumBarunGothic", "Noto Sans CJK KR")
+# Font file names for fonts missing from matplotlib's font list
+KOREAN_FONT_FILES = {
+    "applegothic.ttf": "AppleGothic",
+    "nanumgothic.ttf": "NanumGothic",
+    "malgun.ttf": "Malgun Gothic",
+    "nanumbarungothic.ttf": "NanumBarunGothic",
+    "notosanscjk-regular.ttc": "Noto Sans CJK KR",
+    "notosanscjkkr-regular.otf": "Noto Sans CJK KR",
+}
+CACHE_FILE = "korean-font.json"
+
+_configured = False
+_font_name = None
+
+
+def _cache_path():
+    import matplotlib
+    return os.path.join(matplotlib.get_cachedir(), CACHE_FILE)
+
+
+def _read_cache(version):
+    try:
+        with open(_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("matplotlib") != version:
+        return None
+    path = data.get("path")
+    if not path or not os.path.exists(path):
+        return None
+    return data
+
+
+def _write_cache(version, name, path):
+    try:
+        cache = _cache_path()
+        tmp = cache + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"matplotlib": version, "name": name, "path": path}, f, ensure_ascii=False)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+
+
+def _probe():
+    """Find (name, path) of the first available Korean font, or (None, None)."""
+    import matplotlib.font_manager as fm
+
+    known = {}
+    for entry in fm.fontManager.ttflist:
+        known.setdefault(entry.name, entry.fname)
+    for name in KOREAN_FONTS:
+        if name in known:
+            return name, known[name]
+
+    found = {}
+    for path in fm.findSystemFonts():
+        name = KOREAN_FONT_FILES.get(os.path.basename(path).lower())
+        if name:
+            found.setdefault(name, path)
+    for name in KOREAN_FONTS:
+        if name in found:
+            return name, found[name]
+    return None, None
+
+
+def resolve_korean_font():
+    """Return (family name, font file) of a usable Korean font, or (None, None).
+
+    Uses the cache file when it matches the installed matplotlib version;
+    a lookup that finds no font is not cached.
+    """
+    import matplotlib
+
+    cached = _read_cache(matplotlib.__version__)
+    if cached is not None:
+        return cached.get("name"), cached.get("path")
+    name, path = _probe()
+    if path is not None:
+        _write_cache(matplotlib.__version__, name, path)
+    return name, path
+
+
+def setup_korean_font():
+    """Register and select the Korean font for matplotlib (once per process).
+
+    Returns:
+        the font family name, or None if no Korean font is available
+    """
+    global _configured, _font_name
+    if _configured:
+        return _font_name
+    _configured = True
+
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    name, path = resolve_korean_font()
+    if path is None:
+        return None
+    try:
+        fm.fontManager.addfont(path)
+        name = fm.FontProperties(fname=path).get_name()
+    except (OSError, RuntimeError, ValueError):
+        return None
+    matplotlib.rcParams["font.family"] = name
+    matplotlib.rcParams["axes.unicode_minus"] = False
+    _font_name = name
+    return name
@@ -0,0 +1,263 @@
+"""Single-pass scan of the output/ tree for the progress and dashboard scripts.
+
+scan_outputs() walks output/ once and returns a read-only Snapshot: every
+deliverable file (path, size, mtime), the idea folders with their idea.json
+data, and the completion flags of stages 0-8 per idea and for the whole
+project. check_progress.py, create_outputs_dashboard.py and
+create_portfolio_dashboard.py all judge stages with STAGE_RULES below, so
+they agree, and one process can scan once and hand the same snapshot to
+each of them:
+
+    snapshot = scan_outputs(project_root / "output")
+    outputs_html = create_outputs_dashboard.generate_html(output_dir, snapshot=snapshot)
+    create_portfolio_dashboard.generate_html(snapshot.idea_records(), path, snapshot)
+    ProgressTracker(project_root, snapshot).check_portfolio()
+
+Stage rules: a stage is done when a file in its folder (output/<folder>/
+or <idea>/<folder>/, any depth) has one of the keywords in its lowercased
+name. Stage 0 is done for an idea with hypothesis.md, evaluation.md or
+existing-alternatives.md, and for the project when output/ideas/ holds an
+idea (a file named like STAGE_0_KEYWORDS). A project stage is also done
+when any idea has done it.
+
+Hidden directories (e.g. the exporter's .chart-cache) and IGNORED_FILES are
+skipped. refresh() updates a snapshot for a few files a build step wrote
+without walking the tree again. Snapshots pickle (for process pools) as
+plain dicts and are read-only again once unpickled.
+"""
+
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+from types import MappingProxyType
+
+STAGE_NAMES = ("아이디어 발굴", "시장 조사", "경쟁 분석", "제품/원가", "재무 모델",
+               "운영 계획", "브랜딩", "법률/인허가", "사업계획서")
+TOTAL_STAGES = len(STAGE_NAMES)  # 9 (0-8)
+
+# Stages 1-8: (id, folder, filename keywords)
+STAGE_RULES = (
+    (1, "research", ("시장", "market", "tam")),
+    (2, "research", ("경쟁", "competitor")),
+    (3, "financials", ("원가", "cost", "menu")),
+    (4, "financials", ("재무", "financial", "손익", "projection")),
+    (5, "reports", ("운영", "operation")),
+    (6, "reports", ("브랜딩", "brand", "마케팅")),
+    (7, "reports", ("법률", "legal", "인허가")),
+    (8, "reports", ("사업계획", "business-plan")),
+)
+IDEA_STAGE_0_FILES = ("hypothesis.md", "evaluation.md", "existing-alternatives.md")
+STAGE_0_KEYWORDS = ("idea", "아이디어", "selected")
+
+IDEAS_DIR = "ideas"
+IDEA_FILE = "idea.json"
+IGNORED_FILES = frozenset({".gitkeep", ".DS_Store", "dashboard.html"})
+
+# path is relative to the snapshot root (output/), with os.sep separators
+FileEntry = namedtuple("FileEntry", "path name size mtime")
+
+
+class Idea(namedtuple("Idea", "name path data files stages stage_files")):
+    """One idea folder: name, absolute Path, idea.json data (read-only
+    mapping, None if unreadable), its files, and per stage (0-8) a done
+    flag and the matching files."""
+
+    __slots__ = ()
+
+    def __new__(cls, name, path, data, files, stages, stage_files):
+        if isinstance(data, dict):
+            data = MappingProxyType(data)
+        return super().__new__(cls, name, path, data, files, stages, stage_files)
+
+    def __getnewargs__(self):
+        data = None if self.data is None else dict(self.data)
+        return (self.name, self.path, data, self.files, self.stages, self.stage_files)
+
+    def record(self):
+        """idea.json data plus dir_path (a new dict, as _shared.load_ideas returns)."""
+        return dict(self.data, dir_path=str(self.path))
+
+
+class Snapshot(namedtuple("Snapshot", "root files categories ideas stages stage_files")):
+    """The scanned output/ tree: root Path, all files, files by top-level
+    folder ("" for files directly in root), ideas (folders with idea.json,
+    by name) and the project-level stage flags and matching files."""
+
+    __slots__ = ()
+
+    def __new__(cls, root, files, categories, ideas, stages, stage_files):
+        if isinstance(categories, dict):
+            categories = MappingProxyType(categories)
+        return super().__new__(cls, root, files, categories, ideas, stages, stage_files)
+
+    def __getnewargs__(self):
+        return (self.root, self.files, dict(self.categories), self.ideas,
+                self.stages, self.stage_files)
+
+    def category(self, folder):
+        """Files under output/<folder>/ (empty tuple if none)."""
+        return self.categories.get(folder, ())
+
+    def find_idea(self, name):
+        """The Idea for an idea folder name, or None."""
+        for idea in self.ideas:
+            if idea.name == name:
+                return idea
+        return None
+
+    def idea_records(self):
+        """Dicts of the ideas with readable idea.json (see Idea.record)."""
+        return [idea.record() for idea in self.ideas if idea.data is not None]
+
+
+def _walk(root):
+    """Yield a FileEntry for every deliverable file under root."""
+    prefix = len(os.path.join(root, ""))
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name in IGNORED_FILES:
+                continue
+            full = os.path.join(dirpath, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            yield FileEntry(full[prefix:], name, st.st_size, st.st_mtime)
+
+
+def _has_keyword(name, keywords):
+    name = name.lower()
+    return any(keyword in name for keyword in keywords)
+
+
+def _match_stages(entries, depth):
+    """Stage 1-8 matches of files whose folder is path part `depth`.
+
+    Returns a list of 9 lists of FileEntry (index 0 left empty).
+    """
+    matches = [[] for _ in range(TOTAL_STAGES)]
+    for entry in entries:
+        parts = entry.path.split(os.sep)
+        if len(parts) <= depth + 1:
+            continue
+        folder = parts[depth]
+        for stage_id, stage_folder, keywords in STAGE_RULES:
+            if folder == stage_folder and _has_keyword(entry.name, keywords):
+                matches[stage_id].append(entry)
+    return matches
+
+
+def _read_idea_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (ValueError, OSError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _build_idea(path, files):
+    """Idea for the folder at path from its files (paths like ideas/<name>/...)."""
+    matches = _match_stages(files, 2)
+    matches[0] = [f for f in files
+                  if f.name in IDEA_STAGE_0_FILES and f.path.count(os.sep) == 2]
+    return Idea(
+        name=path.name,
+        path=path,
+        data=_read_idea_file(path / IDEA_FILE),
+        files=tuple(files),
+        stages=tuple(bool(m) for m in matches),
+        stage_files=tuple(tuple(m) for m in matches),
+    )
+
+
+def _sort_key(entry):
+    return entry.path.split(os.sep)
+
+
+def scan_outputs(output_dir):
+    """Walk output_dir once and return its Snapshot (empty if it does not exist)."""
+    root = Path(output_dir).resolve()
+    files = sorted(_walk(str(root)), key=_sort_key) if root.is_dir() else []
+    return _build_snapshot(root, files)
+
+
+def _build_snapshot(root, files, reuse=None):
+    """Snapshot of root from its sorted files; ideas in reuse (by name) are kept as is."""
+    reuse = reuse or {}
+    categories = {}
+    idea_files = {}
+    for entry in files:
+        parts = entry.path.split(os.sep)
+        top = parts[0] if len(parts) > 1 else ""
+        categories.setdefault(top, []).append(entry)
+        if top == IDEAS_DIR and len(parts) > 2:
+            idea_files.setdefault(parts[1], []).append(entry)
+
+    ideas = tuple(
+        reuse.get(name) or _build_idea(root / IDEAS_DIR / name, entries)
+        for name, entries in sorted(idea_files.items())
+        if any(e.name == IDEA_FILE and e.path.count(os.sep) == 2 for e in entries)
+    )
+
+    matches = _match_stages(files, 0)
+    matches[0] = [e for e in categories.get(IDEAS_DIR, ())
+                  if _has_keyword(e.name, STAGE_0_KEYWORDS)]
+    for idea in ideas:
+        for stage_id in range(1, TOTAL_STAGES):
+            matches[stage_id].extend(idea.stage_files[stage_id])
+
+    return Snapshot(
+        root=root,
+        files=tuple(files),
+        categories={k: tuple(v) for k, v in categories.items()},
+        ideas=ideas,
+        stages=tuple(bool(m) for m in matches),
+        stage_files=tuple(tuple(m) for m in matches),
+    )
+
+
+def refresh(snapshot, paths):
+    """Snapshot with the given files (absolute, or relative to its root) re-read.
+
+    For files a build step wrote, updated or deleted: only those are
+    stat'ed, and ideas whose folder holds none of them are reused.
+    """
+    root = snapshot.root
+    changed = {}
+    for path in paths:
+        rel = os.path.relpath(os.path.join(root, path), root)
+        parts = rel.split(os.sep)
+        if rel.startswith(os.pardir) or any(p.startswith(".") for p in parts[:-1]):
+            continue
+        entry = None
+        if parts[-1] not in IGNORED_FILES:
+            try:
+                st = os.stat(os.path.join(root, rel))
+                entry = FileEntry(rel, parts[-1], st.st_size, st.st_mtime)
+            except OSError:
+                pass
+        changed[rel] = entry
+    if not changed:
+        return snapshot
+
+    files = [changed.get(e.path, e) for e in snapshot.files]
+    known = {e.path for e in snapshot.files}
+    files.extend(e for p, e in changed.items() if p not in known)
+    files = sorted((e for e in files if e is not None), key=_sort_key)
+
+    touched = {p.split(os.sep)[1] for p in changed
+               if p.startswith(IDEAS_DIR + os.sep) and p.count(os.sep) >= 2}
+    reuse = {idea.name: idea for idea in snapshot.ideas if idea.name not in touched}
+    return _build_snapshot(root, files, reuse)
+
+
+def scan_idea(idea_dir):
+    """Scan a single idea folder (paths relative to its output/ root, like scan_outputs)."""
+    idea_dir = Path(idea_dir).resolve()
+    files = sorted(_walk(str(idea_dir)), key=_sort_key) if idea_dir.is_dir() else []
+    prefix = os.path.join(IDEAS_DIR, idea_dir.name)
+    files = [e._replace(path=os.path.join(prefix, e.path)) for e in files]
+    return _build_idea(idea_dir, files)
@@ -0,0 +1,50 @@
+"""Deferred matplotlib loading for the PNG chart paths.
+
+The chart scripts import only this module at startup, so --help, argument
+errors, the ASCII output and SVG charts never load matplotlib or NumPy
+(about 0.5-1 s). The first PNG chart in a process imports matplotlib's
+object-oriented API (Figure + Agg canvas, no pyplot state) and sets up the
+Korean font; later charts reuse both.
+"""
+
+from types import SimpleNamespace
+
+INSTALL_HINT = "pip install matplotlib"
+
+_modules = None
+
+
+def load():
+    """Import matplotlib (and NumPy, which it requires) once per process.
+
+    Returns:
+        namespace with Figure, FigureCanvasAgg, np and font (the Korean font
+        family in use, or None)
+
+    Raises:
+        ImportError: matplotlib is not installed
+    """
+    global _modules
+    if _modules is None:
+        import numpy as np
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        from _fonts import setup_korean_font
+        _modules = SimpleNamespace(Figure=Figure, FigureCanvasAgg=FigureCanvasAgg, np=np,
+                                   font=setup_korean_font())
+    return _modules
+
+
+def new_figure(figsize, **subplot_kw):
+    """A new Figure (with its Agg canvas) and one Axes; nothing is registered with pyplot."""
+    mpl = load()
+    figure = mpl.Figure(figsize=figsize)
+    mpl.FigureCanvasAgg(figure)
+    return figure, figure.add_subplot(**subplot_kw)
+
+
+def save(figure, path):
+    """Lay out and write the figure as the chart scripts' 150 dpi PNG."""
+    figure.tight_layout()
+    figure.savefig(path, dpi=150, bbox_inches='tight')
@@ -0,0 +1,315 @@
+"""Standard-library SVG charts (--format svg).
+
+Bar, line, pie, radar and scatter charts drawn as plain SVG markup with the
+colors and labels of the matplotlib versions, for embedding in the HTML
+dashboards and exported reports without importing matplotlib. Text is
+left to the viewer's fonts, preferring the Korean fonts the matplotlib
+charts use. Each chart function returns the SVG document as a string.
+"""
+
+import math
+from html import escape
+
+from _fonts import KOREAN_FONTS
+
+COLORS = ['#4285F4', '#EA4335', '#FBBC05', '#34A853', '#FF6D01', '#46BDC6']
+FONT_FAMILY = ", ".join(f"'{name}'" for name in KOREAN_FONTS) + ", 'Apple SD Gothic Neo', sans-serif"
+TEXT_COLOR = "#222"
+AXIS_COLOR = "#444"
+GRID_COLOR = "#b0b0b0"
+
+
+def _fmt(value):
+    """Coordinate/number for an attribute (at most two decimals)."""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+class SvgDocument:
+    """Accumulates SVG elements; str(doc) is the complete document."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.parts = []
+
+    @staticmethod
+    def _attrs(attrs):
+        items = []
+        for key, value in attrs.items():
+            if value is None:
+                continue
+            if isinstance(value, float):
+                value = _fmt(value)
+            items.append(f'{key.rstrip("_").replace("_", "-")}="{escape(str(value))}"')
+        return " ".join(items)
+
+    def add(self, tag, content=None, **attrs):
+        attrs = self._attrs(attrs)
+        if content is None:
+            self.parts.append(f"<{tag} {attrs}/>")
+        else:
+            self.parts.append(f"<{tag} {attrs}>{content}</{tag}>")
+
+    def rect(self, x, y, width, height, fill, opacity=None, **attrs):
+        self.add("rect", x=float(x), y=float(y), width=float(max(width, 0)), height=float(max(height, 0)),
+                 fill=fill, fill_opacity=opacity, **attrs)
+
+    def line(self, x1, y1, x2, y2, stroke=AXIS_COLOR, width=1.0, opacity=None, dash=None):
+        self.add("line", x1=float(x1), y1=float(y1), x2=float(x2), y2=float(y2), stroke=stroke,
+                 stroke_width=float(width), stroke_opacity=opacity, stroke_dasharray=dash)
+
+    def polyline(self, points, stroke, width=1.0, opacity=None, dash=None):
+        self.add("polyline", points=_points(points), fill="none", stroke=stroke, stroke_width=float(width),
+                 stroke_opacity=opacity, stroke_dasharray=dash, stroke_linejoin="round")
+
+    def polygon(self, points, fill, opacity=None, **attrs):
+        self.add("polygon", points=_points(points), fill=fill, fill_opacity=opacity, **attrs)
+
+    def circle(self, cx, cy, r, fill, **attrs):
+        self.add("circle", cx=float(cx), cy=float(cy), r=float(r), fill=fill, **attrs)
+
+    def text(self, x, y, text, size=12, anchor="middle", bold=False, color=TEXT_COLOR, opacity=None,
+             rotate=None, baseline="middle"):
+        """Text centered on (x, y) by default; '\\n' starts a new line."""
+        lines = str(text).split("\n")
+        y -= (len(lines) - 1) * size * 0.6
+        transform = f"rotate({_fmt(rotate)} {_fmt(x)} {_fmt(y)})" if rotate else None
+        if len(lines) == 1:
+            content = escape(lines[0])
+        else:
+            content = "".join(f'<tspan x="{_fmt(x)}" dy="{_fmt(0 if i == 0 else size * 1.2)}">{escape(line)}</tspan>'
+                              for i, line in enumerate(lines))
+        self.add("text", content, x=float(x), y=float(y), font_size=size, text_anchor=anchor,
+                 dominant_baseline=baseline, font_weight="bold" if bold else None, fill=color,
+                 fill_opacity=opacity, transform=transform)
+
+    def __str__(self):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+                f'viewBox="0 0 {self.width} {self.height}" font-family="{escape(FONT_FAMILY)}">'
+                f'<rect width="100%" height="100%" fill="white"/>{"".join(self.parts)}</svg>\n')
+
+
+def _points(points):
+    return " ".join(f"{_fmt(x)},{_fmt(y)}" for x, y in points)
+
+
+def nice_ticks(low, high, count=8):
+    """Round tick values (steps of 1, 2, 2.5 or 5 x 10^n) within [low, high]."""
+    if high <= low:
+        high = low + 1
+    raw = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    ticks = []
+    value = math.ceil(low / step) * step
+    while value <= high + step * 1e-9:
+        ticks.append(round(value, 10))
+        value += step
+    return ticks
+
+
+def value_limits(values, margin=0.05):
+    """Axis range for values measured from zero, padded like matplotlib's margins.
+
+    Zero is always included and, as for bars, not padded past.
+    """
+    low, high = min(0, min(values, default=0)), max(0, max(values, default=0))
+    span = (high - low) or 1
+    return (low - span * margin if low < 0 else low), (high + span * margin if high > 0 or low == 0 else high)
+
+
+def _tick_label(value):
+    return f"{value:,.0f}" if float(value).is_integer() else f"{value:,.2f}".rstrip("0")
+
+
+def _scale(low, high, start, end):
+    span = (high - low) or 1
+    return lambda value: start + (value - low) * (end - start) / span
+
+
+def _title(doc, title, y=34, size=20):
+    doc.text(doc.width / 2, y, title, size=size, bold=True)
+
+
+def _value_axes(doc, values, box, ylabel, grid):
+    """Draw the y axis (with optional grid) for category charts; returns y(value)."""
+    left, top, right, bottom = box
+    low, high = value_limits(values)
+    y = _scale(low, high, bottom, top)
+    ticks = nice_ticks(low, high)
+    for tick in ticks:
+        if grid:
+            doc.line(left, y(tick), right, y(tick), stroke=GRID_COLOR, opacity=0.3)
+        doc.line(left - 4, y(tick), left, y(tick))
+        doc.text(left - 8, y(tick), _tick_label(tick), size=11, anchor="end")
+    doc.line(left, top, left, bottom)
+    doc.line(left, y(0), right, y(0))
+    if ylabel:
+        doc.text(24, (top + bottom) / 2, ylabel, size=13, rotate=-90)
+    return y
+
+
+def _category_labels(doc, labels, x, bottom):
+    for i, label in enumerate(labels):
+        doc.line(x(i), bottom, x(i), bottom + 4)
+        doc.text(x(i), bottom + 16, label, size=12)
+
+
+def bar_chart(title, labels, values, ylabel=""):
+    """Bar chart with value labels (create_chart.py bar)."""
+    doc = SvgDocument(1000, 600)
+    box = (100, 70, 970, 550)
+    left, top, right, bottom = box
+    _title(doc, title)
+    y = _value_axes(doc, values, box, ylabel, grid=False)
+    slot = (right - left) / max(len(values), 1)
+    x = lambda i: left + slot * (i + 0.5)
+    for i, value in enumerate(values):
+        bar_top, bar_bottom = sorted((y(value), y(0)))
+        doc.rect(x(i) - slot * 0.4, bar_top, slot * 0.8, bar_bottom - bar_top, COLORS[i % len(COLORS)])
+        doc.text(x(i), y(value) - 8 if value >= 0 else y(value) + 14, f"{value:,.0f}", size=12, bold=True)
+    _category_labels(doc, labels, x, bottom)
+    return str(doc)
+
+
+def line_chart(title, labels, values, ylabel="", positions=None, annotate=None, ticks=None):
+    """Line chart with a filled area and point labels (create_chart.py line).
+
+    For long series, positions (x of each point), annotate (indexes of the
+    points to mark and label) and ticks ((position, label) pairs) come from
+    create_chart.reduce_line; by default every point is marked and labelled.
+    """
+    doc = SvgDocument(1000, 600)
+    box = (100, 70, 970, 550)
+    left, top, right, bottom = box
+    _title(doc, title)
+    y = _value_axes(doc, values, box, ylabel, grid=True)
+    pad = (right - left) * 0.05
+    positions = list(range(len(values))) if positions is None else positions
+    annotate = range(len(values)) if annotate is None else annotate
+    x = _scale(positions[0] if positions else 0, max(positions[-1] if positions else 1, 1), left + pad, right - pad)
+    points = [(x(position), y(value)) for position, value in zip(positions, values)]
+    if points:
+        doc.polygon([(points[0][0], y(0)), *points, (points[-1][0], y(0))], COLORS[0], opacity=0.1)
+        doc.polyline(points, COLORS[0], width=2.5)
+    for i in annotate:
+        doc.circle(*points[i], 4.5, COLORS[0])
+        doc.text(points[i][0], points[i][1] - 14, f"{values[i]:,.0f}", size=12, bold=True)
+    if ticks is None:
+        step = max(1, math.ceil(len(labels) / 20))
+        ticks = list(zip(positions[::step], labels[::step]))
+    for position, label in ticks:
+        doc.line(x(position), bottom, x(position), bottom + 4)
+        doc.text(x(position), bottom + 16, label, size=12)
+    return str(doc)
+
+
+def pie_chart(title, labels, values):
+    """Pie chart with percentage labels, counterclockwise from 12 o'clock (create_chart.py pie)."""
+    doc = SvgDocument(800, 800)
+    _title(doc, title)
+    cx, cy, r = 400, 430, 280
+    total = sum(values) or 1
+    angle = 90.0
+    point = lambda deg, radius: (cx + radius * math.cos(math.radians(deg)),
+                                 cy - radius * math.sin(math.radians(deg)))
+    for i, (label, value) in enumerate(zip(labels, values)):
+        sweep = 360.0 * value / total
+        color = COLORS[i % len(COLORS)]
+        if sweep >= 359.999:
+            doc.circle(cx, cy, r, color)
+        elif sweep > 0:
+            (x1, y1), (x2, y2) = point(angle, r), point(angle + sweep, r)
+            large = 1 if sweep > 180 else 0
+            doc.add("path", d=f"M{_fmt(cx)},{_fmt(cy)} L{_fmt(x1)},{_fmt(y1)} "
+                              f"A{r},{r} 0 {large} 0 {_fmt(x2)},{_fmt(y2)} Z", fill=color)
+        middle = angle + sweep / 2
+        doc.text(*point(middle, r * 0.6), f"{100.0 * value / total:.1f}%", size=15)
+        lx, ly = point(middle, r * 1.1)
+        anchor = "start" if math.cos(math.radians(middle)) > 0.01 else \
+            "end" if math.cos(math.radians(middle)) < -0.01 else "middle"
+        doc.text(lx, ly, label, size=15, anchor=anchor)
+        angle += sweep
+    return str(doc)
+
+
+def radar_chart(title, labels, values, max_value=5, threshold=None, threshold_label=None):
+    """Polar radar chart on a 0..max_value scale, first axis at 3 o'clock."""
+    doc = SvgDocument(800, 800)
+    _title(doc, title, y=44, size=18)
+    cx, cy, r = 400, 430, 270
+    n = len(labels)
+    point = lambda i, value: (cx + r * value / max_value * math.cos(2 * math.pi * i / n),
+                              cy - r * value / max_value * math.sin(2 * math.pi * i / n))
+    for level in range(1, max_value + 1):
+        stroke = AXIS_COLOR if level == max_value else GRID_COLOR
+        doc.circle(cx, cy, r * level / max_value, "none", stroke=stroke, stroke_width=0.8)
+        doc.text(cx + 4, cy - r * level / max_value - 8, str(level), size=10, anchor="start", color="gray")
+    for i, label in enumerate(labels):
+        doc.line(cx, cy, *point(i, max_value), stroke=GRID_COLOR, width=0.8)
+        lx, ly = point(i, max_value * 1.12)
+        cos = math.cos(2 * math.pi * i / n)
+        doc.text(lx, ly, label, size=15, anchor="start" if cos > 0.01 else "end" if cos < -0.01 else "middle")
+    shape = [point(i, value) for i, value in enumerate(values)]
+    doc.polygon(shape, COLORS[0], opacity=0.25)
+    doc.polygon(shape, "none", stroke=COLORS[0], stroke_width=2.5)
+    for px, py in shape:
+        doc.circle(px, py, 4.5, COLORS[0])
+    if threshold is not None:
+        doc.polygon([point(i, threshold) for i in range(n)], "none", stroke=COLORS[1], stroke_width=1.2,
+                    stroke_opacity=0.5, stroke_dasharray="6 4")
+        if threshold_label:
+            doc.line(600, 90, 630, 90, stroke=COLORS[1], width=1.2, opacity=0.5, dash="6 4")
+            doc.text(638, 90, threshold_label, size=12, anchor="start")
+    return str(doc)
+
+
+def scatter_chart(title, points, xlabel, ylabel, xlim, ylim, ticks=(), regions=(), guides=(), notes=(),
+                  legend=()):
+    """Labelled scatter plot with shaded regions (create_impact_effort_matrix.py).
+
+    points:  (x, y, color, label) in data coordinates
+    regions: (x0, x1, y0, y1, color) shaded at 10% opacity (clipped to the limits)
+    guides:  ("x" or "y", value) dashed divider lines
+    notes:   (x, y, text, color) region captions
+    legend:  (label, color) entries drawn in the upper left
+    """
+    doc = SvgDocument(1000, 800)
+    left, top, right, bottom = 90, 70, 970, 730
+    _title(doc, title, size=18)
+    x = _scale(xlim[0], xlim[1], left, right)
+    y = _scale(ylim[0], ylim[1], bottom, top)
+    clip_x = lambda v: min(max(v, xlim[0]), xlim[1])
+    clip_y = lambda v: min(max(v, ylim[0]), ylim[1])
+    for x0, x1, y0, y1, color in regions:
+        doc.rect(x(clip_x(x0)), y(clip_y(y1)), x(clip_x(x1)) - x(clip_x(x0)),
+                 y(clip_y(y0)) - y(clip_y(y1)), color, opacity=0.10)
+    for tick in ticks:
+        doc.line(x(tick), top, x(tick), bottom, stroke=GRID_COLOR, opacity=0.2)
+        doc.line(left, y(tick), right, y(tick), stroke=GRID_COLOR, opacity=0.2)
+        doc.text(x(tick), bottom + 16, _tick_label(tick), size=11)
+        doc.text(left - 8, y(tick), _tick_label(tick), size=11, anchor="end")
+    for axis, value in guides:
+        if axis == "x":
+            doc.line(x(value), top, x(value), bottom, stroke="gray", width=0.8, opacity=0.5, dash="5 3")
+        else:
+            doc.line(left, y(value), right, y(value), stroke="gray", width=0.8, opacity=0.5, dash="5 3")
+    doc.rect(left, top, right - left, bottom - top, "none", stroke=AXIS_COLOR, stroke_width=1)
+    for nx, ny, text, color in notes:
+        doc.text(x(nx), y(ny), text, size=13, bold=True, color=color, opacity=0.6)
+    for px, py, color, label in points:
+        doc.circle(x(px), y(py), 10, color, stroke="white", stroke_width=1.5)
+        doc.text(x(px) + 11, y(py) - 11, label, size=12, anchor="start", bold=True, baseline="auto")
+    doc.text((left + right) / 2, bottom + 42, xlabel, size=15)
+    doc.text(30, (top + bottom) / 2, ylabel, size=15, rotate=-90)
+    for i, (label, color) in enumerate(legend):
+        ly = top + 18 + i * 22
+        doc.rect(left + 12, ly - 7, 22, 14, color, opacity=0.25)
+        doc.text(left + 42, ly, label, size=12, anchor="start")
+    return str(doc)
+
+
+def write_svg(path, svg):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(svg)
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""Build All Outputs
+
+output/ 를 한 번 스캔(_portfolio.scan_outputs)해서 생성 산출물 전체를
+의존 관계 순서대로, 바뀐 것만 다시 만듭니다.
+
+    output/ideas/portfolio.md                check_progress.py --portfolio
+    output/ideas/portfolio-dashboard.html    create_portfolio_dashboard.py
+    output/ideas/mindmap.html                create_mindmap.py
+    output/ideas/impact-effort-matrix.png    create_impact_effort_matrix.py --chart
+    output/{research,...}/*.html             export_docs.py (Markdown 보고서마다 하나)
+    output/dashboard.html                    create_outputs_dashboard.py (보고서 내보내기 뒤)
+
+Each artifact's signature covers the size and mtime of the files it reads,
+its generator scripts and its options; signatures are kept in
+output/.build/state.json. An artifact is rebuilt when its signature changed,
+its file is missing, or the file was changed after the build wrote it.
+Artifacts whose dependencies are done run in parallel with -j/--jobs, and the
+snapshot is refreshed with the files they wrote instead of walking output/
+again.
+
+Usage:
+    python build_outputs.py
+    python build_outputs.py -j 4
+    python build_outputs.py --dry-run    (다시 만들 산출물만 표시)
+    python build_outputs.py --force      (전부 다시 생성)
+
+Report exports need markdown (pip install markdown) and are skipped without
+it; the PNG matrix needs matplotlib (or use --matrix-format svg).
+"""
+
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import _portfolio
+from _shared import find_project_root
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROGRESS_SCRIPTS_DIR = SCRIPTS_DIR.parent / "progress-tracker" / "scripts"
+EXPORTER_SCRIPTS_DIR = SCRIPTS_DIR.parent / "document-exporter" / "scripts"
+CHART_SCRIPTS_DIR = SCRIPTS_DIR.parent / "data-visualizer" / "scripts"
+
+STATE_FILE = Path(".build") / "state.json"  # under output/ (hidden: not scanned)
+STATE_VERSION = 1
+# Markdown reports under these output/ folders are exported to HTML next to them
+EXPORT_DIRS = ("research", "financials", "reports", "presentations")
+DEFAULT_THEME = "cosmic"
+
+# name: output path relative to output/ ("export:<md path>" for exports)
+# inputs: function(snapshot) -> FileEntry list the artifact reads
+# sources: files outside the snapshot (generator scripts, theme, chart CSVs)
+# job: (function, args) run in a worker, with the snapshot appended when
+#      needs_snapshot; deps: artifacts that must be built first
+Artifact = namedtuple("Artifact", "name output deps inputs sources job needs_snapshot")
+
+
+# -- Jobs (run in worker processes) ----------------------------------------
+
+def _import(directory, name):
+    """Import a script module of another skill's scripts/ folder."""
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+    return importlib.import_module(name)
+
+
+def build_portfolio_md(project_dir, snapshot):
+    check_progress = _import(PROGRESS_SCRIPTS_DIR, "check_progress")
+    tracker = check_progress.ProgressTracker(project_dir, snapshot)
+    tracker.generate_portfolio_md(tracker.check_portfolio())
+
+
+def build_portfolio_dashboard(output_path, snapshot):
+    import create_portfolio_dashboard
+    create_portfolio_dashboard.generate_html(snapshot.idea_records(), output_path, snapshot)
+
+
+def build_mindmap(output_path, snapshot):
+    import create_mindmap
+    ideas = snapshot.idea_records()
+    idea_keywords, edges = create_mindmap.build_relationships(ideas)
+    Path(output_path).write_text(create_mindmap.generate_html(ideas, idea_keywords, edges),
+                                 encoding="utf-8")
+
+
+def build_matrix(output_path, fmt, snapshot):
+    import create_impact_effort_matrix as matrix
+    ideas = [matrix.idea_point(idea.data) for idea in snapshot.ideas if idea.data is not None]
+    render = matrix.render_chart_svg if fmt == "svg" else matrix.render_chart
+    if not render(ideas, str(output_path)):
+        raise RuntimeError("차트를 생성하지 못했습니다")
+
+
+def build_outputs_dashboard(output_dir, snapshot):
+    import create_outputs_dashboard
+    html = create_outputs_dashboard.generate_html(output_dir, snapshot=snapshot)
+    (Path(output_dir) / "dashboard.html").write_text(html, encoding="utf-8")
+
+
+def export_report(md_path, theme):
+    export_docs = _import(EXPORTER_SCRIPTS_DIR, "export_docs")
+    if not export_docs.convert_markdown_to_html(md_path, theme_name=theme):
+        raise RuntimeError("내보내기 실패 (위 오류 참고)")
+
+
+def _run(func, args):
+    """Run one artifact job; returns (seconds, error message or None)."""
+    start = time.perf_counter()
+    try:
+        func(*args)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return time.perf_counter() - start, error
+
+
+# -- Dependency graph -------------------------------------------------------
+
+def _idea_files(snapshot):
+    return [entry for idea in snapshot.ideas for entry in idea.files]
+
+
+def _idea_json_files(snapshot):
+    return [entry for idea in snapshot.ideas for entry in idea.files
+            if entry.name == _portfolio.IDEA_FILE and entry.path.count(os.sep) == 2]
+
+
+def plan(snapshot, project_dir, theme=DEFAULT_THEME, matrix_format="png"):
+    """Return the artifact graph ({name: Artifact}, dependencies first) for a snapshot."""
+    root = snapshot.root
+    ideas_dir = os.path.join(_portfolio.IDEAS_DIR, "")
+    portfolio = [SCRIPTS_DIR / "_portfolio.py", SCRIPTS_DIR / "_shared.py"]
+    graph = {}
+
+    def add(name, deps, inputs, sources, job, needs_snapshot=True):
+        graph[name] = Artifact(name, root / name, tuple(deps), inputs, tuple(sources), job,
+                               needs_snapshot)
+
+    if snapshot.idea_records():
+        add(ideas_dir + "portfolio.md", (), _idea_files,
+            [PROGRESS_SCRIPTS_DIR / "check_progress.py"] + portfolio,
+            (build_portfolio_md, (project_dir,)))
+        add(ideas_dir + "portfolio-dashboard.html", (), _idea_files,
+            [SCRIPTS_DIR / "create_portfolio_dashboard.py"] + portfolio,
+            (build_portfolio_dashboard, (root / ideas_dir / "portfolio-dashboard.html",)))
+        add(ideas_dir + "mindmap.html", (), _idea_json_files,
+            [SCRIPTS_DIR / "create_mindmap.py", SCRIPTS_DIR / "_shared.py"],
+            (build_mindmap, (root / ideas_dir / "mindmap.html",)))
+        if matrix_format == "png" and importlib.util.find_spec("matplotlib") is None:
+            print("⚠️  matplotlib 미설치 — 매트릭스 PNG를 건너뜁니다 (pip install matplotlib 또는 --matrix-format svg)")
+        else:
+            name = f"{ideas_dir}impact-effort-matrix.{matrix_format}"
+            renderer = "_svg.py" if matrix_format == "svg" else "_raster.py"
+            add(name, (), _idea_json_files,
+                [SCRIPTS_DIR / "create_impact_effort_matrix.py", SCRIPTS_DIR / renderer],
+                (build_matrix, (root / name, matrix_format)))
+
+    exports = []
+    if importlib.util.find_spec("markdown") is None:
+        print("⚠️  markdown 미설치 — 보고서 HTML 내보내기를 건너뜁니다 (pip install markdown)")
+    else:
+        export_docs = _import(EXPORTER_SCRIPTS_DIR, "export_docs")
+        exporter = [EXPORTER_SCRIPTS_DIR / "export_docs.py", export_docs.THEMES_DIR / f"{theme}.html",
+                    CHART_SCRIPTS_DIR / "create_chart.py", SCRIPTS_DIR / "_svg.py"]
+        for folder in EXPORT_DIRS:
+            for entry in snapshot.category(folder):
+                if not entry.name.endswith(".md"):
+                    continue
+                md_file = root / entry.path
+                try:
+                    data_files = export_docs.chart_data_files(md_file)
+                except (OSError, UnicodeDecodeError):
+                    data_files = []
+                name = "export:" + entry.path
+                graph[name] = Artifact(name, md_file.with_suffix(".html"), (),
+                                       lambda snapshot, entry=entry: [entry],
+                                       tuple(exporter + data_files),
+                                       (export_report, (md_file, theme)), False)
+                exports.append(name)
+
+    # The dashboard lists the exported HTML too, so it runs after the exports
+    generated = {name for name in graph if not name.startswith("export:")}
+    graph["dashboard.html"] = Artifact(
+        "dashboard.html", root / "dashboard.html", tuple(exports),
+        lambda snapshot: [entry for entry in snapshot.files if entry.path not in generated],
+        (SCRIPTS_DIR / "create_outputs_dashboard.py", *portfolio),
+        (build_outputs_dashboard, (root,)), True)
+    return graph
+
+
+# -- Signatures and build state ---------------------------------------------
+
+def _stamp(path):
+    """[size, mtime_ns] of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def signature(artifact, snapshot):
+    """SHA-256 over the artifact's options, generator sources and input files."""
+    hasher = hashlib.sha256(f"v{STATE_VERSION}\n{artifact.name}\n{artifact.job[1]!r}\n".encode("utf-8"))
+    for path in artifact.sources:
+        hasher.update(f"{path}\t{_stamp(path)}\n".encode("utf-8"))
+    for entry in artifact.inputs(snapshot):
+        hasher.update(f"{entry.path}\t{entry.size}\t{entry.mtime!r}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def stale_reason(artifact, digest, record, force=False):
+    """Why the artifact must be rebuilt, or None if it is up to date."""
+    if force:
+        return "--force"
+    stamp = _stamp(artifact.output)
+    if stamp is None:
+        return "없음"
+    if record is None:
+        return "기록 없음"
+    if record.get("signature") != digest:
+        return "입력 변경"
+    if record.get("output") != stamp:
+        return "파일 수정됨"
+    return None
+
+
+def load_state(path):
+    """Recorded {name: {"signature", "output"}} of the last build ({} if none)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        return {}
+    return data.get("artifacts", {})
+
+
+def save_state(path, artifacts):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": STATE_VERSION, "artifacts": artifacts}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+# -- Build ------------------------------------------------------------------
+
+def build(graph, snapshot, state, jobs=1, force=False, dry_run=False):
+    """Rebuild the out-of-date artifacts of graph in dependency order.
+
+    An artifact is checked once its dependencies are done, against the
+    snapshot refreshed with the files built so far. Records of rebuilt
+    artifacts are updated in state.
+
+    Returns:
+        (built, up_to_date, failed) lists of artifact names; with dry_run
+        "built" lists the artifacts that would be rebuilt
+    """
+    pending = dict(graph)
+    running = {}
+    written = []
+    built, up_to_date, failed = [], [], []
+
+    def finish(artifact, digest, seconds, error):
+        if error:
+            print(f"   ❌ {artifact.name}: {error}")
+            failed.append(artifact.name)
+            return
+        state[artifact.name] = {"signature": digest, "output": _stamp(artifact.output)}
+        written.append(artifact.output)
+        built.append(artifact.name)
+        print(f"   ✅ {artifact.name} ({seconds:.2f}s)")
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and not dry_run else None
+    try:
+        while pending or running:
+            if written:
+                snapshot = _portfolio.refresh(snapshot, written)
+                written.clear()
+            busy = set(pending) | {artifact.name for artifact, _ in running.values()}
+            ready = [artifact for artifact in pending.values() if busy.isdisjoint(artifact.deps)]
+            for artifact in ready:
+                del pending[artifact.name]
+                digest = signature(artifact, snapshot)
+                reason = stale_reason(artifact, digest, state.get(artifact.name), force)
+                if reason is None and dry_run and not set(built).isdisjoint(artifact.deps):
+                    reason = "의존 산출물 변경"
+                if reason is None:
+                    up_to_date.append(artifact.name)
+                    continue
+                if dry_run:
+                    print(f"   🔸 {artifact.name} ({reason})")
+                    built.append(artifact.name)
+                    continue
+                func, args = artifact.job
+                if artifact.needs_snapshot:
+                    args = args + (snapshot,)
+                if pool is None:
+                    finish(artifact, digest, *_run(func, args))
+                else:
+                    running[pool.submit(_run, func, args)] = (artifact, digest)
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    artifact, digest = running.pop(future)
+                    finish(artifact, digest, *future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return built, up_to_date, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build All Outputs - 포트폴리오, 대시보드, 마인드맵, 매트릭스, 보고서 HTML을 "
+                    "한 번의 스캔으로 바뀐 것만 다시 생성합니다."
+    )
+    parser.add_argument("--project-dir", default=None,
+                        help="프로젝트 루트 (기본: 스크립트 기준 프로젝트 루트)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="병렬 작업 프로세스 수 (기본: 1)")
+    parser.add_argument("--force", action="store_true", help="최신 산출물도 모두 다시 생성")
+    parser.add_argument("--dry-run", action="store_true", help="다시 만들 산출물만 표시")
+    parser.add_argument("-t", "--theme", default=DEFAULT_THEME,
+                        help=f"보고서 HTML 테마 (기본: {DEFAULT_THEME})")
+    parser.add_argument("--matrix-format", choices=["png", "svg"], default="png",
+                        help="Impact-Effort 매트릭스 형식 (기본: png, svg는 의존성 없음)")
+    args = parser.parse_args()
+
+    project_dir = Path(args.project_dir).resolve() if args.project_dir else find_project_root()
+    output_dir = project_dir / "output"
+    start = time.perf_counter()
+
+    snapshot = _portfolio.scan_outputs(output_dir)
+    print(f"🔎 output/ 스캔: 파일 {len(snapshot.files)}개, 아이디어 {len(snapshot.ideas)}개 "
+          f"({time.perf_counter() - start:.2f}s)")
+    graph = plan(snapshot, project_dir, args.theme, args.matrix_format)
+    state_path = output_dir / STATE_FILE
+    state = load_state(state_path)
+    print(f"📋 산출물 {len(graph)}개 (jobs: {args.jobs})\n")
+
+    built, up_to_date, failed = build(graph, snapshot, state, jobs=args.jobs,
+                                      force=args.force, dry_run=args.dry_run)
+    elapsed = time.perf_counter() - start
+    if args.dry_run:
+        print(f"\n🔸 다시 생성 {len(built)}개, 최신 {len(up_to_date)}개 ({elapsed:.2f}s)")
+        sys.exit(0)
+
+    save_state(state_path, {name: record for name, record in state.items() if name in graph})
+    print(f"\n✨ 생성 {len(built)}개, 최신 {len(up_to_date)}개, 실패 {len(failed)}개 ({elapsed:.2f}s)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,13 @@
 Idea Score Visualization (v2.0)
 
 Default: ASCII/Unicode bar chart (no dependencies)
-Optional: Radar chart PNG via matplotlib (--chart flag)
+Optional: Radar chart PNG via matplotlib (--chart flag), or SVG without
+matplotlib (--chart --format svg)
 
 Usage:
     python create_idea_score_chart.py --name "AI 재고관리" --scores "4,3,5,4,3"
     python create_idea_score_chart.py --name "AI 재고관리" --scores "4,3,5,4,3" --chart --output radar.png
+    python create_idea_score_chart.py --name "AI 재고관리" --scores "4,3,5,4,3" --chart --format svg
     python create_idea_score_chart.py --json idea.json
 """
 
@@ -15,6 +17,8 @@ import argparse
 import json
 import sys
 
+import _raster
+
 # Evaluation items with weights and Korean R&D keyword mapping
 ITEMS = [
     {"key": "market_size",  "label": "시장 크기",           "weight": 5, "rnd_keyword": "필요성(Necessity)"},
@@ -122,27 +126,12 @@ def render_ascii(name, scores):
 def render_radar(name, scores, output_path):
     """Render radar chart PNG via matplotlib — optional dependency."""
     try:
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-        import matplotlib.font_manager as fm
-        import numpy as np
+        mpl = _raster.load()
     except ImportError:
         print("⚠️  matplotlib 미설치 — 차트를 생략하고 텍스트 결과만 표시합니다.")
-        print("    설치: pip install matplotlib numpy")
+        print(f"    설치: {_raster.INSTALL_HINT} (또는 --format svg)")
         return False
-
-    # Korean font setup
-    for font_name in ['AppleGothic', 'NanumGothic', 'Malgun Gothic']:
-        try:
-            fm.findfont(font_name, fallback_to_default=False)
-            plt.rcParams['font.family'] = font_name
-            plt.rcParams['axes.unicode_minus'] = False
-            break
-        except Exception as e:
-            import warnings
-            warnings.warn(f"Font setup failed: {e}")
-            continue
+    np = mpl.np
 
     labels = [item["label"] for item in ITEMS]
     N = len(labels)
@@ -150,7 +139,7 @@ def render_radar(name, scores, output_path):
     angles += angles[:1]
     values = scores + scores[:1]
 
-    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
+    fig, ax = _raster.new_figure((8, 8), polar=True)
     ax.fill(angles, values, color='#4285F4', alpha=0.25)
     ax.plot(angles, values, 'o-', color='#4285F4', linewidth=2)
 
@@ -169,9 +158,20 @@ def render_radar(name, scores, output_path):
     verdict, _ = get_verdict(total)
     ax.set_title(f"{name}\n총점: {total}/100 — {verdict}", fontsize=14, fontweight='bold', pad=20)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    _raster.save(fig, output_path)
+    print(f"✅ 레이더 차트 저장: {output_path}")
+    return True
+
+
+def render_radar_svg(name, scores, output_path):
+    """Render the radar chart as SVG — no dependencies."""
+    import _svg
+
+    total = calc_total(scores)
+    verdict, _ = get_verdict(total)
+    svg = _svg.radar_chart(f"{name}\n총점: {total}/100 — {verdict}", [item["label"] for item in ITEMS], scores,
+                           threshold=KILL_SWITCH_THRESHOLD, threshold_label=f"Kill Switch ({KILL_SWITCH_THRESHOLD}점)")
+    _svg.write_svg(output_path, svg)
     print(f"✅ 레이더 차트 저장: {output_path}")
     return True
 
@@ -198,8 +198,9 @@ def main():
     parser.add_argument("--name", help="Idea name")
     parser.add_argument("--scores", help="Comma-separated scores (5 items, 1-5 each)")
     parser.add_argument("--json", help="Load from idea.json file")
-    parser.add_argument("--chart", action="store_true", help="Generate radar chart PNG (requires matplotlib)")
-    parser.add_argument("--output", default="idea-radar.png", help="Radar chart output path")
+    parser.add_argument("--chart", action="store_true", help="Generate radar chart (PNG requires matplotlib)")
+    parser.add_argument("--format", choices=["png", "svg"], default="png", help="Radar chart format (default: png)")
+    parser.add_argument("--output", help="Radar chart output path (default: idea-radar.<format>)")
     args = parser.parse_args()
 
     if args.json:
@@ -220,7 +221,11 @@ def main():
 
     # Optionally generate radar chart
     if args.chart:
-        render_radar(name, scores, args.output)
+        output = args.output or f"idea-radar.{args.format}"
+        if args.format == "svg":
+            render_radar_svg(name, scores, output)
+        else:
+            render_radar(name, scores, output)
 
 
 if __name__ == "__main__":
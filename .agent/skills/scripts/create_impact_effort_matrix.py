@@ -3,13 +3,15 @@
 Impact-Effort Matrix Visualization (v1.0)
 
 Default: ASCII 2x2 matrix (no dependencies)
-Optional: Scatter plot PNG via matplotlib (--chart flag)
+Optional: Scatter plot PNG via matplotlib (--chart flag), or SVG without
+matplotlib (--chart --format svg)
 
 Usage:
     python create_impact_effort_matrix.py --name "AI 재고관리" --scores "4.2,3.1"
     python create_impact_effort_matrix.py --json idea.json
     python create_impact_effort_matrix.py --dir output/ideas/
     python create_impact_effort_matrix.py --dir output/ideas/ --chart --output matrix.png
+    python create_impact_effort_matrix.py --dir output/ideas/ --chart --format svg --output matrix.svg
 """
 
 import argparse
@@ -17,6 +19,8 @@ import json
 import sys
 from pathlib import Path
 
+import _raster
+
 # Quadrant definitions (Impact high/low x Effort high/low)
 QUADRANTS = {
     "quick_win":      {"label": "Quick Win",      "desc": "즉시 실행",   "icon": "★"},
@@ -28,6 +32,11 @@ QUADRANTS = {
 # Midpoint threshold for quadrant classification (1-5 scale)
 MID = 2.5
 
+QUADRANT_COLORS = {'quick_win': '#34A853', 'major_project': '#4285F4',
+                   'fill_in': '#FBBC04', 'thankless_task': '#EA4335'}
+# Chart axis range; quadrant shading splits at the middle of the x range
+CHART_LIM = (0.5, 5.5)
+
 
 def calc_impact(score_details):
     """Calculate impact from score_details: (market_size * 5 + timing * 3) / 8."""
@@ -60,7 +69,11 @@ def load_from_json(json_path):
     """Load a single idea from idea.json file."""
     with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
+    return idea_point(data)
+
 
+def idea_point(data):
+    """Matrix point {name, impact, effort} from idea.json data."""
     details = data.get("score_details", {})
     name = data.get("full_name", data.get("name", "Unknown"))
     impact = calc_impact(details)
@@ -186,29 +199,12 @@ def render_ascii(ideas):
 def render_chart(ideas, output_path):
     """Render scatter plot PNG via matplotlib — optional dependency."""
     try:
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-        import matplotlib.font_manager as fm
+        fig, ax = _raster.new_figure((10, 8))
     except ImportError:
         print("  matplotlib 미설치 — 차트를 생략하고 텍스트 결과만 표시합니다.")
-        print("    설치: pip install matplotlib")
+        print(f"    설치: {_raster.INSTALL_HINT} (또는 --format svg)")
         return False
 
-    # Korean font setup
-    for font_name in ['AppleGothic', 'NanumGothic', 'Malgun Gothic']:
-        try:
-            fm.findfont(font_name, fallback_to_default=False)
-            plt.rcParams['font.family'] = font_name
-            plt.rcParams['axes.unicode_minus'] = False
-            break
-        except Exception as e:
-            import warnings
-            warnings.warn(f"Font setup failed: {e}")
-            continue
-
-    fig, ax = plt.subplots(figsize=(10, 8))
-
     # Quadrant background colors
     ax.axhspan(MID, 5.5, xmin=0, xmax=0.5, alpha=0.10, color='#34A853', label='Quick Win')
     ax.axhspan(MID, 5.5, xmin=0.5, xmax=1.0, alpha=0.10, color='#4285F4', label='Major Project')
@@ -230,8 +226,7 @@ def render_chart(ideas, output_path):
             fontsize=10, color='#EA4335', alpha=0.6, fontweight='bold')
 
     # Plot ideas
-    colors = {'quick_win': '#34A853', 'major_project': '#4285F4',
-              'fill_in': '#FBBC04', 'thankless_task': '#EA4335'}
+    colors = QUADRANT_COLORS
     for idea in ideas:
         q = classify_quadrant(idea["impact"], idea["effort"])
         ax.scatter(idea["effort"], idea["impact"], s=200, c=colors[q],
@@ -250,9 +245,33 @@ def render_chart(ideas, output_path):
     ax.legend(loc='upper left', fontsize=9, framealpha=0.8)
     ax.grid(True, alpha=0.2)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    _raster.save(fig, output_path)
+    print(f"  매트릭스 차트 저장: {output_path}")
+    return True
+
+
+def render_chart_svg(ideas, output_path):
+    """Render the scatter plot as SVG — no dependencies."""
+    import _svg
+
+    x_mid = sum(CHART_LIM) / 2
+    c = QUADRANT_COLORS
+    svg = _svg.scatter_chart(
+        "Impact-Effort 매트릭스",
+        [(idea["effort"], idea["impact"], c[classify_quadrant(idea["impact"], idea["effort"])], idea["name"][:15])
+         for idea in ideas],
+        "Effort (높을수록 어려움) →", "Impact (높을수록 효과적) →", CHART_LIM, CHART_LIM,
+        ticks=[1, 2, 3, 4, 5],
+        regions=[(0, x_mid, MID, 5.5, c['quick_win']), (x_mid, 6, MID, 5.5, c['major_project']),
+                 (0, x_mid, 0, MID, c['fill_in']), (x_mid, 6, 0, MID, c['thankless_task'])],
+        guides=[("x", MID), ("y", MID)],
+        notes=[(1.25, 4.5, 'Quick Win\n(즉시 실행)', c['quick_win']),
+               (3.75, 4.5, 'Major Project\n(장기 과제)', c['major_project']),
+               (1.25, 1.0, 'Fill-in\n(자투리 과제)', c['fill_in']),
+               (3.75, 1.0, 'Thankless Task\n(비효율 과제)', c['thankless_task'])],
+        legend=[(QUADRANTS[key]["label"], color) for key, color in c.items()],
+    )
+    _svg.write_svg(output_path, svg)
     print(f"  매트릭스 차트 저장: {output_path}")
     return True
 
@@ -263,8 +282,9 @@ def main():
     parser.add_argument("--scores", help="Comma-separated impact,effort (e.g. '3.5,2.1')")
     parser.add_argument("--json", help="Load from idea.json file")
     parser.add_argument("--dir", help="Scan directory for idea.json files")
-    parser.add_argument("--chart", action="store_true", help="Generate scatter plot PNG (requires matplotlib)")
-    parser.add_argument("--output", default="impact-effort-matrix.png", help="Chart output path")
+    parser.add_argument("--chart", action="store_true", help="Generate scatter plot (PNG requires matplotlib)")
+    parser.add_argument("--format", choices=["png", "svg"], default="png", help="Chart format (default: png)")
+    parser.add_argument("--output", help="Chart output path (default: impact-effort-matrix.<format>)")
     args = parser.parse_args()
 
     ideas = []
@@ -291,7 +311,11 @@ def main():
 
     # Optionally generate scatter chart
     if args.chart:
-        render_chart(ideas, args.output)
+        output = args.output or f"impact-effort-matrix.{args.format}"
+        if args.format == "svg":
+            render_chart_svg(ideas, output)
+        else:
+            render_chart(ideas, output)
 
 
 if __name__ == "__main__":
@@ -8,15 +8,19 @@ category breakdowns.
 Usage:
     python create_outputs_dashboard.py [--output-dir OUTPUT_DIR] [--idea IDEA_ID]
 
+The output/ tree is read once through _portfolio.scan_outputs (shared with
+check_progress.py and create_portfolio_dashboard.py).
+
 Requires Python 3.8+ standard library only (json, os, pathlib, datetime).
 """
 
 import argparse
-import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from _portfolio import scan_outputs
 from _shared import find_project_root, _status_label
 
 STAGES = [
@@ -66,8 +70,6 @@ CATEGORY_META = {
     },
 }
 
-IGNORED_FILES = {".gitkeep", ".DS_Store", "dashboard.html"}
-
 
 def format_file_size(size_bytes):
     """Format file size in human-readable form."""
@@ -81,173 +83,42 @@ def format_mtime(mtime):
     return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
 
 
-def is_real_file(path):
-    """Check if a file is a real deliverable (not .gitkeep, .DS_Store, etc)."""
-    return path.is_file() and path.name not in IGNORED_FILES
-
+def _file_info(entry, root, relative):
+    """File info dict for a snapshot FileEntry."""
+    return {
+        "name": entry.name,
+        "path": os.path.join(root, entry.path),
+        "relative": relative,
+        "size": entry.size,
+        "mtime": entry.mtime,
+        "suffix": os.path.splitext(entry.name)[1].lower(),
+    }
 
-def scan_directory(dir_path):
-    """Scan a directory and return list of file info dicts."""
-    dir_path = Path(dir_path)
-    if not dir_path.exists():
-        return []
 
-    files = []
-    for f in sorted(dir_path.rglob("*")):
-        if is_real_file(f):
-            stat = f.stat()
-            files.append({
-                "name": f.name,
-                "path": str(f),
-                "relative": str(f.relative_to(dir_path)),
-                "size": stat.st_size,
-                "mtime": stat.st_mtime,
-                "suffix": f.suffix.lower(),
-            })
-    return files
+def _category_files(snapshot, folder):
+    """File info dicts of output/<folder>/ from a snapshot (relative to the folder)."""
+    return [_file_info(entry, snapshot.root, entry.path.split(os.sep, 1)[1])
+            for entry in snapshot.category(folder)]
 
 
-def _load_ideas_with_stats(ideas_dir):
-    """Scan output/ideas/*/idea.json and return list of idea dicts with file counts."""
-    ideas_dir = Path(ideas_dir)
-    if not ideas_dir.exists():
-        return []
-
+def _idea_records(snapshot):
+    """Idea dicts (idea.json data + dir_path, dir_name, file_count, sub_files)."""
     ideas = []
-    for child in sorted(ideas_dir.iterdir()):
-        if child.is_dir():
-            idea_file = child / "idea.json"
-            if idea_file.exists():
-                try:
-                    with open(idea_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    data["dir_path"] = str(child)
-                    data["dir_name"] = child.name
-                    # Count real files in the idea directory
-                    file_count = sum(
-                        1 for fp in child.rglob("*") if is_real_file(fp)
-                    )
-                    data["file_count"] = file_count
-                    ideas.append(data)
-                except (json.JSONDecodeError, OSError):
-                    continue
+    for idea in snapshot.ideas:
+        if idea.data is None:
+            continue
+        data = idea.record()
+        data["dir_name"] = idea.name
+        data["file_count"] = len(idea.files)
+        # paths are ideas/<name>/...; list them relative to the idea folder
+        data["sub_files"] = [
+            entry.path.split(os.sep, 2)[2]
+            for entry in idea.files if entry.name != "idea.json"
+        ]
+        ideas.append(data)
     return ideas
 
 
-def check_global_stage_completion(output_dir):
-    """Check which stages (0-8) are complete at the global output/ level.
-
-    Uses the same logic as check_progress.py's ProgressTracker.
-    """
-    output_dir = Path(output_dir)
-    completed = [False] * TOTAL_STAGES
-
-    # Stage 0: output/ideas/ has files
-    ideas_dir = output_dir / "ideas"
-    if ideas_dir.exists():
-        for child in ideas_dir.iterdir():
-            if child.is_dir():
-                idea_file = child / "idea.json"
-                if idea_file.exists():
-                    completed[0] = True
-                    break
-
-    # Stage 1: output/research/ has market-related files
-    research_dir = output_dir / "research"
-    if research_dir.exists():
-        for f in research_dir.rglob("*"):
-            if is_real_file(f):
-                fname = f.name.lower()
-                if "시장" in fname or "market" in fname or "tam" in fname:
-                    completed[1] = True
-                    break
-        # Also check inside ideas
-        if not completed[1] and ideas_dir.exists():
-            for child in ideas_dir.iterdir():
-                if child.is_dir():
-                    r_dir = child / "research"
-                    if r_dir.exists():
-                        for f in r_dir.rglob("*"):
-                            if is_real_file(f):
-                                fname = f.name.lower()
-                                if "시장" in fname or "market" in fname:
-                                    completed[1] = True
-                                    break
-                    if completed[1]:
-                        break
-
-    # Stage 2: output/research/ has competition-related files
-    if research_dir.exists():
-        for f in research_dir.rglob("*"):
-            if is_real_file(f):
-                fname = f.name.lower()
-                if "경쟁" in fname or "competitor" in fname:
-                    completed[2] = True
-                    break
-        if not completed[2] and ideas_dir.exists():
-            for child in ideas_dir.iterdir():
-                if child.is_dir():
-                    r_dir = child / "research"
-                    if r_dir.exists():
-                        for f in r_dir.rglob("*"):
-                            if is_real_file(f):
-                                fname = f.name.lower()
-                                if "경쟁" in fname or "competitor" in fname:
-                                    completed[2] = True
-                                    break
-                    if completed[2]:
-                        break
-
-    # Stage 3: output/financials/ has cost-related files
-    financials_dir = output_dir / "financials"
-    if financials_dir.exists():
-        for f in financials_dir.rglob("*"):
-            if is_real_file(f):
-                fname = f.name.lower()
-                if "원가" in fname or "cost" in fname or "menu" in fname:
-                    completed[3] = True
-                    break
-    if not completed[3] and ideas_dir.exists():
-        for child in ideas_dir.iterdir():
-            if child.is_dir():
-                f_dir = child / "financials"
-                if f_dir.exists():
-                    for f in f_dir.rglob("*"):
-                        if is_real_file(f):
-                            fname = f.name.lower()
-                            if "원가" in fname or "cost" in fname or "menu" in fname:
-                                completed[3] = True
-                                break
-                if completed[3]:
-                    break
-
-    # Stage 4: output/financials/ has financial model files
-    if financials_dir.exists():
-        for f in financials_dir.rglob("*"):
-            if is_real_file(f):
-                fname = f.name.lower()
-                if "재무" in fname or "financial" in fname or "projection" in fname:
-                    completed[4] = True
-                    break
-
-    # Stages 5-8: output/reports/ keyword matching
-    reports_dir = output_dir / "reports"
-    if reports_dir.exists():
-        for f in reports_dir.rglob("*"):
-            if is_real_file(f):
-                fname = f.name.lower()
-                if "운영" in fname or "operation" in fname:
-                    completed[5] = True
-                if "브랜딩" in fname or "brand" in fname:
-                    completed[6] = True
-                if "법률" in fname or "legal" in fname:
-                    completed[7] = True
-                if "사업계획" in fname or "business-plan" in fname:
-                    completed[8] = True
-
-    return completed
-
-
 def _status_class(status):
     """Return CSS class name for status badge."""
     if status == "go":
@@ -269,16 +140,8 @@ def _build_idea_card(idea):
     badge_class = _status_class(status)
     badge_label = _status_label(status)
 
-    # List sub-files
-    dir_path = Path(idea.get("dir_path", ""))
-    sub_files = []
-    if dir_path.exists():
-        for f in sorted(dir_path.rglob("*")):
-            if is_real_file(f) and f.name != "idea.json":
-                sub_files.append(f.relative_to(dir_path))
-
     sub_files_html = ""
-    for sf in sub_files:
+    for sf in idea.get("sub_files", []):
         sub_files_html += f'<li class="sub-file">{sf}</li>'
 
     if sub_files_html:
@@ -334,17 +197,23 @@ def _build_empty_category(meta):
                     </div>"""
 
 
-def generate_html(output_dir, idea_filter=None):
-    """Generate the unified outputs dashboard HTML."""
+def generate_html(output_dir, idea_filter=None, snapshot=None):
+    """Generate the unified outputs dashboard HTML.
+
+    snapshot: _portfolio.scan_outputs(output_dir) result to reuse (scanned
+    here when omitted).
+    """
     output_dir = Path(output_dir)
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
 
-    # Scan all categories
-    ideas = _load_ideas_with_stats(output_dir / "ideas")
-    research_files = scan_directory(output_dir / "research")
-    financials_files = scan_directory(output_dir / "financials")
-    reports_files = scan_directory(output_dir / "reports")
-    presentations_files = scan_directory(output_dir / "presentations")
+    # Scan all categories (one pass over output/)
+    if snapshot is None:
+        snapshot = scan_outputs(output_dir)
+    ideas = _idea_records(snapshot)
+    research_files = _category_files(snapshot, "research")
+    financials_files = _category_files(snapshot, "financials")
+    reports_files = _category_files(snapshot, "reports")
+    presentations_files = _category_files(snapshot, "presentations")
 
     # If idea filter is set, only show that idea
     if idea_filter and ideas:
@@ -359,22 +228,16 @@ def generate_html(output_dir, idea_filter=None):
         + len(presentations_files)
     )
 
-    stages_completed = check_global_stage_completion(output_dir)
+    stages_completed = list(snapshot.stages)
     completed_count = sum(stages_completed)
 
     # Find most recently modified file
     all_files = research_files + financials_files + reports_files + presentations_files
     # Add idea files
-    for idea in ideas:
-        idea_dir = Path(idea.get("dir_path", ""))
-        if idea_dir.exists():
-            for f in idea_dir.rglob("*"):
-                if is_real_file(f):
-                    stat = f.stat()
-                    all_files.append({
-                        "name": f.name,
-                        "mtime": stat.st_mtime,
-                    })
+    shown_ideas = {idea["dir_name"] for idea in ideas}
+    for idea in snapshot.ideas:
+        if idea.name in shown_ideas:
+            all_files.extend({"name": f.name, "mtime": f.mtime} for f in idea.files)
 
     if all_files:
         most_recent = max(all_files, key=lambda x: x["mtime"])
@@ -2,10 +2,11 @@
 """Idea Portfolio HTML Dashboard Generator
 
 Reads output/ideas/*/idea.json files and generates a visual HTML dashboard
-at output/ideas/portfolio-dashboard.html.
+at output/ideas/portfolio-dashboard.html. Ideas and their stages come from
+one _portfolio.scan_outputs pass (the rules check_progress.py uses).
 
 Usage:
-    python create_portfolio_dashboard.py [--output-dir OUTPUT_DIR]
+    python create_portfolio_dashboard.py [--output-dir OUTPUT_DIR] [--project-dir PROJECT_DIR]
 
 Requires Python 3.8+ standard library only (json, os, glob, datetime, pathlib).
 """
@@ -16,7 +17,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from _shared import find_project_root, load_ideas, _status_label
+from _portfolio import scan_idea, scan_outputs
+from _shared import find_project_root, _status_label
 
 STAGES = [
     {"id": 0, "name": "아이디어 발굴", "icon": "\U0001f4a1"},
@@ -33,62 +35,12 @@ STAGES = [
 TOTAL_STAGES = len(STAGES)  # 9 (0-8)
 
 
-
-
 def check_stage_completion(idea_dir):
     """Check which stages (0-8) are complete for an idea directory.
 
     Returns a list of booleans, one per stage.
     """
-    idea_dir = Path(idea_dir)
-    completed = [False] * TOTAL_STAGES
-
-    # Stage 0: hypothesis.md or evaluation.md exists
-    if (idea_dir / "hypothesis.md").exists() or (idea_dir / "evaluation.md").exists():
-        completed[0] = True
-
-    # Stage 1: research/ has any file
-    research_dir = idea_dir / "research"
-    if research_dir.exists():
-        files = [f for f in research_dir.rglob("*") if f.is_file()]
-        if files:
-            completed[1] = True
-
-        # Stage 2: research/ has file with keyword
-        for f in files:
-            fname = f.name.lower()
-            if "경쟁" in fname or "competitor" in fname:
-                completed[2] = True
-                break
-
-    # Stage 3: financials/ has cost/menu file
-    financials_dir = idea_dir / "financials"
-    if financials_dir.exists():
-        for f in financials_dir.rglob("*"):
-            if f.is_file():
-                fname = f.name.lower()
-                if "원가" in fname or "cost" in fname or "menu" in fname:
-                    completed[3] = True
-                # Stage 4: financials/ has financial/projection file
-                if "재무" in fname or "financial" in fname or "projection" in fname:
-                    completed[4] = True
-
-    # Stages 5-8: reports/ keyword matching
-    reports_dir = idea_dir / "reports"
-    if reports_dir.exists():
-        for f in reports_dir.rglob("*"):
-            if f.is_file():
-                fname = f.name.lower()
-                if "운영" in fname or "operation" in fname:
-                    completed[5] = True
-                if "브랜딩" in fname or "brand" in fname:
-                    completed[6] = True
-                if "법률" in fname or "legal" in fname:
-                    completed[7] = True
-                if "사업계획" in fname or "business-plan" in fname:
-                    completed[8] = True
-
-    return completed
+    return list(scan_idea(idea_dir).stages)
 
 
 def _status_class(status):
@@ -196,12 +148,18 @@ def _build_comparison_row(idea, stages_completed):
                         </tr>"""
 
 
-def generate_html(ideas, output_path):
-    """Generate the HTML dashboard file."""
+def generate_html(ideas, output_path, snapshot=None):
+    """Generate the HTML dashboard file.
+
+    Stage flags come from snapshot (a _portfolio.scan_outputs result the
+    ideas were taken from) when given, else each idea folder is scanned.
+    """
     # Prepare enriched data
+    scanned = {str(idea.path): idea.stages for idea in snapshot.ideas} if snapshot else {}
     enriched = []
     for idea in ideas:
-        stages_completed = check_stage_completion(idea["dir_path"])
+        stages = scanned.get(idea["dir_path"])
+        stages_completed = list(stages) if stages is not None else check_stage_completion(idea["dir_path"])
         enriched.append((idea, stages_completed))
 
     # Count statuses
@@ -713,22 +671,27 @@ def main():
         default=None,
         help="Output directory (default: output/ideas/)",
     )
+    parser.add_argument(
+        "--project-dir",
+        default=None,
+        help="Project root whose output/ is scanned (default: this project)",
+    )
     args = parser.parse_args()
 
-    project_root = find_project_root()
+    project_root = Path(args.project_dir) if args.project_dir else find_project_root()
 
     if args.output_dir:
         output_dir = Path(args.output_dir)
     else:
         output_dir = project_root / "output" / "ideas"
 
-    ideas_dir = project_root / "output" / "ideas"
-    ideas = load_ideas(ideas_dir)
+    snapshot = scan_outputs(project_root / "output")
+    ideas = snapshot.idea_records()
 
     output_path = output_dir / "portfolio-dashboard.html"
 
     try:
-        result_path = generate_html(ideas, output_path)
+        result_path = generate_html(ideas, output_path, snapshot)
         print(result_path)
         sys.exit(0)
     except Exception as e:
@@ -0,0 +1,18 @@
+"""Benchmarks for the skill scripts at portfolio scale.
+
+synthetic.py generates a project whose output/ holds N ideas (idea.json
+v2.0, PSST text, stage files in Korean and English) plus project-level
+reports; run.py times the progress, dashboard, mindmap, matrix and export
+scripts on such projects and writes wall time, peak RSS and files opened as
+JSON for comparison with an earlier run. chart_memory.py checks that
+create_chart.py's ChartRenderer keeps a flat RSS over 1,000 charts.
+
+Run from the repository root:
+
+    python -m benchmarks.run                          (10 / 1,000 / 10,000 ideas)
+    python -m benchmarks.run --sizes 10 1000 -o bench.json
+    python -m benchmarks.run --compare bench.json     (exit 1 on a regression)
+    python -m benchmarks.synthetic /tmp/project --ideas 500 --depth 4
+    python -m benchmarks.run --startup                (chart scripts start without matplotlib)
+    python -m benchmarks.chart_memory                 (exit 1 if RSS grows)
+"""
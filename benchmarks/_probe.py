@@ -0,0 +1,51 @@
+"""Run a script as __main__ and count the files it opens (used by benchmarks.run).
+
+    BENCH_PROBE_OUT=counts.json BENCH_PROBE_ROOT=/project python _probe.py SCRIPT [ARGS...]
+
+An audit hook counts every "open" event (built-in open, os.open, module
+files) and, separately, the opens of paths under BENCH_PROBE_ROOT, i.e.
+the project files the script read or wrote. The counts, and which of
+HEAVY_MODULES the script imported, are written to BENCH_PROBE_OUT as JSON
+when the interpreter exits.
+"""
+
+import atexit
+import json
+import os
+import runpy
+import sys
+
+# Imports the chart scripts defer to their PNG paths (see _raster.py)
+HEAVY_MODULES = ("matplotlib", "numpy")
+
+
+def main():
+    script = os.path.abspath(sys.argv[1])
+    root = os.path.join(os.path.abspath(os.environ.get("BENCH_PROBE_ROOT", os.sep)), "")
+    counts = {"opens_total": 0, "files_opened": 0}
+
+    def hook(event, args):
+        if event != "open":
+            return
+        counts["opens_total"] += 1
+        path = args[0]
+        if isinstance(path, int):
+            return
+        path = os.fsdecode(os.fspath(path))
+        if os.path.abspath(path).startswith(root):
+            counts["files_opened"] += 1
+
+    def report():
+        counts["heavy_modules"] = [name for name in HEAVY_MODULES if name in sys.modules]
+        with open(os.environ["BENCH_PROBE_OUT"], "w", encoding="utf-8") as f:
+            json.dump(counts, f)
+
+    atexit.register(report)
+    sys.addaudithook(hook)
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(script)
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
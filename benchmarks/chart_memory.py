@@ -0,0 +1,110 @@
+"""Memory regression check for create_chart.py's ChartRenderer.
+
+Renders --charts PNG charts (bar, pie and line in turn, with varying label
+counts and some long line series) on one ChartRenderer in this process and
+fails if the resident set size grew by more than --threshold MiB between
+the end of the warm-up and the last chart. The charts overwrite one file
+per type in a temporary directory. Skipped (exit 0) without matplotlib.
+
+    python -m benchmarks.chart_memory [--charts 1000] [--warmup 100] [--threshold 8]
+"""
+
+import argparse
+import gc
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CHART_SCRIPTS_DIR = REPO_ROOT / ".agent" / "skills" / "data-visualizer" / "scripts"
+
+DEFAULT_CHARTS = 1000
+DEFAULT_WARMUP = 100
+DEFAULT_THRESHOLD_MIB = 8.0
+SAMPLES = 10
+
+
+def rss_mib():
+    """Current resident set size in MiB (peak RSS where /proc is not available)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, KiB elsewhere
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 1024
+
+
+def chart_spec(index, directory):
+    """The index-th chart: bar, pie and line in turn, sizes varying with index."""
+    chart_type = ("bar", "pie", "line")[index % 3]
+    count = 3 + index % 9
+    if chart_type == "line" and index % 4 == 2:
+        count = 2000  # long series: downsampled by reduce_line
+    labels = [f"{i + 1}월" for i in range(count)]
+    values = [1000 + (index * 37 + i * 113) % 900 for i in range(count)]
+    return {"type": chart_type, "title": f"차트 {index}", "labels": labels, "values": values,
+            "output": str(Path(directory) / f"chart-{chart_type}.png")}
+
+
+def run(charts=DEFAULT_CHARTS, warmup=DEFAULT_WARMUP, log=None):
+    """Render the charts on one renderer; returns (baseline MiB, samples [(charts, MiB)], seconds)."""
+    sys.path.insert(0, str(CHART_SCRIPTS_DIR))
+    import create_chart
+
+    # Missing Korean glyphs (no Korean font installed) are not what is measured
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+    samples = []
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="bench-charts-") as directory, \
+            create_chart.ChartRenderer() as renderer:
+        baseline = None
+        step = max((charts - warmup) // SAMPLES, 1)
+        for index in range(charts):
+            create_chart.render_chart(chart_spec(index, directory), renderer)
+            done = index + 1
+            if done == warmup or (done > warmup and ((done - warmup) % step == 0 or done == charts)):
+                gc.collect()
+                rss = rss_mib()
+                if baseline is None:
+                    baseline = rss
+                samples.append((done, rss))
+                if log:
+                    log(f"{done:>6} charts  {rss:8.1f} MiB  ({rss - baseline:+.1f})")
+    return baseline, samples, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that ChartRenderer memory stays flat.")
+    parser.add_argument("--charts", type=int, default=DEFAULT_CHARTS,
+                        help=f"Charts to render (default: {DEFAULT_CHARTS})")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help=f"Charts rendered before the baseline is taken (default: {DEFAULT_WARMUP})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_MIB,
+                        help=f"Allowed RSS growth after warm-up in MiB (default: {DEFAULT_THRESHOLD_MIB})")
+    args = parser.parse_args()
+
+    if not 0 < args.warmup < args.charts:
+        parser.error("--warmup must be between 0 and --charts")
+    if importlib.util.find_spec("matplotlib") is None:
+        print("SKIP: matplotlib is not installed")
+        sys.exit(0)
+
+    baseline, samples, seconds = run(args.charts, args.warmup, log=print)
+    growth = max(rss for _, rss in samples) - baseline
+    print(f"{args.charts} charts in {seconds:.1f}s, RSS growth after warm-up {growth:+.1f} MiB "
+          f"(threshold {args.threshold} MiB)")
+    if growth > args.threshold:
+        print("FAIL: ChartRenderer memory grows with the number of charts")
+        sys.exit(1)
+    print("OK")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""Time the skill scripts on synthetic projects.
+
+For every size, a project is generated once under the work directory (and
+reused while its manifest matches), then each script runs in a fresh
+interpreter through _probe.py:
+
+    progress             check_progress.py --portfolio --json
+    outputs_dashboard    create_outputs_dashboard.py
+    portfolio_dashboard  create_portfolio_dashboard.py
+    mindmap              create_mindmap.py
+    matrix               create_impact_effort_matrix.py --chart --format svg
+    export               export_docs.py --batch output -r
+    grid, grid_exact     calculate_costs.py grid monthly --format csv, float
+                         and --exact, on ideas x 100 rows (1M at 10,000 ideas)
+
+Before each run the project is reset to the generated files, so every run
+sees the same tree. Per run the JSON result records wall time, peak RSS of
+the child (from wait4, where the platform has it), files opened under the
+project and all opens, and the exit code; with --repeat the fastest run is
+kept. --compare flags a script whose time, RSS or files opened grew by more
+than --tolerance against an earlier result file.
+
+--startup instead checks the chart scripts' paths that must not load
+matplotlib or NumPy (see _raster.py): create_chart.py --help and an argument
+error, and the ASCII output of create_idea_score_chart.py and
+create_impact_effort_matrix.py. It fails (exit 1) when one of them imports
+either module or, at its fastest of --repeat runs, exceeds --budget seconds.
+
+    python -m benchmarks.run [--sizes 10 1000 10000] [-o results.json]
+                             [--compare baseline.json] [--only progress mindmap]
+    python -m benchmarks.run --startup [--budget 0.3] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks import synthetic
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / ".agent" / "skills"
+PROBE = Path(__file__).resolve().parent / "_probe.py"
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (10, 1000, 10000)
+# Metrics compared by --compare (higher is worse)
+METRICS = ("wall_s", "peak_rss_kb", "files_opened")
+# Wall time allowed for a --startup case (an interpreter start alone is ~0.02-0.05 s;
+# importing matplotlib adds 0.5-1 s)
+DEFAULT_STARTUP_BUDGET = 0.3
+
+
+def grid_args(root, exact=False):
+    """calculate_costs.py grid monthly arguments: ideas x 100 rows, written under output/."""
+    ideas = synthetic.load_manifest(root)["ideas"]
+    args = ["grid", "monthly", "--revenue", f"10000:{ideas * 10000}:10000",
+            "--fixed", "1000000:10000000:1000000", "--variable-rate", "0.05:0.5:0.05",
+            "--format", "csv", "--output", str(root / "output" / "grid.csv")]
+    return args + ["--exact"] if exact else args
+
+
+# name: (script, function(project root) -> argument list)
+CASES = {
+    "progress": (
+        SKILLS_DIR / "progress-tracker" / "scripts" / "check_progress.py",
+        lambda root: ["--dir", str(root), "--portfolio", "--json"],
+    ),
+    "outputs_dashboard": (
+        SKILLS_DIR / "scripts" / "create_outputs_dashboard.py",
+        lambda root: ["--output-dir", str(root / "output")],
+    ),
+    "portfolio_dashboard": (
+        SKILLS_DIR / "scripts" / "create_portfolio_dashboard.py",
+        lambda root: ["--project-dir", str(root)],
+    ),
+    "mindmap": (
+        SKILLS_DIR / "scripts" / "create_mindmap.py",
+        lambda root: ["--dir", str(root / "output" / "ideas")],
+    ),
+    "matrix": (
+        SKILLS_DIR / "scripts" / "create_impact_effort_matrix.py",
+        lambda root: ["--dir", str(root / "output" / "ideas"), "--chart", "--format", "svg",
+                      "--output", str(root / "output" / "ideas" / "impact-effort-matrix.svg")],
+    ),
+    "export": (
+        SKILLS_DIR / "document-exporter" / "scripts" / "export_docs.py",
+        lambda root: ["--batch", str(root / "output"), "--recursive"],
+    ),
+    "grid": (
+        SKILLS_DIR / "financial-analyst" / "scripts" / "calculate_costs.py",
+        grid_args,
+    ),
+    "grid_exact": (
+        SKILLS_DIR / "financial-analyst" / "scripts" / "calculate_costs.py",
+        lambda root: grid_args(root, exact=True),
+    ),
+}
+
+
+# --startup cases: name: (script, arguments, expected exit code); run in an empty directory
+STARTUP_CASES = {
+    "chart_help": (SKILLS_DIR / "data-visualizer" / "scripts" / "create_chart.py", ["--help"], 0),
+    "chart_bad_args": (SKILLS_DIR / "data-visualizer" / "scripts" / "create_chart.py",
+                       ["bar", "--title", "매출"], 2),
+    "score_ascii": (SKILLS_DIR / "scripts" / "create_idea_score_chart.py",
+                    ["--name", "AI 재고관리", "--scores", "4,3,5,4,3"], 0),
+    "matrix_ascii": (SKILLS_DIR / "scripts" / "create_impact_effort_matrix.py",
+                     ["--name", "AI 재고관리", "--scores", "3.5,2.1"], 0),
+}
+
+
+def prepare_project(work_dir, ideas, depth, seed, paragraphs):
+    """Project directory for this size, generated unless an identical one exists."""
+    root = Path(work_dir) / f"ideas-{ideas}"
+    manifest = synthetic.load_manifest(root)
+    wanted = {"ideas": ideas, "depth": depth, "seed": seed, "paragraphs": paragraphs}
+    if manifest is None or any(manifest.get(key) != value for key, value in wanted.items()):
+        shutil.rmtree(root, ignore_errors=True)
+        manifest = synthetic.generate_project(root, ideas, depth, seed, paragraphs)
+    return root, manifest
+
+
+def _wait(proc, timeout):
+    """(returncode, peak RSS in KiB or None) of a finished child."""
+    if not hasattr(os, "wait4"):
+        return proc.wait(timeout=timeout), None
+    deadline = time.monotonic() + timeout
+    while True:
+        pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+        if pid:
+            break
+        if time.monotonic() > deadline:
+            proc.kill()
+            pid, status, usage = os.wait4(proc.pid, 0)
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        time.sleep(0.005)
+    proc.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, "waitstatus_to_exitcode") \
+        else (status >> 8)
+    # ru_maxrss is bytes on macOS, KiB elsewhere
+    rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return proc.returncode, rss
+
+
+def run_case(name, root, timeout):
+    """One timed run of a case on a project; returns its result dict."""
+    script, make_args = CASES[name]
+    return run_script(name, script, make_args(root), root, timeout)
+
+
+def run_script(name, script, script_args, root, timeout):
+    """Run script through _probe.py with root as working directory; returns the result dict."""
+    fd, counts_path = tempfile.mkstemp(suffix=".json", prefix="bench-probe-")
+    os.close(fd)
+    env = dict(os.environ, BENCH_PROBE_OUT=counts_path, BENCH_PROBE_ROOT=str(root),
+               MPLBACKEND="Agg", PYTHONIOENCODING="utf-8")
+    command = [sys.executable, str(PROBE), str(script)] + list(script_args)
+    result = {"case": name}
+    # Output goes to a file: a pipe could fill up while wait4 is polled
+    with tempfile.TemporaryFile() as log_file:
+        try:
+            return _run_case(result, command, root, env, counts_path, log_file, timeout)
+        finally:
+            os.remove(counts_path)
+
+
+def _run_case(result, command, root, env, counts_path, log_file, timeout):
+    """Start command, wait for it and fill in result."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(command, cwd=str(root), env=env,
+                            stdout=log_file, stderr=subprocess.STDOUT)
+    try:
+        returncode, rss = _wait(proc, timeout)
+    except subprocess.TimeoutExpired:
+        result.update(wall_s=None, error=f"timed out after {timeout}s")
+        return result
+    result["wall_s"] = round(time.perf_counter() - start, 4)
+    result["peak_rss_kb"] = rss
+    result["returncode"] = returncode
+    if returncode != 0:
+        # The scripts print their errors to stdout or stderr; keep the last line
+        log_file.seek(0)
+        lines = log_file.read().decode("utf-8", "replace").strip().splitlines()
+        result["error"] = lines[-1].strip() if lines else f"exit {returncode}"
+    try:
+        with open(counts_path, "r", encoding="utf-8") as f:
+            result.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return result
+
+
+def run_benchmarks(sizes, cases, work_dir, depth=synthetic.MAX_DEPTH, seed=0, paragraphs=3,
+                   repeat=1, timeout=600, log=None):
+    """Run every case on every size; returns the results document."""
+    results = []
+    for ideas in sizes:
+        start = time.perf_counter()
+        root, manifest = prepare_project(work_dir, ideas, depth, seed, paragraphs)
+        if log:
+            log(f"{ideas} ideas: {len(manifest['files'])} files "
+                f"({time.perf_counter() - start:.1f}s to prepare)")
+        for name in cases:
+            best = None
+            for _ in range(repeat):
+                synthetic.reset_project(root, manifest)
+                result = run_case(name, root, timeout)
+                if best is None or (result.get("wall_s") is not None
+                                    and (best.get("wall_s") is None
+                                         or result["wall_s"] < best["wall_s"])):
+                    best = result
+            synthetic.reset_project(root, manifest)
+            best.update(ideas=ideas, files=len(manifest["files"]))
+            results.append(best)
+            if log:
+                log("  " + format_result(best))
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "depth": depth,
+        "seed": seed,
+        "paragraphs": paragraphs,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def run_startup(budget=DEFAULT_STARTUP_BUDGET, repeat=3, timeout=60, log=None):
+    """Run the STARTUP_CASES; returns (results, failures).
+
+    Each result is the fastest of `repeat` runs. A case fails when it exits
+    with another code than expected, loaded a module of
+    _probe.HEAVY_MODULES or its wall time exceeds budget.
+    """
+    results, failures = [], []
+    with tempfile.TemporaryDirectory(prefix="bench-startup-") as root:
+        for name, (script, script_args, expected) in STARTUP_CASES.items():
+            runs = [run_script(name, script, script_args, Path(root), timeout) for _ in range(repeat)]
+            timed = [r for r in runs if r.get("wall_s") is not None]
+            best = min(timed, key=lambda r: r["wall_s"]) if timed else runs[0]
+            # A heavy import in any run counts, not only in the fastest one
+            heavy = sorted({m for r in runs for m in r.get("heavy_modules", [])})
+            best["heavy_modules"] = heavy
+            results.append(best)
+            if best.get("wall_s") is None:
+                failures.append(f"{name}: {best.get('error', 'failed')}")
+            elif best["returncode"] != expected:
+                failures.append(f"{name}: exit {best['returncode']} (expected {expected}): "
+                                f"{best.get('error', '')}")
+            elif heavy:
+                failures.append(f"{name}: imported {', '.join(heavy)}")
+            elif best["wall_s"] > budget:
+                failures.append(f"{name}: {best['wall_s']:.3f}s exceeds the {budget}s budget")
+            if log:
+                wall = "-" if best.get("wall_s") is None else f"{best['wall_s']:.3f}s"
+                log(f"  {name:<20} {wall:>9}  exit {best.get('returncode')}"
+                    f"  heavy imports: {', '.join(heavy) or 'none'}")
+    return results, failures
+
+
+def format_result(result):
+    """One console line for a result."""
+    if result.get("wall_s") is None:
+        return f"{result['case']:<20} {result.get('error', 'failed')}"
+    rss = result.get("peak_rss_kb")
+    line = (f"{result['case']:<20} {result['wall_s']:>9.3f}s"
+            f"  {'-' if rss is None else f'{rss / 1024:,.1f}'} MiB"
+            f"  {result.get('files_opened', '-')} files opened")
+    if result.get("returncode"):
+        line += f"  (exit {result['returncode']}: {result.get('error', '')})"
+    return line
+
+
+def compare(current, baseline, tolerance):
+    """Regressions of current against baseline as (ideas, case, metric, old, new) tuples.
+
+    A metric regresses when it grew by more than tolerance (0.2 = 20%);
+    results missing from either side or from a failed run are skipped.
+    """
+    old = {(r["ideas"], r["case"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        before = old.get((result["ideas"], result["case"]))
+        if before is None or before.get("returncode") or result.get("returncode"):
+            continue
+        for metric in METRICS:
+            a, b = before.get(metric), result.get(metric)
+            if a is None or b is None:
+                continue
+            if b > a * (1 + tolerance) and b - a > (0.05 if metric == "wall_s" else 0):
+                regressions.append((result["ideas"], result["case"], metric, a, b))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skill scripts on synthetic projects.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Idea counts (default: 10 1000 10000)")
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), default=None,
+                        help="Run only these scripts")
+    parser.add_argument("--depth", type=int, default=synthetic.MAX_DEPTH,
+                        help=f"Highest stage an idea can reach (default: {synthetic.MAX_DEPTH})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--paragraphs", type=int, default=3,
+                        help="Sections per generated report (default: 3)")
+    parser.add_argument("--repeat", type=int, default=None,
+                        help="Runs per script and size; the fastest is kept (default: 1, 3 with --startup)")
+    parser.add_argument("--timeout", type=float, default=600,
+                        help="Seconds before a run is killed (default: 600)")
+    parser.add_argument("--work-dir", default=None,
+                        help="Where generated projects are kept and reused (default: a temp dir, removed)")
+    parser.add_argument("-o", "--output", default=None, help="Write the results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", default=None,
+                        help="Earlier results JSON; exit 1 if a metric regressed")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed growth for --compare (default: 0.2 = 20%%)")
+    parser.add_argument("--startup", action="store_true",
+                        help="Check the chart scripts' startup paths instead (exit 1 on failure)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_STARTUP_BUDGET,
+                        help=f"Seconds allowed per --startup case (default: {DEFAULT_STARTUP_BUDGET})")
+    args = parser.parse_args()
+
+    if args.repeat is None:
+        args.repeat = 3 if args.startup else 1
+    if args.repeat < 1 or not 0 <= args.depth <= synthetic.MAX_DEPTH:
+        parser.error(f"--repeat must be >= 1 and --depth 0-{synthetic.MAX_DEPTH}")
+    if args.startup:
+        results, failures = run_startup(args.budget, args.repeat, log=print)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"version": RESULTS_VERSION, "python": platform.python_version(),
+                           "budget": args.budget, "results": results}, f, ensure_ascii=False, indent=2)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"Startup OK (budget {args.budget}s, no matplotlib/NumPy)")
+        sys.exit(0)
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot read {args.compare}: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    cases = args.only or list(CASES)
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="antigravity-bench-")
+    try:
+        document = run_benchmarks(args.sizes, cases, work_dir, args.depth, args.seed,
+                                  args.paragraphs, args.repeat, args.timeout, log=print)
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+        print(f"Results: {args.output}")
+
+    if baseline is not None:
+        regressions = compare(document, baseline, args.tolerance)
+        for ideas, case, metric, old, new in regressions:
+            print(f"REGRESSION {ideas} ideas / {case} / {metric}: {old} -> {new}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.compare} (tolerance {args.tolerance:.0%})")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
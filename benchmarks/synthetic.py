@@ -0,0 +1,251 @@
+"""Synthetic project generator for the benchmarks.
+
+generate_project() writes <root>/output/ as the workflows would leave it
+after many ideas:
+
+    output/ideas/idea-NNN-<name>/
+        idea.json                      v2.0 fields (judgment, score_details with
+                                       founder_fit, psst_mapping, kill_switch, ...)
+        hypothesis.md, evaluation.md, existing-alternatives.md
+        research/ financials/ reports/ one file per stage reached (1-8), named
+                                       with the Korean or English stage keyword
+    output/ideas/selected-idea.md      legacy stage 0
+    output/{research,financials,reports,presentations}/
+                                       project-level reports, one with a
+                                       ```chart block reading a CSV
+
+Each idea reaches a random stage between 0 and depth. The output is fully
+determined by (ideas, depth, seed, paragraphs), and the list of generated
+files is kept in <root>/synthetic.json (outside output/, so the scripts do
+not see it). The runner uses that list to remove what a benchmarked script
+wrote.
+
+    python -m benchmarks.synthetic DIR --ideas 1000 [--depth 8] [--seed 0]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+MANIFEST_FILE = "synthetic.json"
+MANIFEST_VERSION = 1
+MAX_DEPTH = 8
+
+# Stage id: (folder, (English name, Korean name)); names carry the stage keywords
+STAGE_FILES = {
+    1: ("research", ("market-analysis.md", "시장분석.md")),
+    2: ("research", ("competitor-analysis.md", "경쟁분석.md")),
+    3: ("financials", ("cost-structure.md", "원가계산.md")),
+    4: ("financials", ("financial-projection.md", "재무계획.md")),
+    5: ("reports", ("operation-plan.md", "운영계획.md")),
+    6: ("reports", ("brand-strategy.md", "브랜딩전략.md")),
+    7: ("reports", ("legal-checklist.md", "인허가체크리스트.md")),
+    8: ("reports", ("business-plan.md", "사업계획서.md")),
+}
+STAGE_TITLES = {
+    1: "시장 분석", 2: "경쟁 분석", 3: "원가 구조", 4: "재무 계획",
+    5: "운영 계획", 6: "브랜딩 전략", 7: "법률/인허가 체크리스트", 8: "사업계획서",
+}
+
+# Idea names and PSST text are combined from these pools, so ideas share
+# keywords the way related real ideas do (create_mindmap links them by those)
+NAMES = ("카페", "밀키트", "반려동물", "공유오피스", "코딩교육", "중고거래", "세탁", "헬스케어",
+         "꽃배달", "캠핑", "수제맥주", "웨딩", "노인돌봄", "전기차충전", "로컬여행", "비건베이커리")
+TARGETS = ("소상공인", "1인 가구", "직장인", "자영업자", "대학생", "시니어", "프리랜서", "육아 가정")
+PAINS = ("재고 관리 비효율", "높은 고정비", "예약 관리 누락", "고객 이탈", "가격 비교 어려움",
+         "정보 비대칭", "반복 업무 과다", "마케팅 채널 부족")
+METHODS = ("AI 기반", "구독형", "모바일", "데이터 기반", "커뮤니티 중심", "자동화", "O2O", "B2B")
+PRODUCTS = ("자동 발주 시스템", "예약 플랫폼", "추천 서비스", "관리 대시보드", "정기 배송",
+            "매칭 앱", "교육 프로그램", "결제 솔루션")
+SCALES = ("국내 요식업 50만 매장", "수도권 1인 가구 300만", "전국 자영업자 600만",
+          "연 2조원 규모 시장", "연평균 15% 성장 시장")
+TEAMS = ("업계 10년 경력 + IT 개발 파트너", "창업자 1인 + 외주 개발", "공동창업자 2인 (기획/개발)",
+         "현업 전문가 3인")
+ALTERNATIVES = ("직접 수기 관리", "엑셀 스프레드시트", "기존 대형 플랫폼", "오프라인 중개", "지인 추천")
+JUDGMENTS = ("go", "pivot-optimize", "pivot-review", "drop")
+SENTENCES = (
+    "목표 고객은 {target}이며 가장 큰 불편은 {pain}입니다.",
+    "{method} {product}로 기존 대안 대비 비용을 30% 절감할 수 있습니다.",
+    "초기 시장은 {scale}을 기준으로 추정합니다.",
+    "경쟁사는 가격과 접근성에서 강점이 있으나 고객 경험은 취약합니다.",
+    "Customer acquisition relies on local partnerships and referral programs.",
+    "월 고정비는 임대료, 인건비, 소프트웨어 구독료로 구성됩니다.",
+    "The break-even point is expected within 14 months of launch.",
+    "인허가 요건과 개인정보 처리 방침을 출시 전에 점검해야 합니다.",
+)
+
+
+def _score(details):
+    """idea.json score: market×5 + competition×4 + founder_fit×5 + resources×3 + timing×3."""
+    return (details["market_size"] * 5 + details["competition"] * 4 + details["founder_fit"] * 5
+            + details["resources"] * 3 + details["timing"] * 3)
+
+
+def _idea_data(rng, number):
+    """(idea.json data, PSST words for its reports)."""
+    name = rng.choice(NAMES)
+    words = {"target": rng.choice(TARGETS), "pain": rng.choice(PAINS),
+             "method": rng.choice(METHODS), "product": rng.choice(PRODUCTS)}
+    target, pain, method, product = words["target"], words["pain"], words["method"], words["product"]
+    details = {key: rng.randint(1, 5)
+               for key in ("market_size", "competition", "founder_fit", "resources", "timing")}
+    judgment = rng.choice(JUDGMENTS)
+    return {
+        "id": f"idea-{number:03d}",
+        "name": name,
+        "full_name": f"{target} 대상 {method} {name} {product}",
+        "created": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "status": "pivot" if judgment.startswith("pivot") else judgment,
+        "judgment": judgment,
+        "score": _score(details),
+        "score_details": details,
+        "current_alternatives": rng.sample(ALTERNATIVES, 2),
+        "founder_fit_reason": f"{name} 업계 {rng.randint(1, 20)}년 경력",
+        "psst_mapping": {
+            "problem": f"{target} {pain}",
+            "solution": f"{method} {product}",
+            "scale": rng.choice(SCALES),
+            "team": rng.choice(TEAMS),
+        },
+        "kill_switch": {"triggered": judgment == "drop", "items": []},
+        "workflow_version": "2.0",
+    }, words
+
+
+def _document(rng, title, paragraphs, words=None):
+    """Markdown report: title, metadata lines, paragraphs and a small table."""
+    words = words or {}
+    fill = {
+        "target": words.get("target", rng.choice(TARGETS)),
+        "pain": words.get("pain", rng.choice(PAINS)),
+        "method": words.get("method", rng.choice(METHODS)),
+        "product": words.get("product", rng.choice(PRODUCTS)),
+        "scale": rng.choice(SCALES),
+    }
+    lines = [f"# {title}", "", "작성일: 2026-01-15", "작성자: Antigravity", "버전: 1.0", ""]
+    for index in range(paragraphs):
+        lines += [f"## {index + 1}. 분석", "",
+                  " ".join(rng.choice(SENTENCES).format(**fill) for _ in range(4)), ""]
+    lines += ["| 항목 | 값 | 비고 |", "|------|----|------|"]
+    lines += [f"| 항목 {i} | {rng.randint(10, 9999):,} | - |" for i in range(1, 6)]
+    return "\n".join(lines) + "\n"
+
+
+def generate_project(root, ideas, depth=MAX_DEPTH, seed=0, paragraphs=3):
+    """Write a synthetic output/ tree under root.
+
+    Args:
+        root: project directory (created; output/ must not exist yet)
+        ideas: number of idea folders
+        depth: highest stage (0-8) an idea can reach
+        seed: random seed (same arguments, same files)
+        paragraphs: sections per generated Markdown report
+
+    Returns:
+        the manifest written to <root>/synthetic.json
+    """
+    if not 0 <= depth <= MAX_DEPTH:
+        raise ValueError(f"depth must be 0-{MAX_DEPTH}")
+    root = Path(root)
+    if (root / "output").exists():
+        raise FileExistsError(f"{root / 'output'} already exists")
+    rng = random.Random(seed)
+    files = []
+
+    def write(rel, text):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        files.append(rel)
+
+    for number in range(1, ideas + 1):
+        data, words = _idea_data(rng, number)
+        folder = f"output/ideas/{data['id']}-{data['name']}"
+        write(f"{folder}/idea.json", json.dumps(data, ensure_ascii=False, indent=2))
+        write(f"{folder}/hypothesis.md", _document(rng, f"{data['full_name']} 가설", 1, words))
+        write(f"{folder}/evaluation.md", _document(rng, "Go/Pivot/Drop 평가", 1, words))
+        write(f"{folder}/existing-alternatives.md", _document(rng, "기존 대안", 1, words))
+        for stage in range(1, rng.randint(0, depth) + 1):
+            sub, names = STAGE_FILES[stage]
+            name = rng.choice(names)
+            write(f"{folder}/{sub}/{name}", _document(rng, STAGE_TITLES[stage], paragraphs, words))
+            if stage == 3:
+                write(f"{folder}/{sub}/menu-costing.csv",
+                      "item,cost,price\n" + "".join(f"메뉴{i},{rng.randint(1000, 5000)},"
+                                                    f"{rng.randint(5000, 15000)}\n" for i in range(10)))
+        if rng.random() < 0.2:
+            write(f"{folder}/research/raw-notes.md", _document(rng, "메모", 1, words))
+
+    if ideas:
+        write("output/ideas/selected-idea.md", _document(rng, "선정 아이디어", 1))
+    for stage in range(1, depth + 1):
+        sub, names = STAGE_FILES[stage]
+        text = _document(rng, STAGE_TITLES[stage], paragraphs)
+        if stage == 4:
+            text += "\n## 월별 매출\n\n```chart\ntype: bar\ntitle: 월별 매출\ncsv: sales.csv\n```\n"
+            write(f"output/{sub}/sales.csv", "label,value\n" + "".join(
+                f"{month}월,{rng.randint(500, 3000)}\n" for month in range(1, 13)))
+        write(f"output/{sub}/{names[0]}", text)
+    if depth >= MAX_DEPTH:
+        write("output/presentations/pitch-deck.md", _document(rng, "피치덱", paragraphs))
+
+    manifest = {"version": MANIFEST_VERSION, "ideas": ideas, "depth": depth, "seed": seed,
+                "paragraphs": paragraphs, "files": files}
+    with open(root / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return manifest
+
+
+def load_manifest(root):
+    """The manifest of a generated project, or None if there is none."""
+    try:
+        with open(Path(root) / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def reset_project(root, manifest):
+    """Delete files and folders under output/ that generate_project did not write.
+
+    Returns the number of files removed.
+    """
+    root = Path(root)
+    keep = {os.path.normpath(rel) for rel in manifest["files"]}
+    removed = 0
+    for dirpath, dirnames, filenames in os.walk(root / "output", topdown=False):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.relpath(path, root) not in keep:
+                os.remove(path)
+                removed += 1
+        if not os.listdir(dirpath) and dirpath != str(root / "output"):
+            os.rmdir(dirpath)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic project for the benchmarks.")
+    parser.add_argument("root", help="Project directory to create (its output/ must not exist)")
+    parser.add_argument("--ideas", type=int, default=100, help="Number of ideas (default: 100)")
+    parser.add_argument("--depth", type=int, default=MAX_DEPTH,
+                        help=f"Highest stage an idea can reach, 0-{MAX_DEPTH} (default: {MAX_DEPTH})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--paragraphs", type=int, default=3,
+                        help="Sections per generated report (default: 3)")
+    args = parser.parse_args()
+
+    try:
+        manifest = generate_project(args.root, args.ideas, args.depth, args.seed, args.paragraphs)
+    except (ValueError, FileExistsError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"{args.root}: {manifest['ideas']} ideas, {len(manifest['files'])} files")
+
+
+if __name__ == "__main__":
+    main()